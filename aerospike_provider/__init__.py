@@ -26,5 +26,29 @@ def get_provider_info() -> Dict[str, Any]:
         "package-name": "airflow-provider-aerospike",
         "name": "Aerospike Provider",
         "description": "A Aerospike provider for Apache Airflow.",
-        "hook-class-names": ["aerospike_provider.hooks.aerospike.AerospikeHook"]
+        "hook-class-names": ["aerospike_provider.hooks.aerospike.AerospikeHook"],
+        "triggers": [
+            {"integration-name": "Aerospike", "python-modules": ["aerospike_provider.triggers.aerospike"]}
+        ],
+        "config": {
+            "aerospike": {
+                "description": "Options for the Aerospike provider.",
+                "options": {
+                    "client_idle_timeout": {
+                        "description": "Seconds an unused pooled Aerospike client is kept connected before it is closed.",
+                        "version_added": None,
+                        "type": "float",
+                        "example": None,
+                        "default": "300",
+                    },
+                    "metrics_summary": {
+                        "description": "Log a per-method latency summary of the Aerospike calls when a hook is exited.",
+                        "version_added": None,
+                        "type": "boolean",
+                        "example": None,
+                        "default": "False",
+                    },
+                },
+            },
+        },
     }
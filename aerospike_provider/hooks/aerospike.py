@@ -18,14 +18,103 @@
 
 """This module allows to connect to a Aerospike database."""
 
-from typing import Tuple, overload, List, Union, Dict, Optional
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Tuple, overload, List, Union, Dict, Optional
 from types import TracebackType
 
 from airflow.hooks.base import BaseHook
 from airflow.exceptions import AirflowException
 
-import aerospike
-from aerospike import Client
+if TYPE_CHECKING:
+    from aerospike import Client
+    from aerospike_helpers.batch.records import BatchRecords
+
+from aerospike_provider.utils.batching import chunked, hedged, imap_bounded, run_chunked
+from aerospike_provider.utils.client_pool import get_client_pool
+from aerospike_provider.utils.content_hash import (
+    DEFAULT_HASH_BIN,
+    FILTERED_OUT_CODE,
+    changed_expression,
+    content_hash,
+    skip_ratio,
+)
+from aerospike_provider.utils.executor import get_async_executor
+from aerospike_provider.utils.metrics import HookMetrics
+from aerospike_provider.utils.partitions import parse_replicas, partition_ranges, shard_keys
+from aerospike_provider.utils.rate_limit import OVERLOAD_CODES, get_rate_limiter
+from aerospike_provider.utils.retry import is_transient
+from aerospike_provider.utils.timestamps import to_nanoseconds
+
+
+def _int_list(value: Any) -> List[int]:
+    """Parse a list of ints given as a list, a single int or a comma separated string (e.g. ``"1,2"``)."""
+    if isinstance(value, str):
+        value = value.split(",")
+    elif not isinstance(value, (list, tuple)):
+        value = [value]
+    return [int(v) for v in value if str(v).strip()]
+
+
+# Client config options that can be set in the connection extras, with their type.
+CLIENT_CONFIG_EXTRAS: Dict[str, Callable[[Any], Any]] = {
+    "max_conns_per_node": int,
+    "min_conns_per_node": int,
+    "max_socket_idle": int,
+    "tend_interval": int,
+    "connect_timeout": int,
+    "login_timeout_ms": int,
+    "max_error_rate": int,
+    "error_rate_window": int,
+    "rack_id": int,
+    "rack_ids": _int_list,
+    "rack_aware": lambda value: str(value).lower() in ("true", "1"),
+    "use_services_alternate": lambda value: str(value).lower() in ("true", "1"),
+    "cluster_name": str,
+}
+
+# Connection extras holding a default policy, and the client config policy they set.
+POLICY_EXTRAS = {
+    "read_policy": "read",
+    "write_policy": "write",
+    "batch_policy": "batch",
+    "batch_write_policy": "batch_write",
+    "operate_policy": "operate",
+    "remove_policy": "remove",
+    "query_policy": "query",
+    "scan_policy": "scan",
+}
+
+# Timeout extras applied to the default policies of single record and batch calls.
+TIMEOUT_EXTRAS = ("total_timeout", "socket_timeout", "max_retries", "sleep_between_retries")
+TIMEOUT_POLICIES = ("read", "write", "batch", "operate", "remove")
+
+# Values of `aerospike.POLICY_REPLICA_*`, the replica read policy applied to the read and batch policies.
+REPLICA_POLICIES = {"master": 0, "any": 1, "sequence": 2, "prefer_rack": 3}
+
+# Result code of a missing record: AEROSPIKE_ERR_RECORD_NOT_FOUND.
+RECORD_NOT_FOUND_CODE = 2
+
+
+def default_key_policy(policy: Optional[dict], key_policy: str) -> dict:
+    """
+    Return ``policy``, or `{"key": aerospike.<key_policy>}` when it is None.
+
+    Operators default their policy to None and resolve it when executed, so parsing a DAG file that
+    instantiates them does not load the client C extension.
+    """
+    if policy is not None:
+        return policy
+    import aerospike
+
+    return {"key": getattr(aerospike, key_policy)}
 
 
 class AerospikeHook(BaseHook):
@@ -37,6 +126,17 @@ class AerospikeHook(BaseHook):
     .. note:: Please call this Hook as context manager via `with`
     to automatically open and close the connection to the Aerospike cluster.
 
+    Clients are taken from a process-wide pool (see :mod:`aerospike_provider.utils.client_pool`),
+    so repeated hooks on the same worker reuse one warm client instead of reconnecting.
+
+    Every call emits StatsD metrics through Airflow's ``Stats`` (see :mod:`aerospike_provider.utils.metrics`).
+    With the ``[aerospike] metrics_summary`` option a latency summary is logged when the hook is exited.
+
+    Writes go through the rate limiter of the connection (see :mod:`aerospike_provider.utils.rate_limit`):
+    when the server answers that it is overloaded, the hooks of the connection slow down and the rejected
+    records are sent again. The ``max_write_rate`` (records per second) and ``write_overload_retries``
+    connection extras configure it.
+
     :param aerospike_conn_id: Reference to :ref:`Aerospike connection id`.
     """
 
@@ -50,6 +150,9 @@ class AerospikeHook(BaseHook):
         self.aerospike_conn_id = aerospike_conn_id
         self.connection = kwargs.pop("connection", None)
         self.client: Client = None
+        self._client_config: Optional[Dict] = None
+        self.metrics = HookMetrics(aerospike_conn_id)
+        self.rate_limiter = get_rate_limiter(aerospike_conn_id)
 
     def __enter__(self) -> Client:
         return self.get_conn()
@@ -60,71 +163,902 @@ class AerospikeHook(BaseHook):
         exc_val: Union[BaseException, None],
         exc_tb: Union[TracebackType, None]
         ) -> None:
+        if self.metrics.summary:
+            self.metrics.log_summary(self.log)
+        self.close()
+
+    def close(self) -> None:
+        """Release the client back to the pool."""
         if self.client is not None:
-            self.client.close()
+            get_client_pool().release(self.aerospike_conn_id, self._client_config)
             self.client = None
+            self._client_config = None
 
 
     def get_conn(self) -> Client:
         """
-        A method that initiates a new Aerospike connection.
+        A method that acquires an Aerospike client for the connection from the client pool.
         """
         if self.client is not None:
-            return self.client
+            return self
 
-        self.connection = self.get_connection(self.aerospike_conn_id)
+        with self.metrics.call("get_conn"):
+            self.connection = self.get_connection(self.aerospike_conn_id)
 
-        config = {'hosts': [ (self.connection.host, self.connection.port) ]}
-        self.log.info('Hosts: %s', config['hosts'][0])
+            config = self.build_client_config(self.connection.host, self.connection.port, self.connection.extra_dejson)
+            self.log.info('Hosts: %s', ', '.join(f'{host}:{port}' for host, port in config['hosts']))
 
-        self.client = aerospike.client(config).connect()
+            # Configured before acquiring the client, so an invalid extra does not leak a pool reference.
+            extras = self.connection.extra_dejson
+            self.rate_limiter.configure(
+                max_rate=float(extras["max_write_rate"]) if extras.get("max_write_rate") else None,
+                max_retries=int(extras["write_overload_retries"]) if extras.get("write_overload_retries") is not None else None,
+            )
+            self.client = get_client_pool().acquire(self.aerospike_conn_id, config)
+            self._client_config = config
         return self
 
 
+    @staticmethod
+    def build_client_config(host: Optional[str], port: Optional[int], extras: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the client config of a connection.
+
+        ``extras`` can hold:
+
+        * ``hosts``: more seed hosts, as a list or a comma separated string of ``host[:port]``
+        * client options: ``max_conns_per_node``, ``min_conns_per_node``, ``max_socket_idle``, ``tend_interval``,
+          ``connect_timeout``, ``login_timeout_ms``, ``max_error_rate``, ``error_rate_window``, ``cluster_name``,
+          ``use_services_alternate``, ``rack_aware``, ``rack_id``, ``rack_ids``
+        * ``replica``: replica read policy of the reads and batches: ``master``, ``any``, ``sequence`` or
+          ``prefer_rack`` (the default with ``rack_aware``)
+        * ``total_timeout``, ``socket_timeout``, ``max_retries``, ``sleep_between_retries``: defaults of the
+          read, write, batch, operate and remove policies
+        * ``read_policy``, ``write_policy``, ``batch_policy``, ``batch_write_policy``, ``operate_policy``,
+          ``remove_policy``, ``query_policy``, ``scan_policy``: default policies, e.g. `{"read_policy": {"total_timeout": 50}}`
+
+        The client merges the policy of every call over these defaults, so operators get them without repeating them.
+        """
+        default_port = int(port or 3000)
+        seeds = [host] if host else []
+        extra_hosts = extras.get("hosts") or []
+        if isinstance(extra_hosts, str):
+            extra_hosts = extra_hosts.split(",")
+        seeds.extend(h.strip() for h in extra_hosts if h.strip())
+        hosts = []
+        for seed in seeds:
+            seed_host, _, seed_port = seed.partition(":")
+            entry = (seed_host, int(seed_port) if seed_port else default_port)
+            if entry not in hosts:
+                hosts.append(entry)
+        if not hosts:
+            raise AirflowException("The connection should have a host or 'hosts' in its extras")
+
+        config: Dict[str, Any] = {'hosts': hosts}
+        for name, convert in CLIENT_CONFIG_EXTRAS.items():
+            if extras.get(name) not in (None, ""):
+                config[name] = convert(extras[name])
+
+        policies: Dict[str, Dict[str, Any]] = {}
+        for name in TIMEOUT_EXTRAS:
+            if extras.get(name) not in (None, ""):
+                for policy_name in TIMEOUT_POLICIES:
+                    policies.setdefault(policy_name, {})[name] = int(extras[name])
+        replica = extras.get("replica") or ("prefer_rack" if config.get("rack_aware") else None)
+        if replica is not None:
+            if isinstance(replica, str) and not replica.isdigit():
+                if replica not in REPLICA_POLICIES:
+                    raise AirflowException(f"Expecting 'replica' to be one of {list(REPLICA_POLICIES)}, got: {replica}")
+                replica = REPLICA_POLICIES[replica]
+            for policy_name in ("read", "batch"):
+                policies.setdefault(policy_name, {})["replica"] = int(replica)
+        for extra_name, policy_name in POLICY_EXTRAS.items():
+            policy = extras.get(extra_name)
+            if isinstance(policy, str):
+                policy = json.loads(policy)
+            if policy:
+                policies.setdefault(policy_name, {}).update(policy)
+        if policies:
+            config['policies'] = policies
+        return config
+
+
     @overload
-    def exists(self, namespace: str, set: str, key: List[str], policy: dict) -> list: ...
+    def exists(
+        self,
+        namespace: str,
+        set: str,
+        key: List[str],
+        policy: dict,
+        chunk_size: int = ...,
+        max_concurrency: int = ...,
+        chunk_retries: int = ...,
+        retry_backoff: float = ...,
+        hedge_after: Optional[float] = ...,
+    ) -> list: ...
 
 
     @overload
-    def exists(self, namespace: str, set: str, key: str, policy: dict) -> tuple: ...
+    def exists(
+        self,
+        namespace: str,
+        set: str,
+        key: str,
+        policy: dict,
+        chunk_size: int = ...,
+        max_concurrency: int = ...,
+        chunk_retries: int = ...,
+        retry_backoff: float = ...,
+        hedge_after: Optional[float] = ...,
+    ) -> tuple: ...
+
+
+    def exists(
+        self,
+        namespace:str,
+        set: str,
+        key: Union[List[str], str],
+        policy: dict,
+        chunk_size: int = 5000,
+        max_concurrency: int = 4,
+        chunk_retries: int = 2,
+        retry_backoff: float = 0.05,
+        hedge_after: Optional[float] = None,
+    ) -> Union[list, tuple]:
+        """
+        Check whether one key or many keys exist, returning their ``(key, metadata)``.
+
+        A list of keys is read like in :meth:`get_record`, with the same retries and hedging.
+        """
+        if not self.client:
+            raise AirflowException("The 'client' should be initialized before!")
+        with self.metrics.call("exists", namespace, set) as metrics:
+            if isinstance(key, list):
+                metrics.batch_size = len(key)
+                keys = [(namespace, set, k) for k in key]
+                records = self._read_chunked(
+                    self.client.exists_many, keys, policy, chunk_size, max_concurrency, chunk_retries, retry_backoff, hedge_after
+                )
+                metrics.records = 0
+                for record in records:
+                    metrics.add_record(record)
+                return records
+            record = self.client.exists((namespace, set, key), policy)
+            metrics.add_record(record)
+            return record
+
+
+    def put(
+        self,
+        key: str,
+        bins: dict,
+        metadata: dict,
+        namespace: str,
+        set: str,
+        policy: dict,
+        skip_unchanged: bool = False,
+        hash_bin: str = DEFAULT_HASH_BIN,
+    ) -> Any:
+        """
+        Write a record.
+
+        With ``skip_unchanged`` a content hash of ``bins`` is stored in the ``hash_bin`` bin, and the write is
+        only applied by the server when the stored hash differs (see :meth:`unchanged_policy`).
+        A skipped write does not reset the ttl of the record.
+
+        :return: the client result, or with ``skip_unchanged`` whether the record was written
+        """
+        if not self.client:
+            raise AirflowException("The 'client' should be initialized before!")
+        from aerospike import exception as aerospike_exception
+        if skip_unchanged:
+            bins, policy = self.unchanged_policy(bins, policy, hash_bin)
+        with self.metrics.call("put", namespace, set) as metrics:
+            metrics.add_bytes(bins)
+            attempt = 0
+            while True:
+                try:
+                    with self.rate_limiter.throttle():
+                        result = self.client.put((namespace, set, key), bins, metadata, policy)
+                    break
+                except aerospike_exception.AerospikeError as e:
+                    if skip_unchanged and e.code == FILTERED_OUT_CODE:
+                        metrics.records = 0
+                        return False
+                    if e.code not in OVERLOAD_CODES:
+                        raise
+                    self.rate_limiter.on_overload()
+                    if attempt >= self.rate_limiter.max_retries:
+                        raise
+                    self.rate_limiter.wait_before_retry(attempt)
+                    attempt += 1
+            self.rate_limiter.on_success(1)
+            metrics.records = 1
+            return True if skip_unchanged else result
+
+
+    @staticmethod
+    def unchanged_policy(bins: dict, policy: Optional[dict], hash_bin: str = DEFAULT_HASH_BIN) -> Tuple[dict, dict]:
+        """
+        Return ``bins`` with their content hash in ``hash_bin``, and ``policy`` filtering out the unchanged records.
+
+        The filter expression lets the write through when the record has no ``hash_bin`` or a different hash,
+        so the server neither writes nor replicates records that already hold the same bins.
+        The write of an unchanged record fails with `FilteredOut` (result code 27).
+        """
+        hash_value = content_hash(bins, hash_bin)
+        return {**bins, hash_bin: hash_value}, {**(policy or {}), "expressions": changed_expression(hash_value, hash_bin)}
 
 
-    def exists(self, namespace:str, set: str, key: Union[List[str], str], policy: dict) -> Union[list, tuple]:
+    def put_many(
+        self,
+        records: Iterable[Union[Tuple[str, dict], Tuple[str, dict, Optional[dict]]]],
+        namespace: str,
+        set: str,
+        policy: Optional[dict] = None,
+        batch_policy: Optional[dict] = None,
+        chunk_size: int = 1000,
+        max_concurrency: int = 4,
+        skip_unchanged: bool = False,
+        hash_bin: str = DEFAULT_HASH_BIN,
+    ) -> Dict[str, Any]:
+        """
+        Write many records with batch writes.
+
+        ``records`` is consumed lazily in ``chunk_size`` batches with up to ``max_concurrency`` batches in flight,
+        so a generator can be passed to write more records than fit in memory.
+        Errors do not stop the load: they are counted per result code instead.
+        With ``skip_unchanged`` the records holding the same bins are not written again, see :meth:`put`.
+
+        :param records: ``(key, bins)`` or ``(key, bins, metadata)`` items. ``key`` can also be a complete
+            ``(namespace, set, key, digest)`` key tuple, e.g. to write a record scanned without its user key
+        :param policy: write policy applied to each record
+        :param batch_policy: policy of the batch call
+        :return: ``{"written": int, "failed": int, "errors": {result_code: count}}``, with ``skip_unchanged``
+            also ``"skipped": int``, the number of unchanged records
+        """
         if not self.client:
             raise AirflowException("The 'client' should be initialized before!")
-        if isinstance(key, list):
-            keys = [(namespace, set, k) for k in key]
-            return self.client.exists_many(keys, policy)
-        return self.client.exists((namespace, set, key), policy)
+        from aerospike_helpers.batch.records import BatchRecords, Write
+        from aerospike_helpers.operations import operations
+
+        def to_write(key: Any, bins: dict, metadata: List[Optional[dict]]) -> Write:
+            record_policy = policy
+            if skip_unchanged:
+                bins, record_policy = self.unchanged_policy(bins, policy, hash_bin)
+            return Write(
+                key=key if isinstance(key, tuple) else (namespace, set, key),
+                ops=[operations.write(name, value) for name, value in bins.items()],
+                meta=metadata[0] if metadata else None,
+                policy=record_policy,
+            )
+
+        def write_chunk(chunk: List[tuple]) -> Tuple[int, Dict[str, int]]:
+            if metrics.measure_bytes:
+                with bytes_lock:
+                    for _, bins, *_ in chunk:
+                        metrics.add_bytes(bins)
+            batch = BatchRecords([to_write(key, bins, metadata) for key, bins, *metadata in chunk])
+            return self._write_batch(batch, batch_policy)
+
+        result: Dict[str, Any] = {"written": 0, "failed": 0, "errors": {}}
+        if skip_unchanged:
+            result["skipped"] = 0
+        bytes_lock = threading.Lock()
+        throughput = self.rate_limiter.stats()
+        with self.metrics.call("put_many", namespace, set) as metrics:
+            for written, errors in imap_bounded(write_chunk, chunked(records, chunk_size), max_concurrency):
+                result["written"] += written
+                for code, count in errors.items():
+                    if skip_unchanged and code == str(FILTERED_OUT_CODE):
+                        result["skipped"] += count
+                        continue
+                    result["failed"] += count
+                    result["errors"][code] = result["errors"].get(code, 0) + count
+            metrics.batch_size = result["written"] + result["failed"] + result.get("skipped", 0)
+            metrics.records = result["written"]
+            for code, count in result["errors"].items():
+                metrics.add_error(code, count)
+        if skip_unchanged:
+            self.log.info(
+                "put_many: %s records written, %s unchanged records skipped (%s)",
+                result["written"], result["skipped"], skip_ratio(result["written"], result["skipped"]),
+            )
+        self.log_throughput("put_many", throughput)
+        return result
+
+
+    def _write_batch(self, batch: BatchRecords, batch_policy: Optional[dict]) -> Tuple[int, Dict[str, int]]:
+        """Send a batch write, return the number of successful records and the failed ones per result code."""
+        from aerospike_helpers.batch.records import BatchRecords
+
+        def send(records: List[Any]) -> List[int]:
+            self.client.batch_write(BatchRecords(records), batch_policy)
+            return [record.result for record in records]
+
+        return self._send_with_backpressure(batch.batch_records, send)
+
+
+    def _send_with_backpressure(self, items: List[Any], send: Callable[[List[Any]], List[int]]) -> Tuple[int, Dict[str, int]]:
+        """
+        Send ``items`` through the rate limiter, ``send`` returning the result code of every item.
+
+        Items rejected because the server is overloaded are sent again after a backoff, up to the
+        ``max_retries`` of the rate limiter. A call that raises fails all its items with the error code.
+
+        :return: the number of successful items and the failed ones per result code
+        """
+        from aerospike import exception as aerospike_exception
+        succeeded, errors = 0, {}
+        attempt = 0
+        while items:
+            try:
+                with self.rate_limiter.throttle(len(items)):
+                    codes = send(items)
+            except aerospike_exception.AerospikeError as e:
+                codes = [e.code] * len(items)
+            retry = attempt < self.rate_limiter.max_retries
+            rejected = []
+            for item, code in zip(items, codes):
+                if code == 0:
+                    succeeded += 1
+                elif code in OVERLOAD_CODES and retry:
+                    rejected.append(item)
+                else:
+                    errors[str(code)] = errors.get(str(code), 0) + 1
+            self.rate_limiter.on_success(codes.count(0))
+            if any(code in OVERLOAD_CODES for code in codes):
+                self.rate_limiter.on_overload()
+            if rejected:
+                self.rate_limiter.wait_before_retry(attempt)
+                attempt += 1
+            items = rejected
+        return succeeded, errors
+
+
+    def log_throughput(self, method: str, since: Dict[str, Any]) -> Dict[str, Any]:
+        """Log the write throughput achieved by the connection since ``since``, a previous ``rate_limiter.stats()``."""
+        stats = self.rate_limiter.stats(since)
+        self.log.info(
+            "%s: %s records/s (%s records in %ss), %s overload(s), %s retries, throttled for %ss, rate limit: %s, concurrency limit: %s",
+            method, stats["records_per_second"], stats["records"], stats["seconds"], stats["overloads"], stats["retries"],
+            stats["throttled_seconds"], stats["rate"] or "none", stats["concurrency"] or "none",
+        )
+        return stats
+
 
+    def operate(
+        self,
+        namespace: str,
+        set: str,
+        key: str,
+        ops: List[dict],
+        metadata: Optional[dict] = None,
+        policy: Optional[dict] = None,
+    ) -> tuple:
+        """
+        Apply ``ops`` to one record atomically, in a single round trip.
 
-    def put(self, key: str, bins: dict, metadata: dict, namespace: str, set: str, policy: dict) -> None:
+        :param ops: `aerospike_helpers.operations` operations, e.g. `[operations.increment("count", 1), operations.read("count")]`
+        :param metadata: record metadata eg. ttl. For example: `{"ttl": 0}`
+        :param policy: operate policy
+        :return: the ``(key, metadata, bins)`` record, ``bins`` holding the results of the read operations
+        """
         if not self.client:
             raise AirflowException("The 'client' should be initialized before!")
-        return self.client.put((namespace, set, key), bins, metadata, policy)
+        from aerospike import exception as aerospike_exception
+        with self.metrics.call("operate", namespace, set) as metrics:
+            try:
+                with self.rate_limiter.throttle():
+                    record = self.client.operate((namespace, set, key), ops, metadata, policy)
+            except aerospike_exception.AerospikeError as e:
+                # Slow down the connection, but do not retry: the operations may not be idempotent.
+                if e.code in OVERLOAD_CODES:
+                    self.rate_limiter.on_overload()
+                raise
+            self.rate_limiter.on_success(1)
+            metrics.add_record(record)
+            return record
+
+
+    def operate_many(
+        self,
+        namespace: str,
+        set: str,
+        keys: List[str],
+        ops: List[dict],
+        metadata: Optional[dict] = None,
+        policy: Optional[dict] = None,
+        batch_policy: Optional[dict] = None,
+        chunk_size: int = 1000,
+        max_concurrency: int = 4,
+        chunk_retries: int = 0,
+    ) -> Dict[str, Any]:
+        """
+        Apply the same ``ops`` to many records with batch writes, atomically per record.
+
+        Keys are sent in ``chunk_size`` batches with up to ``max_concurrency`` batches in flight.
+        A record that fails does not stop the others, it is counted per result code instead.
+        Failed batches are not retried by default: a batch that timed out may have been applied,
+        and operations such as increments are not idempotent. Batches go through the rate limiter of the
+        connection, and records rejected because the server is overloaded slow it down but are not sent again.
+
+        :param ops: `aerospike_helpers.operations` operations applied to every record
+        :param metadata: record metadata eg. ttl. For example: `{"ttl": 0}`
+        :param policy: batch write policy applied to each record
+        :param batch_policy: policy of the batch calls
+        :return: ``{"records": [(key, metadata, bins)], "failed": int, "errors": {result_code: count}}``,
+            records in the order of ``keys``, failed records having None metadata and bins
+        """
+        if not self.client:
+            raise AirflowException("The 'client' should be initialized before!")
+        from aerospike import exception as aerospike_exception
+        from aerospike_helpers.batch.records import BatchRecords, Write
+
+        def operate_chunk(chunk: List[tuple]) -> List[tuple]:
+            batch = BatchRecords([Write(key=key, ops=ops, meta=metadata, policy=policy) for key in chunk])
+            try:
+                with self.rate_limiter.throttle(len(chunk)):
+                    self.client.batch_write(batch, batch_policy)
+            except aerospike_exception.AerospikeError as e:
+                if e.code in OVERLOAD_CODES:
+                    self.rate_limiter.on_overload()
+                raise
+            codes = [record.result for record in batch.batch_records]
+            self.rate_limiter.on_success(codes.count(0))
+            if any(code in OVERLOAD_CODES for code in codes):
+                self.rate_limiter.on_overload()
+            return [(key, record.result, record.record) for key, record in zip(chunk, batch.batch_records)]
+
+        result: Dict[str, Any] = {"records": [], "failed": 0, "errors": {}}
+        with self.metrics.call("operate_many", namespace, set) as metrics:
+            metrics.batch_size = len(keys)
+            metrics.records = 0
+            for key, code, record in run_chunked(
+                operate_chunk,
+                [(namespace, set, k) for k in keys],
+                chunk_size=chunk_size,
+                max_concurrency=max_concurrency,
+                chunk_retries=chunk_retries,
+            ):
+                if code == 0 and record is not None:
+                    result["records"].append(record)
+                    metrics.add_record(record)
+                else:
+                    result["records"].append((key, None, None))
+                    result["failed"] += 1
+                    result["errors"][str(code)] = result["errors"].get(str(code), 0) + 1
+                    metrics.add_error(code)
+        return result
 
 
     @overload
-    def get_record(self, namespace: str, set: str, key: List[str], policy: dict) -> list: ...
+    def get_record(
+        self,
+        namespace: str,
+        set: str,
+        key: List[str],
+        policy: dict,
+        chunk_size: int = ...,
+        max_concurrency: int = ...,
+        chunk_retries: int = ...,
+        bins: Optional[List[str]] = ...,
+        expression: Any = ...,
+        retry_backoff: float = ...,
+        hedge_after: Optional[float] = ...,
+    ) -> list: ...
 
 
     @overload
-    def get_record(self, namespace: str, set: str, key: str, policy: dict) -> tuple: ...
+    def get_record(
+        self,
+        namespace: str,
+        set: str,
+        key: str,
+        policy: dict,
+        chunk_size: int = ...,
+        max_concurrency: int = ...,
+        chunk_retries: int = ...,
+        bins: Optional[List[str]] = ...,
+        expression: Any = ...,
+        retry_backoff: float = ...,
+        hedge_after: Optional[float] = ...,
+    ) -> tuple: ...
+
+
+    def get_record(
+        self,
+        namespace:str,
+        set: str,
+        key: Union[List[str], str],
+        policy: dict,
+        chunk_size: int = 5000,
+        max_concurrency: int = 4,
+        chunk_retries: int = 2,
+        bins: Optional[List[str]] = None,
+        expression: Any = None,
+        retry_backoff: float = 0.05,
+        hedge_after: Optional[float] = None,
+    ) -> Union[list, tuple]:
+        """
+        Read one record, or many records with batch reads.
+
+        A list of keys is split into ``chunk_size`` batches, up to ``max_concurrency`` of them in flight at once.
+        Batches failing with a transient error (timeouts, connection errors, cluster changes, overloaded servers:
+        :data:`~aerospike_provider.utils.retry.TRANSIENT_CODES`) are retried ``chunk_retries`` times after a jittered
+        exponential backoff, other errors are raised at once. The records are returned in the order of ``key``.
+
+        :param bins: only fetch these bins (`select`/`select_many`), defaults to all bins
+        :param expression: Aerospike filter expression evaluated on the server, records that do not match
+            are not sent back: their metadata and bins are None, for a single key as in a batch.
+            With an expression, a missing single key is returned the same way instead of raising `RecordNotFound`
+        :param retry_backoff: base delay in seconds before the first retry of a batch, doubled on every retry
+        :param hedge_after: seconds after which a batch still running is sent again with the
+            `POLICY_REPLICA_ANY` replica policy, the first answer being used. Defaults to no hedging
+        """
+        if not self.client:
+            raise AirflowException("The 'client' should be initialized before!")
+        policy = self.policy_with_expression(policy, expression)
+        with self.metrics.call("get_record", namespace, set) as metrics:
+            if isinstance(key, list):
+                metrics.batch_size = len(key)
+                keys = [(namespace, set, k) for k in key]
+                if bins:
+                    read_many = lambda chunk, chunk_policy: self.client.select_many(chunk, bins, chunk_policy)
+                else:
+                    read_many = self.client.get_many
+                records = self._read_chunked(
+                    read_many, keys, policy, chunk_size, max_concurrency, chunk_retries, retry_backoff, hedge_after
+                )
+                metrics.records = 0
+                for record in records:
+                    metrics.add_record(record)
+                return records
+            from aerospike import exception as aerospike_exception
+            try:
+                if bins:
+                    record = self.client.select((namespace, set, key), bins, policy)
+                else:
+                    record = self.client.get((namespace, set, key), policy)
+            except aerospike_exception.AerospikeError as e:
+                if expression is None or e.code not in (FILTERED_OUT_CODE, RECORD_NOT_FOUND_CODE):
+                    raise
+                # Like a batch read: a record missing or not matching the expression has no metadata and no bins.
+                record = ((namespace, set, key), None, None)
+                metrics.records = 0
+            metrics.add_record(record)
+            return record
+
+
+    def _read_chunked(
+        self,
+        read_many: Callable[[List[tuple], Optional[dict]], List[tuple]],
+        keys: List[tuple],
+        policy: Optional[dict],
+        chunk_size: int,
+        max_concurrency: int,
+        chunk_retries: int,
+        retry_backoff: float,
+        hedge_after: Optional[float],
+    ) -> List[tuple]:
+        """Run the batch read ``read_many(chunk, policy)`` on chunks of ``keys``, with retries and optional hedging."""
+        read_chunk = lambda chunk: read_many(chunk, policy)
+        executor = None
+        if hedge_after is not None:
+            hedge_policy = {**(policy or {}), "replica": REPLICA_POLICIES["any"]}
+            # Room for a primary and a hedged call per chunk in flight, plus the calls that lost a race.
+            executor = ThreadPoolExecutor(max_workers=3 * max(1, max_concurrency))
+            read_chunk = hedged(read_chunk, lambda chunk: read_many(chunk, hedge_policy), hedge_after, executor)
+        try:
+            return run_chunked(
+                read_chunk,
+                keys,
+                chunk_size=chunk_size,
+                max_concurrency=max_concurrency,
+                chunk_retries=chunk_retries,
+                retry_if=is_transient,
+                backoff=retry_backoff,
+            )
+        finally:
+            if executor is not None:
+                # Do not wait for the calls that lost a race.
+                executor.shutdown(wait=False)
+
+
+    @staticmethod
+    def policy_with_expression(policy: Optional[dict], expression: Any) -> Optional[dict]:
+        """
+        Return a copy of ``policy`` filtering records with ``expression``.
+
+        ``expression`` can be an `aerospike_helpers.expressions` object or an already compiled expression.
+        """
+        if expression is None:
+            return policy
+        if hasattr(expression, "compile"):
+            expression = expression.compile()
+        return {**(policy or {}), "expressions": expression}
+
 
+    def foreach(
+        self,
+        namespace: str,
+        set: Optional[str],
+        callback: Callable[[tuple], Optional[bool]],
+        bins: Optional[List[str]] = None,
+        policy: Optional[dict] = None,
+        partition_filter: Optional[dict] = None,
+    ) -> None:
+        """
+        Stream every record of a namespace/set to ``callback`` without holding the result set in memory.
 
-    def get_record(self, namespace:str, set: str, key: Union[List[str], str], policy: dict) -> Union[list, tuple]:
+        ``callback`` receives ``(key, metadata, bins)`` tuples and may return ``False`` to stop the scan.
+        An exception raised by ``callback`` stops the scan and is re-raised.
+
+        :param set: set name in the namespace, or None to scan the whole namespace
+        :param bins: only return these bins, defaults to all bins
+        :param policy: query policy
+        :param partition_filter: only scan these partitions, e.g. `{"begin": 0, "count": 1024}`
+        """
         if not self.client:
             raise AirflowException("The 'client' should be initialized before!")
-        if isinstance(key, list):
-            keys = [(namespace, set, k) for k in key]
-            return self.client.get_many(keys, policy)
-        return self.client.get((namespace, set, key), policy)
+        query = self.client.query(namespace, set)
+        if bins:
+            query.select(*bins)
+        policy = dict(policy or {})
+        if partition_filter is not None:
+            policy["partition_filter"] = partition_filter
+
+        errors: List[BaseException] = []
+        counter_lock = threading.Lock()
+
+        with self.metrics.call("foreach", namespace, set) as metrics:
+            metrics.records = 0
+
+            def safe_callback(record: tuple) -> Optional[bool]:
+                with counter_lock:
+                    metrics.add_record(record)
+                try:
+                    return callback(record)
+                except Exception as e:
+                    errors.append(e)
+                    return False
+
+            query.foreach(safe_callback, policy)
+            if errors:
+                raise errors[0]
+
+
+    def parallel_partition_scan(
+        self,
+        worker: Callable[..., Any],
+        namespace: str,
+        set: Optional[str],
+        num_workers: int,
+        num_ranges: Optional[int] = None,
+        worker_kwargs: Optional[Dict[str, Any]] = None,
+        mp_context: str = "spawn",
+        ranges: Optional[List[Tuple[int, int]]] = None,
+        on_result: Optional[Callable[[int, int, Any], None]] = None,
+    ) -> List[Any]:
+        """
+        Split a scan into partition ranges and run ``worker`` on each range in a process pool.
+
+        ``worker`` must be a picklable module level function. It is called in a worker process as
+        ``worker(aerospike_conn_id=..., namespace=..., set=..., begin=..., count=..., **worker_kwargs)``
+        and should open its own hook (and so its own client) and scan with
+        ``partition_filter={"begin": begin, "count": count}``.
+        With ``num_workers=1`` the ranges are scanned one after the other in the current process.
+        This hook does not need to be connected to call this method.
+
+        :param worker: function scanning one partition range
+        :param num_workers: number of worker processes
+        :param num_ranges: number of partition ranges, defaults to ``4 * num_workers`` to balance uneven ranges
+        :param worker_kwargs: extra keyword arguments for ``worker``
+        :param mp_context: multiprocessing start method of the workers
+        :param ranges: explicit ``(begin, count)`` ranges to scan instead of splitting all partitions in ``num_ranges``
+        :param on_result: called in this process with ``(begin, count, result)`` as soon as a range completes
+        :return: the worker results, in the order of the ranges
+        """
+        if ranges is None:
+            ranges = partition_ranges(num_ranges or 4 * num_workers)
+        worker_kwargs = worker_kwargs or {}
+        self.log.info('Scanning %s.%s in %s partition ranges on %s processes', namespace, set, len(ranges), num_workers)
+
+        def submit(run: Callable[..., Any], begin: int, count: int) -> Any:
+            return run(
+                worker,
+                aerospike_conn_id=self.aerospike_conn_id,
+                namespace=namespace,
+                set=set,
+                begin=begin,
+                count=count,
+                **worker_kwargs,
+            )
+
+        if num_workers <= 1:
+            results = []
+            for begin, count in ranges:
+                result = submit(lambda fn, **kwargs: fn(**kwargs), begin, count)
+                if on_result is not None:
+                    on_result(begin, count, result)
+                results.append(result)
+            return results
+
+        with ProcessPoolExecutor(max_workers=num_workers, mp_context=multiprocessing.get_context(mp_context)) as executor:
+            futures = {submit(executor.submit, begin, count): (begin, count) for begin, count in ranges}
+            try:
+                for future in as_completed(futures):
+                    if on_result is not None:
+                        on_result(*futures[future], future.result())
+                return [future.result() for future in futures]
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
 
 
     def touch_record(self, namespace: str, set: str, key: str, ttl: int, policy: Optional[Dict] = None) -> None:
         if not self.client:
             raise AirflowException("The 'client' should be initialized before!")
-        self.client.touch(key=(namespace, set, key), val=ttl, policy=policy)
+        with self.metrics.call("touch_record", namespace, set) as metrics:
+            self.client.touch(key=(namespace, set, key), val=ttl, policy=policy)
+            metrics.records = 1
+
+
+    def touch_many(
+        self,
+        namespace: str,
+        set: str,
+        keys: Iterable[Any],
+        ttl: int,
+        policy: Optional[dict] = None,
+        batch_policy: Optional[dict] = None,
+        chunk_size: int = 1000,
+        max_concurrency: int = 4,
+    ) -> Dict[str, Any]:
+        """
+        Reset the ttl of many records with batch writes.
+
+        ``keys`` is consumed lazily in ``chunk_size`` batches with up to ``max_concurrency`` batches in flight,
+        so a generator can be passed. Keys that do not exist are counted as missing, they are not created.
+
+        :param ttl: new ttl of the records in seconds
+        :param policy: batch write policy applied to each record
+        :param batch_policy: policy of the batch calls
+        :return: ``{"touched": int, "missing": int, "failed": int, "errors": {result_code: count}}``,
+            ``failed`` and ``errors`` not including the missing records
+        """
+        if not self.client:
+            raise AirflowException("The 'client' should be initialized before!")
+        from aerospike_helpers.batch.records import BatchRecords, Write
+        from aerospike_helpers.operations import operations
+
+        def touch_chunk(chunk: List[Any]) -> Tuple[int, Dict[str, int]]:
+            batch = BatchRecords([
+                Write(key=(namespace, set, key), ops=[operations.touch()], meta={"ttl": ttl}, policy=policy)
+                for key in chunk
+            ])
+            return self._write_batch(batch, batch_policy)
+
+        result: Dict[str, Any] = {"touched": 0, "missing": 0, "failed": 0, "errors": {}}
+        throughput = self.rate_limiter.stats()
+        with self.metrics.call("touch_many", namespace, set) as metrics:
+            for touched, errors in imap_bounded(touch_chunk, chunked(keys, chunk_size), max_concurrency):
+                result["touched"] += touched
+                for code, count in errors.items():
+                    if code == str(RECORD_NOT_FOUND_CODE):
+                        result["missing"] += count
+                    else:
+                        result["failed"] += count
+                        result["errors"][code] = result["errors"].get(code, 0) + count
+                        metrics.add_error(code, count)
+            metrics.batch_size = result["touched"] + result["missing"] + result["failed"]
+            metrics.records = result["touched"]
+        self.log_throughput("touch_many", throughput)
+        return result
+
+
+    def remove_many(
+        self,
+        namespace: str,
+        set: str,
+        keys: Iterable[Any],
+        policy: Optional[dict] = None,
+        batch_policy: Optional[dict] = None,
+        chunk_size: int = 1000,
+        max_concurrency: int = 4,
+    ) -> Dict[str, Any]:
+        """
+        Delete many records with batch removes.
+
+        ``keys`` is consumed lazily in ``chunk_size`` batches with up to ``max_concurrency`` batches in flight,
+        so a generator can be passed. Keys that do not exist are counted as missing.
+
+        :param policy: batch remove policy applied to each record
+        :param batch_policy: policy of the batch calls
+        :return: ``{"removed": int, "missing": int, "failed": int, "errors": {result_code: count}}``,
+            ``failed`` and ``errors`` not including the missing records
+        """
+        if not self.client:
+            raise AirflowException("The 'client' should be initialized before!")
+
+        def send(keys: List[tuple]) -> List[int]:
+            batch = self.client.batch_remove(keys, batch_policy, policy)
+            return [record.result for record in batch.batch_records]
+
+        def remove_chunk(chunk: List[Any]) -> Tuple[int, Dict[str, int]]:
+            return self._send_with_backpressure([(namespace, set, key) for key in chunk], send)
+
+        result: Dict[str, Any] = {"removed": 0, "missing": 0, "failed": 0, "errors": {}}
+        throughput = self.rate_limiter.stats()
+        with self.metrics.call("remove_many", namespace, set) as metrics:
+            for removed, errors in imap_bounded(remove_chunk, chunked(keys, chunk_size), max_concurrency):
+                result["removed"] += removed
+                for code, count in errors.items():
+                    if code == str(RECORD_NOT_FOUND_CODE):
+                        result["missing"] += count
+                    else:
+                        result["failed"] += count
+                        result["errors"][code] = result["errors"].get(code, 0) + count
+                        metrics.add_error(code, count)
+            metrics.batch_size = result["removed"] + result["missing"] + result["failed"]
+            metrics.records = result["removed"]
+        self.log_throughput("remove_many", throughput)
+        return result
+
+
+    def truncate(
+        self,
+        namespace: str,
+        set: Optional[str],
+        before: Optional[Union[datetime, str, int, float]] = None,
+        policy: Optional[dict] = None,
+    ) -> None:
+        """
+        Remove every record of a set (or of a whole namespace) on the server side.
+
+        The server returns before the truncation is complete. Records written after the cutoff are kept.
+
+        :param set: set name in the namespace, or None to truncate the whole namespace
+        :param before: only remove records last updated before this datetime, ISO 8601 string or unix timestamp.
+            Defaults to now
+        :param policy: info policy
+        """
+        if not self.client:
+            raise AirflowException("The 'client' should be initialized before!")
+        nanos = 0 if before is None else to_nanoseconds(before)
+        with self.metrics.call("truncate", namespace, set):
+            self.client.truncate(namespace, set, nanos, policy)
+
+
+    def get_partition_owners(self, namespace: str, policy: Optional[dict] = None) -> Dict[int, str]:
+        """Return the name of the node each partition of ``namespace`` is master on, from the nodes' ``replicas`` info."""
+        if not self.client:
+            raise AirflowException("The 'client' should be initialized before!")
+        owners: Dict[int, str] = {}
+        with self.metrics.call("get_partition_owners", namespace):
+            for node, (error, response) in self.client.info_all("replicas", policy).items():
+                if error is not None or not response:
+                    self.log.warning("Could not get the partitions of node %s: %s", node, error)
+                    continue
+                for partition_id in parse_replicas(response.split("\t", 1)[-1], namespace):
+                    owners[partition_id] = node
+        return owners
+
+
+    def shard_keys(self, namespace: str, set: Optional[str], keys: List[Any], num_shards: int, by: str = "partition") -> List[List[Any]]:
+        """
+        Split ``keys`` into at most ``num_shards`` lists of keys stored close together, e.g. for ``.expand()``.
+
+        Digests and partitions are computed locally. With ``by="node"`` the keys of one node go to the same shard,
+        which needs a connected hook to get the partition map, see :func:`aerospike_provider.utils.partitions.shard_keys`.
+
+        :param by: ``partition`` or ``node``
+        """
+        if by not in ("partition", "node"):
+            raise ValueError(f"Expecting 'partition' or 'node', got: {by}")
+        owners = self.get_partition_owners(namespace) if by == "node" else None
+        return shard_keys(namespace, set, keys, num_shards, partition_owners=owners)
 
 
     @staticmethod
@@ -138,7 +1072,24 @@ class AerospikeHook(BaseHook):
             },
             "placeholders": {
                 "port": "3000",
-                "host": "cluster node address (The client will learn about the other nodes in the cluster from the seed node)"
+                "host": "cluster node address (The client will learn about the other nodes in the cluster from the seed node)",
+                "extra": json.dumps(
+                    {
+                        "hosts": "node2:3000,node3:3000",
+                        "max_conns_per_node": 100,
+                        "min_conns_per_node": 10,
+                        "tend_interval": 1000,
+                        "connect_timeout": 1000,
+                        "rack_aware": True,
+                        "rack_id": 1,
+                        "replica": "prefer_rack",
+                        "total_timeout": 1000,
+                        "read_policy": {"socket_timeout": 200},
+                        "write_policy": {},
+                        "batch_policy": {},
+                    },
+                    indent=2,
+                ),
             },
         }
 
@@ -146,7 +1097,209 @@ class AerospikeHook(BaseHook):
     def test_connection(self) -> Tuple[bool, str]:
         """Test the Aerospike connection by conneting to it (`Test` button in the ui)."""
         try:
-            self.get_conn().is_connected()
+            with self as hook:
+                if not hook.client.is_connected():
+                    return False, "Client is not connected to the cluster"
         except Exception as e:
             return False, str(e)
         return True, "Connection successfully tested"
+
+
+
+class AerospikeAsyncHook(BaseHook):
+    """
+    Interact with Aerospike from asyncio code (triggers, async services).
+
+    Offers the methods of :class:`AerospikeHook` as coroutines. The blocking client calls run on the executor
+    shared by all the async hooks of the process (see :mod:`aerospike_provider.utils.executor`), so the event
+    loop is never blocked, an idle hook holds no thread, and at most ``max_workers`` calls of the hook are in
+    flight, however many coroutines share it. The client itself comes from the same pool as :class:`AerospikeHook`.
+
+    .. note:: Please use this Hook as async context manager via `async with`.
+
+    Every call accepts a ``timeout`` in seconds (defaults to ``timeout`` of the hook): the coroutine raises
+    `asyncio.TimeoutError` once it expires, and the call's policy gets the same ``total_timeout`` unless it
+    already has one, so the client abandons the call too. Cancelling a coroutine does not interrupt a call
+    already running in the executor, it only stops waiting for it.
+
+    :param aerospike_conn_id: Reference to :ref:`Aerospike connection id`.
+    :param max_workers: maximum number of client calls of the hook running at once
+    :param timeout: default timeout of every call in seconds, None to wait forever
+    """
+
+    conn_name_attr = 'aerospike_conn_id'
+    default_conn_name = 'aerospike_default'
+    conn_type = 'aerospike'
+    hook_name = 'Aerospike'
+
+    def __init__(
+        self,
+        aerospike_conn_id: str = default_conn_name,
+        max_workers: int = 8,
+        timeout: Optional[float] = None,
+        *args,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.aerospike_conn_id = aerospike_conn_id
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.hook = AerospikeHook(aerospike_conn_id)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    async def __aenter__(self) -> "AerospikeAsyncHook":
+        return await self.get_conn()
+
+    async def __aexit__(
+        self,
+        exc_type: Union[BaseException, None],
+        exc_val: Union[BaseException, None],
+        exc_tb: Union[TracebackType, None]
+        ) -> None:
+        await self.close()
+
+    async def get_conn(self, timeout: Optional[float] = None) -> "AerospikeAsyncHook":
+        """
+        Acquire a client from the client pool, on the shared executor.
+
+        When the connect fails or times out, the client is released, by the connect itself if it is still
+        running in its thread.
+        """
+        if self._executor is None:
+            self._executor = get_async_executor()
+            self._slots = asyncio.Semaphore(self.max_workers)
+        connecting = self._executor.submit(self.hook.get_conn)
+        try:
+            await asyncio.wait_for(asyncio.wrap_future(connecting), timeout if timeout is not None else self.timeout)
+        except BaseException:
+            connecting.add_done_callback(lambda _: self.hook.close())
+            self._executor = self._slots = None
+            raise
+        return self
+
+    async def close(self) -> None:
+        """Release the client back to the pool."""
+        if self._executor is None:
+            return
+        executor, self._executor, self._slots = self._executor, None, None
+        await asyncio.get_running_loop().run_in_executor(executor, self.hook.__exit__, None, None, None)
+
+    async def _run(self, func: Callable[..., Any], *args: Any, timeout: Optional[float] = None, **kwargs: Any) -> Any:
+        if self._executor is None or self._slots is None:
+            raise AirflowException("The 'client' should be initialized before!")
+        executor, slots = self._executor, self._slots
+
+        async def call() -> Any:
+            async with slots:
+                return await asyncio.get_running_loop().run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+        return await asyncio.wait_for(call(), timeout if timeout is not None else self.timeout)
+
+    def _policy(self, policy: Optional[dict], timeout: Optional[float]) -> Optional[dict]:
+        timeout = timeout if timeout is not None else self.timeout
+        if timeout is None or (policy and "total_timeout" in policy):
+            return policy
+        return {**(policy or {}), "total_timeout": int(timeout * 1000)}
+
+    async def exists(
+        self,
+        namespace: str,
+        set: str,
+        key: Union[List[str], str],
+        policy: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ) -> Union[list, tuple]:
+        """See :meth:`AerospikeHook.exists`."""
+        return await self._run(
+            self.hook.exists,
+            namespace=namespace,
+            set=set,
+            key=key,
+            policy=self._policy(policy, timeout),
+            timeout=timeout,
+        )
+
+    async def get_record(
+        self,
+        namespace: str,
+        set: str,
+        key: Union[List[str], str],
+        policy: Optional[dict] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Union[list, tuple]:
+        """See :meth:`AerospikeHook.get_record`, ``kwargs`` are its batch and filtering options."""
+        return await self._run(
+            self.hook.get_record,
+            namespace=namespace,
+            set=set,
+            key=key,
+            policy=self._policy(policy, timeout),
+            timeout=timeout,
+            **kwargs,
+        )
+
+    async def put(
+        self,
+        key: str,
+        bins: dict,
+        metadata: Optional[dict],
+        namespace: str,
+        set: str,
+        policy: Optional[dict] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """See :meth:`AerospikeHook.put`."""
+        return await self._run(
+            self.hook.put,
+            key=key,
+            bins=bins,
+            metadata=metadata,
+            namespace=namespace,
+            set=set,
+            policy=self._policy(policy, timeout),
+            timeout=timeout,
+        )
+
+    async def put_many(
+        self,
+        records: Iterable[tuple],
+        namespace: str,
+        set: str,
+        policy: Optional[dict] = None,
+        batch_policy: Optional[dict] = None,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Dict[str, Any]:
+        """See :meth:`AerospikeHook.put_many`, ``kwargs`` are its batch options. The timeout applies to the batch policy."""
+        return await self._run(
+            self.hook.put_many,
+            records=records,
+            namespace=namespace,
+            set=set,
+            policy=policy,
+            batch_policy=self._policy(batch_policy, timeout),
+            timeout=timeout,
+            **kwargs,
+        )
+
+    async def touch_record(
+        self,
+        namespace: str,
+        set: str,
+        key: str,
+        ttl: int,
+        policy: Optional[Dict] = None,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """See :meth:`AerospikeHook.touch_record`."""
+        return await self._run(
+            self.hook.touch_record,
+            namespace=namespace,
+            set=set,
+            key=key,
+            ttl=ttl,
+            policy=self._policy(policy, timeout),
+            timeout=timeout,
+        )
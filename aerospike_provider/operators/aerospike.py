@@ -17,13 +17,16 @@
 # under the License.
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Sequence, Union, List, Dict, Any
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Sequence, Union, List, Dict, Any
 
 if TYPE_CHECKING:
     from airflow.utils.context import Context
 
-import aerospike
-from aerospike_provider.hooks.aerospike import AerospikeHook
+from aerospike_provider.hooks.aerospike import AerospikeHook, default_key_policy
+from aerospike_provider.utils.content_hash import DEFAULT_HASH_BIN, skip_ratio
+from aerospike_provider.utils.file_formats import to_serializable
+from airflow.exceptions import AirflowException
 from airflow.models.baseoperator import BaseOperator
 
 
@@ -40,6 +43,9 @@ class AerospikePutKeyOperator(BaseOperator):
     :param metadata: metadata about the key eg. ttl. For example: `{"ttl": 0}`
     :param policy: which policy the key should be saved with. default `POLICY_EXISTS_IGNORE`. ref: https://developer.aerospike.com/client/usage/atomic/update#policies
     :param aerospike_conn_id: aerospike connection to use, defaults to 'aerospike_default'
+    :param skip_unchanged: store a content hash of the bins in ``hash_bin`` and only write the record when it changed.
+        The task then returns `{"written": 0 or 1, "skipped": 0 or 1}`. A skipped write does not reset the ttl
+    :param hash_bin: bin holding the content hash
     """
 
     template_fields: Sequence[str] = ("key", "bins", "metadata", )
@@ -53,8 +59,10 @@ class AerospikePutKeyOperator(BaseOperator):
         key: str,
         bins: dict,
         metadata: Union[dict, Any] = None,
-        policy: Dict[str, Any] = {'key': aerospike.POLICY_EXISTS_IGNORE},
+        policy: Optional[Dict[str, Any]] = None,
         aerospike_conn_id: str = "aerospike_default",
+        skip_unchanged: bool = False,
+        hash_bin: str = DEFAULT_HASH_BIN,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
@@ -66,12 +74,414 @@ class AerospikePutKeyOperator(BaseOperator):
         self.metadata = metadata
         self.policy = policy
         self.aerospike_conn_id = aerospike_conn_id
+        self.skip_unchanged = skip_unchanged
+        self.hash_bin = hash_bin
 
-    def execute(self, context: Context) -> None:
+    def execute(self, context: Context) -> Optional[Dict[str, int]]:
+        policy = default_key_policy(self.policy, "POLICY_EXISTS_IGNORE")
         with AerospikeHook(self.aerospike_conn_id) as hook:
             self.log.info('Storing %s as key', self.key)
-            hook.put(key=self.key, bins=self.bins, metadata=self.metadata, namespace=self.namespace, set=self.set, policy=self.policy)
-            self.log.info('Stored key successfully')
+            if not self.skip_unchanged:
+                hook.put(key=self.key, bins=self.bins, metadata=self.metadata, namespace=self.namespace, set=self.set, policy=policy)
+                self.log.info('Stored key successfully')
+                return None
+            written = hook.put(
+                key=self.key,
+                bins=self.bins,
+                metadata=self.metadata,
+                namespace=self.namespace,
+                set=self.set,
+                policy=policy,
+                skip_unchanged=True,
+                hash_bin=self.hash_bin,
+            )
+            self.log.info('Stored key successfully' if written else 'Key is unchanged, skipped the write')
+            return {"written": int(written), "skipped": int(not written)}
+
+
+class AerospikeBulkPutOperator(BaseOperator):
+    """
+    Create or update many records with batch writes.
+
+    Records are sent in ``chunk_size`` batches with up to ``max_concurrency`` batches in flight.
+    A failed record does not fail the task; the task returns how many records were written and failed.
+
+    :param namespace: namespace to use in aerospike db
+    :param set: set name in the namespace
+    :param records: ``(key, bins)`` or ``(key, bins, metadata)`` items. For example: `[("key", {"bin": value}, {"ttl": 0})]`
+    :param policy: write policy applied to each record, default `POLICY_EXISTS_IGNORE`
+    :param batch_policy: policy of the batch calls
+    :param chunk_size: maximum number of records per batch write
+    :param max_concurrency: maximum number of batch writes in flight at once
+    :param aerospike_conn_id: aerospike connection to use, defaults to 'aerospike_default'
+    :param skip_unchanged: store a content hash of the bins in ``hash_bin`` and only write the records that changed,
+        the result then also counts the ``skipped`` records. A skipped write does not reset the ttl
+    :param hash_bin: bin holding the content hash
+    """
+
+    template_fields: Sequence[str] = ("records",)
+    template_ext: Sequence[str] = ()
+    ui_color = "#66c3ff"
+
+    def __init__(
+        self,
+        namespace: str,
+        set: str,
+        records: Iterable[tuple],
+        policy: Optional[Dict[str, Any]] = None,
+        batch_policy: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 1000,
+        max_concurrency: int = 4,
+        aerospike_conn_id: str = "aerospike_default",
+        skip_unchanged: bool = False,
+        hash_bin: str = DEFAULT_HASH_BIN,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.namespace = namespace
+        self.set = set
+        self.records = records
+        self.policy = policy
+        self.batch_policy = batch_policy
+        self.chunk_size = chunk_size
+        self.max_concurrency = max_concurrency
+        self.aerospike_conn_id = aerospike_conn_id
+        self.skip_unchanged = skip_unchanged
+        self.hash_bin = hash_bin
+
+    def execute(self, context: Context) -> Dict[str, Any]:
+        with AerospikeHook(self.aerospike_conn_id) as hook:
+            self.log.info('Storing records in %s.%s', self.namespace, self.set)
+            result = hook.put_many(
+                records=self.records,
+                namespace=self.namespace,
+                set=self.set,
+                policy=default_key_policy(self.policy, "POLICY_EXISTS_IGNORE"),
+                batch_policy=self.batch_policy,
+                chunk_size=self.chunk_size,
+                max_concurrency=self.max_concurrency,
+                skip_unchanged=self.skip_unchanged,
+                hash_bin=self.hash_bin,
+            )
+            self.log.info('Stored %s records, %s failed', result['written'], result['failed'])
+            if self.skip_unchanged:
+                self.log.info('Skipped %s unchanged records (%s)', result['skipped'], skip_ratio(result['written'], result['skipped']))
+            if result['errors']:
+                self.log.warning('Failed records by result code: %s', result['errors'])
+            return result
+
+
+class AerospikeOperateOperator(BaseOperator):
+    """
+    Apply several operations (increment, append, list/map operations, read back...) to records on the server.
+
+    All the operations of a record are applied atomically in a single round trip, so counters and list/map bins
+    can be updated without reading them first. A list of keys is processed with chunked, concurrent batch writes.
+
+    :param namespace: namespace to use in aerospike db
+    :param set: set name in the namespace
+    :param key: key to operate on. can be a single key or a list of keys
+    :param operations: `aerospike_helpers.operations` operations applied to every key.
+        For example: `[operations.increment("count", 1), operations.read("count")]`
+    :param metadata: metadata applied to the records eg. ttl. For example: `{"ttl": 0}`
+    :param policy: operate policy (batch write policy of each record for a list of keys)
+    :param batch_policy: policy of the batch calls
+    :param chunk_size: maximum number of keys per batch when operating on a list of keys
+    :param max_concurrency: maximum number of batches in flight at once
+    :param fail_on_error: fail the task if any record failed, otherwise only log the failures
+    :param aerospike_conn_id: aerospike connection to use, defaults to 'aerospike_default'
+    """
+
+    template_fields: Sequence[str] = ("key", "operations", "metadata",)
+    template_ext: Sequence[str] = ()
+    ui_color = "#66c3ff"
+
+    def __init__(
+        self,
+        namespace: str,
+        set: str,
+        key: Union[List[str], str],
+        operations: List[Dict[str, Any]],
+        metadata: Optional[Dict[str, Any]] = None,
+        policy: Optional[Dict[str, Any]] = None,
+        batch_policy: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 1000,
+        max_concurrency: int = 4,
+        fail_on_error: bool = True,
+        aerospike_conn_id: str = "aerospike_default",
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.namespace = namespace
+        self.set = set
+        self.key = key
+        self.operations = operations
+        self.metadata = metadata
+        self.policy = policy
+        self.batch_policy = batch_policy
+        self.chunk_size = chunk_size
+        self.max_concurrency = max_concurrency
+        self.fail_on_error = fail_on_error
+        self.aerospike_conn_id = aerospike_conn_id
+
+    def execute(self, context: Context) -> list:
+        with AerospikeHook(self.aerospike_conn_id) as hook:
+            if not isinstance(self.key, list):
+                self.log.info('Operating on key %s', self.key)
+                record = hook.operate(
+                    namespace=self.namespace,
+                    set=self.set,
+                    key=self.key,
+                    ops=self.operations,
+                    metadata=self.metadata,
+                    policy=self.policy,
+                )
+                return [self.create_dict_from_record(record)]
+
+            self.log.info('Operating on %s keys', len(self.key))
+            result = hook.operate_many(
+                namespace=self.namespace,
+                set=self.set,
+                keys=self.key,
+                ops=self.operations,
+                metadata=self.metadata,
+                policy=self.policy,
+                batch_policy=self.batch_policy,
+                chunk_size=self.chunk_size,
+                max_concurrency=self.max_concurrency,
+            )
+            self.log.info('Operated on %s records, %s failed', len(self.key) - result['failed'], result['failed'])
+            if result['errors']:
+                if self.fail_on_error:
+                    raise AirflowException(f"Operations failed on {result['failed']} records, by result code: {result['errors']}")
+                self.log.warning('Failed records by result code: %s', result['errors'])
+            return [self.create_dict_from_record(record) for record in result['records']]
+
+    @staticmethod
+    def create_dict_from_record(record: tuple) -> dict:
+        """Bytes in bins are base64 encoded so the result can be pushed to XCom."""
+        return {
+            "namespace": record[0][0],
+            "set": record[0][1],
+            "key": record[0][2],
+            "metadata": record[1],
+            "bins": {name: to_serializable(value) for name, value in record[2].items()} if record[2] else record[2],
+        }
+
+
+class AerospikeTouchOperator(BaseOperator):
+    """
+    Reset the ttl of many records with chunked, concurrent batch writes.
+
+    The keys are either given as a list (``keys``) or generated from a range of integers (``key_range``),
+    optionally formatted with ``key_template``. Missing keys do not fail the task;
+    the task returns how many keys were touched, missing and failed.
+
+    :param namespace: namespace to use in aerospike db
+    :param set: set name in the namespace
+    :param ttl: new ttl of the records in seconds
+    :param keys: keys to touch
+    :param key_range: ``range`` arguments generating the keys, e.g. `[0, 1000]` or `[0, 1000, 10]`
+    :param key_template: format string turning each integer of ``key_range`` into a key, e.g. `"user:{}"`.
+        Defaults to using the integers as keys
+    :param policy: batch write policy applied to each record
+    :param batch_policy: policy of the batch calls
+    :param chunk_size: maximum number of keys per batch
+    :param max_concurrency: maximum number of batches in flight at once
+    :param aerospike_conn_id: aerospike connection to use, defaults to 'aerospike_default'
+    """
+
+    template_fields: Sequence[str] = ("keys", "key_range", "key_template", "ttl",)
+    template_ext: Sequence[str] = ()
+    ui_color = "#66c3ff"
+
+    def __init__(
+        self,
+        namespace: str,
+        set: str,
+        ttl: int,
+        keys: Optional[List[Any]] = None,
+        key_range: Optional[Sequence[int]] = None,
+        key_template: Optional[str] = None,
+        policy: Optional[Dict[str, Any]] = None,
+        batch_policy: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 1000,
+        max_concurrency: int = 4,
+        aerospike_conn_id: str = "aerospike_default",
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        if (keys is None) == (key_range is None):
+            raise ValueError("Expecting exactly one of 'keys' or 'key_range'")
+        self.namespace = namespace
+        self.set = set
+        self.ttl = ttl
+        self.keys = keys
+        self.key_range = key_range
+        self.key_template = key_template
+        self.policy = policy
+        self.batch_policy = batch_policy
+        self.chunk_size = chunk_size
+        self.max_concurrency = max_concurrency
+        self.aerospike_conn_id = aerospike_conn_id
+
+    def iter_keys(self) -> Iterable[Any]:
+        if self.keys is not None:
+            return self.keys
+        numbers = range(*(int(value) for value in self.key_range))
+        if self.key_template is None:
+            return iter(numbers)
+        return (self.key_template.format(number) for number in numbers)
+
+    def execute(self, context: Context) -> Dict[str, Any]:
+        with AerospikeHook(self.aerospike_conn_id) as hook:
+            self.log.info('Touching keys in %s.%s with ttl %s', self.namespace, self.set, self.ttl)
+            result = hook.touch_many(
+                namespace=self.namespace,
+                set=self.set,
+                keys=self.iter_keys(),
+                ttl=int(self.ttl),
+                policy=self.policy,
+                batch_policy=self.batch_policy,
+                chunk_size=self.chunk_size,
+                max_concurrency=self.max_concurrency,
+            )
+            self.log.info('Touched %s keys, %s missing, %s failed', result['touched'], result['missing'], result['failed'])
+            if result['errors']:
+                self.log.warning('Failed keys by result code: %s', result['errors'])
+            return result
+
+
+class AerospikeDeleteOperator(BaseOperator):
+    """
+    Delete records: a list of keys with chunked, concurrent batch removes, or a whole set with ``truncate``.
+
+    Truncating is done by the server without a round trip per record, ``truncate_before`` limits it to
+    the records last updated before a cutoff (e.g. for retention cleanup).
+
+    :param namespace: namespace to use in aerospike db
+    :param set: set name in the namespace, or None with ``truncate`` to truncate the whole namespace
+    :param keys: keys to delete
+    :param truncate: truncate the set instead of deleting ``keys``
+    :param truncate_before: with ``truncate``, only remove the records last updated before this datetime,
+        ISO 8601 string or unix timestamp. Defaults to the time of the call
+    :param policy: batch remove policy applied to each record, or info policy of the truncate call
+    :param batch_policy: policy of the batch calls
+    :param chunk_size: maximum number of keys per batch
+    :param max_concurrency: maximum number of batches in flight at once
+    :param aerospike_conn_id: aerospike connection to use, defaults to 'aerospike_default'
+    """
+
+    template_fields: Sequence[str] = ("keys", "truncate_before",)
+    template_ext: Sequence[str] = ()
+    ui_color = "#66c3ff"
+
+    def __init__(
+        self,
+        namespace: str,
+        set: Optional[str],
+        keys: Optional[List[Any]] = None,
+        truncate: bool = False,
+        truncate_before: Optional[Union[datetime, str, int, float]] = None,
+        policy: Optional[Dict[str, Any]] = None,
+        batch_policy: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 1000,
+        max_concurrency: int = 4,
+        aerospike_conn_id: str = "aerospike_default",
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        if truncate == (keys is not None):
+            raise ValueError("Expecting either 'keys' or 'truncate=True'")
+        if truncate_before is not None and not truncate:
+            raise ValueError("'truncate_before' requires 'truncate=True'")
+        self.namespace = namespace
+        self.set = set
+        self.keys = keys
+        self.truncate = truncate
+        self.truncate_before = truncate_before
+        self.policy = policy
+        self.batch_policy = batch_policy
+        self.chunk_size = chunk_size
+        self.max_concurrency = max_concurrency
+        self.aerospike_conn_id = aerospike_conn_id
+
+    def execute(self, context: Context) -> Optional[Dict[str, Any]]:
+        with AerospikeHook(self.aerospike_conn_id) as hook:
+            if self.truncate:
+                self.log.info('Truncating %s.%s before %s', self.namespace, self.set, self.truncate_before or 'now')
+                hook.truncate(namespace=self.namespace, set=self.set, before=self.truncate_before or None, policy=self.policy)
+                return None
+
+            self.log.info('Deleting %s keys from %s.%s', len(self.keys), self.namespace, self.set)
+            result = hook.remove_many(
+                namespace=self.namespace,
+                set=self.set,
+                keys=self.keys,
+                policy=self.policy,
+                batch_policy=self.batch_policy,
+                chunk_size=self.chunk_size,
+                max_concurrency=self.max_concurrency,
+            )
+            self.log.info('Deleted %s keys, %s missing, %s failed', result['removed'], result['missing'], result['failed'])
+            if result['errors']:
+                self.log.warning('Failed keys by result code: %s', result['errors'])
+            return result
+
+
+class AerospikeKeyShardOperator(BaseOperator):
+    """
+    Split a list of keys into shards of keys stored close together, to fan out with ``.expand()``.
+
+    Key digests and partition ids are computed locally. With ``by="partition"`` each shard covers a contiguous
+    range of partitions; with ``by="node"`` the keys of one node always land in the same shard, so every mapped
+    task sends dense batches to few nodes. Only ``by="node"`` connects to the cluster, to read the partition map.
+    For example::
+
+        shards = AerospikeKeyShardOperator(task_id="shard", namespace="ns", set="set", keys=keys, num_shards=8)
+        AerospikeGetKeyOperator.partial(task_id="get", namespace="ns", set="set").expand(key=shards.output)
+
+    :param namespace: namespace to use in aerospike db
+    :param set: set name in the namespace
+    :param keys: keys to split
+    :param num_shards: maximum number of shards, empty shards are not returned
+    :param by: ``partition`` or ``node``
+    :param aerospike_conn_id: aerospike connection to use, defaults to 'aerospike_default'
+    """
+
+    template_fields: Sequence[str] = ("keys", "num_shards",)
+    template_ext: Sequence[str] = ()
+    ui_color = "#66c3ff"
+
+    def __init__(
+        self,
+        namespace: str,
+        set: str,
+        keys: List[Any],
+        num_shards: int,
+        by: str = "partition",
+        aerospike_conn_id: str = "aerospike_default",
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        if by not in ("partition", "node"):
+            raise ValueError(f"Expecting 'partition' or 'node', got: {by}")
+        self.namespace = namespace
+        self.set = set
+        self.keys = keys
+        self.num_shards = num_shards
+        self.by = by
+        self.aerospike_conn_id = aerospike_conn_id
+
+    def execute(self, context: Context) -> List[List[Any]]:
+        hook = AerospikeHook(self.aerospike_conn_id)
+        if self.by == "node":
+            with hook:
+                shards = hook.shard_keys(self.namespace, self.set, self.keys, int(self.num_shards), by=self.by)
+        else:
+            shards = hook.shard_keys(self.namespace, self.set, self.keys, int(self.num_shards), by=self.by)
+        self.log.info('Split %s keys into %s shards of %s keys', len(self.keys), len(shards), [len(shard) for shard in shards])
+        return shards
 
 
 class AerospikeGetKeyOperator(BaseOperator):
@@ -83,6 +493,18 @@ class AerospikeGetKeyOperator(BaseOperator):
     :param key: key to get and return. can be a single key or a list of keys
     :param policy: which policy the key should be saved with. default `POLICY_KEY_SEND`
     :param aerospike_conn_id: aerospike connection to use, defaults to 'aerospike_default'
+    :param chunk_size: maximum number of keys per batch read when fetching a list of keys
+    :param max_concurrency: maximum number of batch reads in flight at once
+    :param chunk_retries: how many times a batch read failing with a transient error is retried
+    :param bins: only fetch these bins, defaults to all bins
+    :param expression: Aerospike filter expression (`aerospike_helpers.expressions`) evaluated on the server,
+        records that do not match (or do not exist) are skipped
+    :param hedge_after: seconds after which a batch read still running is sent again to any replica,
+        the first answer being used. Defaults to no hedging
+    :param output_format: ``dict`` (default) returns one dict per record. ``columnar`` returns a single dict with
+        the namespace and set, a list of keys, one list per metadata field and one list per bin, which is much
+        smaller in XCom for large batches. For example:
+        `{"namespace": "ns", "set": "set", "keys": ["k1", "k2"], "metadata": {"gen": [1, None], "ttl": [0, None]}, "bins": {"bin": [1, None]}}`
     """
 
     template_fields: Sequence[str] = ("key",)
@@ -94,22 +516,55 @@ class AerospikeGetKeyOperator(BaseOperator):
         namespace: str,
         set: str,
         key: Union[List[str], str],
-        policy: dict = {'key': aerospike.POLICY_KEY_SEND},
+        policy: Optional[dict] = None,
         aerospike_conn_id: str = "aerospike_default",
+        chunk_size: int = 5000,
+        max_concurrency: int = 4,
+        chunk_retries: int = 2,
+        bins: Optional[List[str]] = None,
+        expression: Any = None,
+        output_format: str = "dict",
+        hedge_after: Optional[float] = None,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
+        if output_format not in ("dict", "columnar"):
+            raise ValueError(f"Expecting 'dict' or 'columnar' output_format, got: {output_format}")
         self.key = key
         self.namespace = namespace
         self.set = set
         self.key = key
         self.policy = policy
         self.aerospike_conn_id = aerospike_conn_id
+        self.chunk_size = chunk_size
+        self.max_concurrency = max_concurrency
+        self.chunk_retries = chunk_retries
+        self.bins = bins
+        self.expression = expression
+        self.output_format = output_format
+        self.hedge_after = hedge_after
 
-    def execute(self, context: Context) -> list:
+    def execute(self, context: Context) -> Union[list, dict]:
         with AerospikeHook(self.aerospike_conn_id) as hook:
             self.log.info('Fetching key')
-            records = hook.get_record(key=self.key, namespace=self.namespace, set=self.set, policy=self.policy)
+            records = hook.get_record(
+                key=self.key,
+                namespace=self.namespace,
+                set=self.set,
+                policy=default_key_policy(self.policy, "POLICY_KEY_SEND"),
+                chunk_size=self.chunk_size,
+                max_concurrency=self.max_concurrency,
+                chunk_retries=self.chunk_retries,
+                bins=self.bins,
+                expression=self.expression,
+                hedge_after=self.hedge_after,
+            )
+            if self.expression is not None:
+                records = [record for record in (records if isinstance(records, list) else [records]) if record[1] is not None]
+            if self.output_format == "columnar":
+                columns = self.create_columns_from_records(records if isinstance(records, list) else [records])
+                self.log.info('Got %s records', len(columns["keys"]))
+                return columns
             parsed_records = self.parse_records(records=records)
             self.log.info('Got %s records', len(parsed_records))
             return parsed_records
@@ -124,6 +579,30 @@ class AerospikeGetKeyOperator(BaseOperator):
             raise ValueError(f"Expecting 'list' or 'tuple', got: {type(records)}")
         return data
 
+    def create_columns_from_records(self, records: List[tuple]) -> dict:
+        """Build the ``columnar`` output: missing records and bins are None, bytes are base64 encoded."""
+        bin_names: Dict[str, None] = {}
+        for record in records:
+            if len(record) > 2 and record[2]:
+                bin_names.update(dict.fromkeys(record[2]))
+        empty: dict = {}
+        return {
+            "namespace": self.namespace,
+            "set": self.set,
+            "keys": [to_serializable(record[0][2]) for record in records],
+            "metadata": {
+                field: [(record[1] or empty).get(field) for record in records]
+                for field in ("gen", "ttl")
+            },
+            "bins": {
+                name: [
+                    to_serializable((record[2] or empty).get(name)) if len(record) > 2 else None
+                    for record in records
+                ]
+                for name in bin_names
+            },
+        }
+
     @staticmethod
     def create_dict_from_record(record: tuple) -> dict:
         try:
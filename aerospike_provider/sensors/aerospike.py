@@ -18,27 +18,72 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Sequence, Union, List
+import base64
+import hashlib
+import math
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Sequence, Set, Union, List, Dict, Optional
 
 if TYPE_CHECKING:
     from airflow.utils.context import Context
 
-import aerospike
-from aerospike_provider.hooks.aerospike import AerospikeHook
-from airflow.sensors.base import BaseSensorOperator
+from aerospike_provider.hooks.aerospike import AerospikeHook, default_key_policy
+from aerospike_provider.triggers.aerospike import AerospikeKeyTrigger
+from airflow.configuration import conf
+from airflow.exceptions import (
+    AirflowException,
+    AirflowRescheduleException,
+    AirflowSensorTimeout,
+    AirflowSkipException,
+    TaskDeferred,
+)
+from airflow.models import Variable
+from airflow.sensors.base import BaseSensorOperator, PokeReturnValue
+
+
+def encode_indices(indices: Set[int], size: int) -> str:
+    """Encode a set of indices below ``size`` as a base64 bitmap."""
+    bitmap = bytearray((size + 7) // 8)
+    for i in indices:
+        bitmap[i >> 3] |= 1 << (i & 7)
+    return base64.b64encode(bytes(bitmap)).decode("ascii")
+
+
+def decode_indices(encoded: str) -> Set[int]:
+    """Decode a bitmap produced by :func:`encode_indices`."""
+    bitmap = base64.b64decode(encoded)
+    return {(byte_index << 3) + bit for byte_index, byte in enumerate(bitmap) if byte for bit in range(8) if byte >> bit & 1}
 
 
 class AerospikeKeySensor(BaseSensorOperator):
     """
     Check if a key or a set of keys exists in Aerospike given key(s).
     If the key is not found, it will return False.
-    When sending multiple keys, the sensor expectes them all for a successful poke.
+    When sending multiple keys, the sensor expectes them all for a successful poke,
+    unless ``min_count`` and/or ``min_fraction`` lower the number of keys required.
+
+    Keys found by a poke are remembered, so later pokes only check the keys that are still missing.
+    In ``reschedule`` mode the sensor instance does not survive between pokes: set ``persist_state`` to keep
+    the found keys in an Airflow Variable (a compact bitmap). The Variable is removed when the sensor succeeds,
+    times out or fails, but not when the task is killed without running its cleanup: leftover
+    ``aerospike_key_sensor__*`` Variables can then be deleted safely.
+
+    Missing keys are checked in ``chunk_size`` batches and a poke stops as soon as the required number of keys is
+    reached, or can no longer be reached by the keys left to check. With ``push_found_keys`` the remaining chunks are
+    still checked once the required number is reached, so the pushed list holds every key that exists.
 
     :param aerospike_conn_id: aerospike connection to use, defaults to 'aerospike_default'
     :param key: key to search. can be a single key or a list of keys
     :param namespace: namespace to use in aerospike db
     :param set: set name in the namespace
     :param policy: which policy the key should be saved with. default `POLICY_KEY_SEND`
+    :param deferrable: wait for the keys in the triggerer (see :class:`AerospikeKeyTrigger`) instead of holding a worker slot
+    :param persist_state: keep the keys found so far in an Airflow Variable between rescheduled pokes
+    :param min_count: succeed once at least this many keys exist
+    :param min_fraction: succeed once at least this fraction (0 to 1) of the keys exist
+    :param chunk_size: number of keys checked per `exists_many` call
+    :param push_found_keys: return (and push to XCom) the list of all the keys that exist when the sensor succeeds
     """
 
     template_fields: Sequence[str] = ("key",)
@@ -50,17 +95,45 @@ class AerospikeKeySensor(BaseSensorOperator):
         namespace: str,
         set: str,
         key: Union[List[str], str],
-        policy: dict = {'key': aerospike.POLICY_KEY_SEND},
+        policy: Optional[dict] = None,
         aerospike_conn_id: str = "aerospike_default",
+        deferrable: bool = conf.getboolean("operators", "default_deferrable", fallback=False),
+        persist_state: bool = False,
+        min_count: Optional[int] = None,
+        min_fraction: Optional[float] = None,
+        chunk_size: int = 5000,
+        push_found_keys: bool = False,
         **kwargs: Any,
     ) -> None:
         super().__init__(**kwargs)
+        if min_fraction is not None and not 0 <= min_fraction <= 1:
+            raise ValueError(f"Expecting min_fraction between 0 and 1, got: {min_fraction}")
         self.key = key
         self.namespace = namespace
         self.set = set
         self.key = key
         self.policy = policy
         self.aerospike_conn_id = aerospike_conn_id
+        self.deferrable = deferrable
+        self.persist_state = persist_state
+        self.min_count = min_count
+        self.min_fraction = min_fraction
+        self.chunk_size = chunk_size
+        self.push_found_keys = push_found_keys
+        self._found_keys: Optional[Set[int]] = None
+
+    @property
+    def required_count(self) -> int:
+        """Number of keys that should exist for the sensor to succeed."""
+        total = len(self.key) if isinstance(self.key, list) else 1
+        if self.min_count is None and self.min_fraction is None:
+            return total
+        required = 0
+        if self.min_count is not None:
+            required = max(required, self.min_count)
+        if self.min_fraction is not None:
+            required = max(required, math.ceil(self.min_fraction * total))
+        return min(required, total)
 
     def parse_records(self, records: Union[List, tuple]) -> bool:
         if isinstance(records, list):
@@ -71,9 +144,126 @@ class AerospikeKeySensor(BaseSensorOperator):
             raise ValueError(f"Expecting 'list' or 'tuple', got: {type(records)}")
         return metadata
 
-    def poke(self, context: Context) -> bool:
+    def poke(self, context: Context) -> Union[bool, PokeReturnValue]:
 
+        policy = default_key_policy(self.policy, "POLICY_KEY_SEND")
         with AerospikeHook(self.aerospike_conn_id) as hook:
-            self.log.info('Poking %s keys', len(self.key))
-            records = hook.exists(namespace=self.namespace, set=self.set, key=self.key, policy=self.policy)
-            return self.parse_records(records=records)
+            if not isinstance(self.key, list):
+                self.log.info('Poking %s keys', 1)
+                records = hook.exists(namespace=self.namespace, set=self.set, key=self.key, policy=policy)
+                return self.parse_records(records=records)
+
+            found = self._load_found_keys(context)
+            required = self.required_count
+            missing = [i for i in range(len(self.key)) if i not in found]
+            self.log.info('Poking %s missing keys, %s of %s keys required', len(missing), required, len(self.key))
+            newly_found: Set[int] = set()
+            for start in range(0, len(missing), self.chunk_size):
+                if len(found) >= required and not self.push_found_keys:
+                    break
+                if len(found) + len(missing) - start < required:
+                    self.log.info('Not enough keys left to check to reach %s keys', required)
+                    break
+                chunk = missing[start:start + self.chunk_size]
+                records = hook.exists(namespace=self.namespace, set=self.set, key=[self.key[i] for i in chunk], policy=policy)
+                chunk_found = {i for i, record in zip(chunk, records) if record[1]}
+                newly_found |= chunk_found
+                found |= chunk_found
+            self.log.info('Found %s/%s keys', len(found), len(self.key))
+            done = len(found) >= required
+            if newly_found or done:
+                self._save_found_keys(context, found, done)
+            if done and self.push_found_keys:
+                return PokeReturnValue(is_done=True, xcom_value=[self.key[i] for i in sorted(found)])
+            return done
+
+    def _state_variable_name(self, context: Context) -> str:
+        ti = context["ti"]
+        return f"aerospike_key_sensor__{ti.dag_id}__{ti.task_id}__{ti.run_id}__{ti.map_index}"
+
+    def _keys_fingerprint(self) -> str:
+        return hashlib.sha1("\0".join(map(str, self.key)).encode()).hexdigest()
+
+    def _load_found_keys(self, context: Context) -> Set[int]:
+        if self._found_keys is None:
+            self._found_keys = set()
+            if self.persist_state:
+                state = Variable.get(self._state_variable_name(context), default_var=None, deserialize_json=True)
+                if state and state.get("fingerprint") == self._keys_fingerprint():
+                    self._found_keys = decode_indices(state["found"])
+        return self._found_keys
+
+    def _save_found_keys(self, context: Context, found: Set[int], done: bool) -> None:
+        if not self.persist_state:
+            return
+        name = self._state_variable_name(context)
+        if done:
+            Variable.delete(name)
+        else:
+            Variable.set(name, {"fingerprint": self._keys_fingerprint(), "found": encode_indices(found, len(self.key))}, serialize_json=True)
+
+    def _delete_found_keys(self, context: Context) -> None:
+        if self.persist_state and isinstance(self.key, list):
+            Variable.delete(self._state_variable_name(context))
+
+    def execute(self, context: Context) -> Any:
+        try:
+            return self._execute(context)
+        except (AirflowRescheduleException, TaskDeferred):
+            raise
+        except BaseException:
+            # Timed out, failed or killed: the state of this try is not needed anymore.
+            self._delete_found_keys(context)
+            raise
+
+    def _execute(self, context: Context) -> Any:
+        if not self.deferrable:
+            return super().execute(context=context)
+        poke_return = self.poke(context=context)
+        if poke_return:
+            return poke_return.xcom_value if isinstance(poke_return, PokeReturnValue) else None
+        keys, min_count, found_keys = self.key, self.required_count, None
+        if isinstance(self.key, list):
+            # The trigger only waits for the keys the first poke did not find.
+            found = self._found_keys or set()
+            keys = [key for i, key in enumerate(self.key) if i not in found]
+            min_count -= len(found)
+            if self.push_found_keys:
+                found_keys = [self.key[i] for i in sorted(found)]
+        self.defer(
+            trigger=AerospikeKeyTrigger(
+                namespace=self.namespace,
+                set=self.set,
+                key=keys,
+                policy=default_key_policy(self.policy, "POLICY_KEY_SEND"),
+                aerospike_conn_id=self.aerospike_conn_id,
+                poke_interval=self.poke_interval,
+                end_time=time.time() + self.timeout,
+                min_count=min_count,
+                return_found_keys=self.push_found_keys,
+            ),
+            method_name="execute_complete",
+            kwargs={"found_keys": found_keys} if found_keys else None,
+            timeout=timedelta(seconds=self.timeout),
+        )
+
+    def execute_complete(
+        self, context: Context, event: Dict[str, Any], found_keys: Optional[List[str]] = None
+    ) -> Optional[List[str]]:
+        """
+        Resume the sensor after the trigger fired.
+
+        :param found_keys: keys found by the first poke, before deferring (with ``push_found_keys``)
+        """
+        self._delete_found_keys(context)
+        if event["status"] == "success":
+            self.log.info(event["message"])
+            if event.get("found_keys") is None or not found_keys:
+                return event.get("found_keys")
+            found = set(found_keys) | set(event["found_keys"])
+            return [key for key in self.key if key in found]
+        if event["status"] == "timeout":
+            if self.soft_fail:
+                raise AirflowSkipException(event["message"])
+            raise AirflowSensorTimeout(event["message"])
+        raise AirflowException(event["message"])
@@ -0,0 +1,312 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    from airflow.utils.context import Context
+
+from aerospike_provider.hooks.aerospike import AerospikeHook
+from aerospike_provider.utils.checkpoint import PartitionCheckpoint
+from aerospike_provider.utils.partitions import partition_ranges
+from aerospike_provider.utils.rate_limit import TokenBucket
+from airflow.exceptions import AirflowException
+from airflow.models.baseoperator import BaseOperator
+
+# The remaining ttl the client reports for records that never expire.
+NEVER_EXPIRES_TTL = 0xFFFFFFFF
+
+
+def iter_partition_range(
+    hook: AerospikeHook,
+    namespace: str,
+    set: Optional[str],
+    begin: int,
+    count: int,
+    bins: Optional[List[str]] = None,
+    policy: Optional[Dict[str, Any]] = None,
+    buffer_size: int = 10000,
+) -> Iterator[tuple]:
+    """
+    Iterate over the records of the partitions ``[begin, begin + count)``.
+
+    The scan runs in a background thread filling a queue of ``buffer_size`` records, so the records can be
+    consumed at the pace of the writes without holding the partitions in memory.
+    """
+    records: queue.Queue = queue.Queue(maxsize=buffer_size)
+    done = object()
+    stop = threading.Event()
+    errors: List[BaseException] = []
+
+    def put(record: tuple) -> bool:
+        while not stop.is_set():
+            try:
+                records.put(record, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def scan() -> None:
+        try:
+            hook.foreach(
+                namespace=namespace,
+                set=set,
+                callback=put,
+                bins=bins,
+                policy=policy,
+                partition_filter={"begin": begin, "count": count},
+            )
+        except BaseException as e:
+            errors.append(e)
+        finally:
+            put(done)
+
+    thread = threading.Thread(target=scan, name=f"aerospike-scan-{begin}", daemon=True)
+    thread.start()
+    try:
+        while True:
+            record = records.get()
+            if record is done:
+                break
+            yield record
+    finally:
+        stop.set()
+        thread.join()
+    if errors:
+        raise errors[0]
+
+
+def copy_partition_range(
+    aerospike_conn_id: str,
+    namespace: str,
+    set: Optional[str],
+    begin: int,
+    count: int,
+    destination_conn_id: str,
+    destination_namespace: str,
+    destination_set: Optional[str],
+    bin_mapping: Optional[Dict[str, Optional[str]]] = None,
+    ttl: Optional[int] = None,
+    bins: Optional[List[str]] = None,
+    policy: Optional[Dict[str, Any]] = None,
+    write_policy: Optional[Dict[str, Any]] = None,
+    batch_policy: Optional[Dict[str, Any]] = None,
+    chunk_size: int = 1000,
+    max_concurrency: int = 4,
+    records_per_second: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Copy the partitions ``[begin, begin + count)``, see :meth:`AerospikeHook.parallel_partition_scan`."""
+    counts = {"read": 0, "skipped": 0}
+    rename_set = (destination_namespace, destination_set) != (namespace, set)
+
+    def to_records(records: Iterator[tuple]) -> Iterator[tuple]:
+        pacing = TokenBucket(records_per_second, burst=1) if records_per_second else None
+        for key, metadata, record_bins in records:
+            counts["read"] += 1
+            if pacing:
+                pacing.acquire()
+            if key[2] is None and rename_set:
+                # The digest depends on the set name, without the user key it cannot be computed for the destination.
+                counts["skipped"] += 1
+                continue
+            if bin_mapping:
+                record_bins = {
+                    bin_mapping.get(name, name): value
+                    for name, value in record_bins.items()
+                    if bin_mapping.get(name, name) is not None
+                }
+            if not record_bins:
+                counts["skipped"] += 1
+                continue
+            record_ttl = ttl
+            if record_ttl is None:
+                record_ttl = metadata.get("ttl")
+                record_ttl = -1 if record_ttl == NEVER_EXPIRES_TTL else record_ttl
+            if key[2] is None:
+                destination_key = (destination_namespace, destination_set, None, key[3])
+            else:
+                destination_key = key[2]
+            yield destination_key, record_bins, {"ttl": record_ttl}
+
+    with AerospikeHook(aerospike_conn_id) as source, AerospikeHook(destination_conn_id) as destination:
+        result = destination.put_many(
+            records=to_records(iter_partition_range(
+                source, namespace, set, begin, count, bins=bins, policy=policy, buffer_size=chunk_size * max_concurrency
+            )),
+            namespace=destination_namespace,
+            set=destination_set,
+            policy=write_policy,
+            batch_policy=batch_policy,
+            chunk_size=chunk_size,
+            max_concurrency=max_concurrency,
+        )
+    return {**counts, **result}
+
+
+class AerospikeToAerospikeOperator(BaseOperator):
+    """
+    Copy the records of a namespace/set to another set, namespace or cluster.
+
+    The source is scanned by partition ranges on ``num_workers`` processes, each writing its records to the
+    destination with chunked, pipelined batch writes. Records keep their remaining ttl unless ``ttl`` is set.
+
+    The destination key is computed from the user key, so records stored without their user key
+    (the default `POLICY_KEY_DIGEST`) can only be copied to the same namespace and set of another cluster;
+    they are skipped otherwise. Pass `write_policy={"key": aerospike.POLICY_KEY_SEND}` to store the user keys
+    in the destination.
+
+    With ``checkpoint_path`` every completed partition range is recorded in a local checkpoint file, so a retry
+    of the task only copies the ranges that did not complete.
+
+    :param namespace: namespace of the source records
+    :param set: set of the source records, or None to copy the whole namespace
+    :param destination_namespace: namespace the records are written to, defaults to ``namespace``
+    :param destination_set: set the records are written to, defaults to ``set``
+    :param bin_mapping: bins to rename, e.g. `{"old": "new"}`. A bin mapped to None is not copied
+    :param ttl: ttl of the copied records, defaults to their remaining ttl
+    :param bins: only copy these bins, defaults to all bins
+    :param policy: query policy of the scan
+    :param write_policy: batch write policy applied to each record
+    :param batch_policy: policy of the batch writes
+    :param chunk_size: maximum number of records per batch write
+    :param max_concurrency: maximum number of batch writes in flight per worker
+    :param records_per_second: maximum number of records copied per second, across all workers
+    :param num_workers: number of processes copying partition ranges in parallel
+    :param num_ranges: number of partition ranges the scan is split into
+    :param checkpoint_path: local file recording completed partition ranges, to resume the copy on retry
+    :param aerospike_conn_id: aerospike connection of the source, defaults to 'aerospike_default'
+    :param destination_conn_id: aerospike connection of the destination, defaults to ``aerospike_conn_id``
+    """
+
+    template_fields: Sequence[str] = ("namespace", "set", "destination_namespace", "destination_set", "checkpoint_path")
+    template_ext: Sequence[str] = ()
+    ui_color = "#66c3ff"
+
+    def __init__(
+        self,
+        namespace: str,
+        set: Optional[str],
+        destination_namespace: Optional[str] = None,
+        destination_set: Optional[str] = None,
+        bin_mapping: Optional[Dict[str, Optional[str]]] = None,
+        ttl: Optional[int] = None,
+        bins: Optional[List[str]] = None,
+        policy: Optional[Dict[str, Any]] = None,
+        write_policy: Optional[Dict[str, Any]] = None,
+        batch_policy: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 1000,
+        max_concurrency: int = 4,
+        records_per_second: Optional[float] = None,
+        num_workers: int = 1,
+        num_ranges: int = 64,
+        checkpoint_path: Optional[str] = None,
+        aerospike_conn_id: str = "aerospike_default",
+        destination_conn_id: Optional[str] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.namespace = namespace
+        self.set = set
+        self.destination_namespace = destination_namespace or namespace
+        self.destination_set = destination_set if destination_set is not None else set
+        self.bin_mapping = bin_mapping
+        self.ttl = ttl
+        self.bins = bins
+        self.policy = policy
+        self.write_policy = write_policy
+        self.batch_policy = batch_policy
+        self.chunk_size = chunk_size
+        self.max_concurrency = max_concurrency
+        self.records_per_second = records_per_second
+        self.num_workers = num_workers
+        self.num_ranges = num_ranges
+        self.checkpoint_path = checkpoint_path
+        self.aerospike_conn_id = aerospike_conn_id
+        self.destination_conn_id = destination_conn_id or aerospike_conn_id
+
+    def execute(self, context: Context) -> Dict[str, Any]:
+        if (self.destination_conn_id, self.destination_namespace, self.destination_set) == (
+            self.aerospike_conn_id, self.namespace, self.set
+        ):
+            raise AirflowException("The source and the destination of the copy are the same")
+
+        ranges = partition_ranges(self.num_ranges)
+        checkpoint = None
+        pending = ranges
+        if self.checkpoint_path:
+            checkpoint = PartitionCheckpoint(
+                self.checkpoint_path,
+                fingerprint={
+                    "source": [self.aerospike_conn_id, self.namespace, self.set],
+                    "destination": [self.destination_conn_id, self.destination_namespace, self.destination_set],
+                    "num_ranges": self.num_ranges,
+                },
+            )
+            pending = [r for r in ranges if not checkpoint.is_done(*r)]
+            self.log.info('%s of %s partition ranges left to copy', len(pending), len(ranges))
+
+        started = time.monotonic()
+        hook = AerospikeHook(self.aerospike_conn_id)
+        results = hook.parallel_partition_scan(
+            worker=copy_partition_range,
+            namespace=self.namespace,
+            set=self.set,
+            num_workers=self.num_workers,
+            worker_kwargs={
+                "destination_conn_id": self.destination_conn_id,
+                "destination_namespace": self.destination_namespace,
+                "destination_set": self.destination_set,
+                "bin_mapping": self.bin_mapping,
+                "ttl": self.ttl,
+                "bins": self.bins,
+                "policy": self.policy,
+                "write_policy": self.write_policy,
+                "batch_policy": self.batch_policy,
+                "chunk_size": self.chunk_size,
+                "max_concurrency": self.max_concurrency,
+                "records_per_second": self.records_per_second / max(self.num_workers, 1) if self.records_per_second else None,
+            },
+            ranges=pending,
+            on_result=checkpoint.mark_done if checkpoint else None,
+        )
+        seconds = time.monotonic() - started
+
+        results_by_range = dict(zip(pending, results))
+        totals: Dict[str, Any] = {"read": 0, "written": 0, "skipped": 0, "failed": 0, "errors": {}}
+        for r in ranges:
+            result = results_by_range[r] if r in results_by_range else checkpoint.get(*r)
+            for name in ("read", "written", "skipped", "failed"):
+                totals[name] += result[name]
+            for code, count in result["errors"].items():
+                totals["errors"][code] = totals["errors"].get(code, 0) + count
+        if checkpoint:
+            checkpoint.clear()
+        totals["seconds"] = round(seconds, 3)
+        totals["records_per_second"] = round(totals["written"] / seconds, 1) if seconds else None
+        self.log.info(
+            'Copied %s of %s records in %.1fs (%s records/s), %s skipped, %s failed',
+            totals["written"], totals["read"], seconds, totals["records_per_second"], totals["skipped"], totals["failed"],
+        )
+        if totals["errors"]:
+            self.log.warning('Failed records by result code: %s', totals["errors"])
+        return totals
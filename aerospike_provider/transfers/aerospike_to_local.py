@@ -0,0 +1,224 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Union
+
+if TYPE_CHECKING:
+    from airflow.utils.context import Context
+
+from aerospike_provider.hooks.aerospike import AerospikeHook
+from aerospike_provider.utils.checkpoint import PartitionCheckpoint
+from aerospike_provider.utils.file_formats import RotatingFileWriter
+from aerospike_provider.utils.partitions import partition_ranges
+from aerospike_provider.utils.timestamps import to_nanoseconds
+from airflow.exceptions import AirflowException
+from airflow.models.baseoperator import BaseOperator
+from airflow.utils import timezone
+
+
+def export_partition_range(
+    aerospike_conn_id: str,
+    namespace: str,
+    set: Optional[str],
+    begin: int,
+    count: int,
+    output_dir: str,
+    file_prefix: str,
+    file_format: str,
+    max_records_per_file: int,
+    bins: Optional[List[str]] = None,
+    policy: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """Export the partitions ``[begin, begin + count)`` to their own files, see :meth:`AerospikeHook.parallel_partition_scan`."""
+    writer = RotatingFileWriter(
+        output_dir=output_dir,
+        prefix=f"{file_prefix}-p{begin:04d}",
+        file_format=file_format,
+        max_records_per_file=max_records_per_file,
+    )
+    with AerospikeHook(aerospike_conn_id) as hook, writer:
+        hook.foreach(
+            namespace=namespace,
+            set=set,
+            callback=writer.write,
+            bins=bins,
+            policy=policy,
+            partition_filter={"begin": begin, "count": count},
+        )
+    return writer.files
+
+
+class AerospikeToLocalFilesystemOperator(BaseOperator):
+    """
+    Export a namespace/set to local JSONL, CSV or Parquet files.
+
+    Records are streamed from a scan into rotating files, so memory use does not depend on the size of the set.
+    Only the file paths and row counts are returned (and pushed to XCom).
+
+    With ``num_workers > 1`` the scan is split into partition ranges exported by a pool of processes,
+    each with its own client and its own files.
+
+    With ``checkpoint_path`` every completed partition range is recorded in a local checkpoint file, so a retry
+    of the task only exports the ranges that did not complete. The file is removed once the export succeeds.
+
+    Sets are schemaless: the CSV columns are taken from the first record of each file, and the Parquet schema from
+    the bins of the first row group. Bins of later records missing from them are not dropped but written, as a JSON
+    object, to the ``_extra`` column (empty when every bin has its column), like the bins named ``key``, ``digest``,
+    ``gen``, ``ttl`` or ``_extra``, which would clash with the key and metadata columns. In Parquet files, a bin whose values
+    have different types in the first row group is written as strings, and later values not matching the type of
+    their column also go to ``_extra``.
+
+    ``modified_after`` turns the export into an incremental one: only records updated after it are exported.
+    The returned ``watermark`` (the time the export started) can be passed as ``modified_after`` of the next run,
+    e.g. ``"{{ ti.xcom_pull(task_ids='export', include_prior_dates=True)['watermark'] }}"``.
+
+    :param namespace: namespace to use in aerospike db
+    :param set: set name in the namespace, or None to export the whole namespace
+    :param output_dir: local directory the files are written to
+    :param file_format: one of ``jsonl``, ``csv`` or ``parquet`` (requires pyarrow)
+    :param max_records_per_file: number of records after which a new file is started
+    :param file_prefix: file name prefix, defaults to the set name
+    :param bins: only export these bins, defaults to all bins
+    :param policy: query policy of the scan
+    :param num_workers: number of processes scanning partition ranges in parallel
+    :param num_ranges: number of partition ranges the scan is split into when running in parallel or with a checkpoint
+    :param checkpoint_path: local file recording completed partition ranges, to resume the export on retry
+    :param modified_after: only export records updated after this datetime, ISO 8601 string or unix timestamp
+    :param aerospike_conn_id: aerospike connection to use, defaults to 'aerospike_default'
+    """
+
+    template_fields: Sequence[str] = ("output_dir", "file_prefix", "checkpoint_path", "modified_after")
+    template_ext: Sequence[str] = ()
+    ui_color = "#66c3ff"
+
+    def __init__(
+        self,
+        namespace: str,
+        set: Optional[str],
+        output_dir: str,
+        file_format: str = "jsonl",
+        max_records_per_file: int = 1000000,
+        file_prefix: Optional[str] = None,
+        bins: Optional[List[str]] = None,
+        policy: Optional[Dict[str, Any]] = None,
+        num_workers: int = 1,
+        num_ranges: int = 64,
+        checkpoint_path: Optional[str] = None,
+        modified_after: Optional[Union[datetime, str, int, float]] = None,
+        aerospike_conn_id: str = "aerospike_default",
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.namespace = namespace
+        self.set = set
+        self.output_dir = output_dir
+        self.file_format = file_format
+        self.max_records_per_file = max_records_per_file
+        self.file_prefix = file_prefix or set or namespace
+        self.bins = bins
+        self.policy = policy
+        self.num_workers = num_workers
+        self.num_ranges = num_ranges
+        self.checkpoint_path = checkpoint_path
+        self.modified_after = modified_after
+        self.aerospike_conn_id = aerospike_conn_id
+
+    def _scan_policy(self) -> Optional[Dict[str, Any]]:
+        if self.modified_after in (None, ""):
+            return self.policy
+        policy = dict(self.policy or {})
+        if "expressions" in policy:
+            raise AirflowException("'modified_after' cannot be combined with a policy that already has 'expressions'")
+        from aerospike_helpers import expressions as exp
+
+        policy["expressions"] = exp.GT(exp.LastUpdateTime(), to_nanoseconds(self.modified_after)).compile()
+        return policy
+
+    def execute(self, context: Context) -> Dict[str, Any]:
+        if self.num_workers > 1 or self.checkpoint_path:
+            return self._execute_ranges()
+        watermark = timezone.utcnow().isoformat()
+        writer = RotatingFileWriter(
+            output_dir=self.output_dir,
+            prefix=self.file_prefix,
+            file_format=self.file_format,
+            max_records_per_file=self.max_records_per_file,
+        )
+        with AerospikeHook(self.aerospike_conn_id) as hook, writer:
+            self.log.info('Exporting %s.%s to %s', self.namespace, self.set, self.output_dir)
+            hook.foreach(namespace=self.namespace, set=self.set, callback=writer.write, bins=self.bins, policy=self._scan_policy())
+        self.log.info('Exported %s records to %s files', writer.row_count, len(writer.files))
+        return {"files": [f["path"] for f in writer.files], "row_count": writer.row_count, "watermark": watermark}
+
+    def _execute_ranges(self) -> Dict[str, Any]:
+        ranges = partition_ranges(self.num_ranges)
+        checkpoint = None
+        if self.checkpoint_path:
+            checkpoint = PartitionCheckpoint(
+                self.checkpoint_path,
+                fingerprint={
+                    "namespace": self.namespace,
+                    "set": self.set,
+                    "output_dir": self.output_dir,
+                    "file_prefix": self.file_prefix,
+                    "file_format": self.file_format,
+                    "num_ranges": self.num_ranges,
+                    "modified_after": str(self.modified_after),
+                },
+            )
+            # A resumed export keeps the watermark of the first try, the ranges it already exported are not re-read.
+            watermark = checkpoint.get_extra("watermark")
+            if watermark is None:
+                watermark = timezone.utcnow().isoformat()
+                checkpoint.set_extra("watermark", watermark)
+            pending = [r for r in ranges if not checkpoint.is_done(*r)]
+            self.log.info('%s of %s partition ranges left to export', len(pending), len(ranges))
+        else:
+            watermark = timezone.utcnow().isoformat()
+            pending = ranges
+
+        hook = AerospikeHook(self.aerospike_conn_id)
+        results = hook.parallel_partition_scan(
+            worker=export_partition_range,
+            namespace=self.namespace,
+            set=self.set,
+            num_workers=self.num_workers,
+            worker_kwargs={
+                "output_dir": self.output_dir,
+                "file_prefix": self.file_prefix,
+                "file_format": self.file_format,
+                "max_records_per_file": self.max_records_per_file,
+                "bins": self.bins,
+                "policy": self._scan_policy(),
+            },
+            ranges=pending,
+            on_result=checkpoint.mark_done if checkpoint else None,
+        )
+        results_by_range = dict(zip(pending, results))
+        files = [
+            f
+            for r in ranges
+            for f in (results_by_range[r] if r in results_by_range else checkpoint.get(*r))
+        ]
+        row_count = sum(f["rows"] for f in files)
+        if checkpoint:
+            checkpoint.clear()
+        self.log.info('Exported %s records to %s files', row_count, len(files))
+        return {"files": [f["path"] for f in files], "row_count": row_count, "watermark": watermark}
@@ -0,0 +1,189 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+if TYPE_CHECKING:
+    from airflow.utils.context import Context
+
+from aerospike_provider.hooks.aerospike import AerospikeHook
+from aerospike_provider.utils.content_hash import DEFAULT_HASH_BIN, skip_ratio
+from aerospike_provider.utils.file_formats import file_format_from_path, iter_rows
+from airflow.models.baseoperator import BaseOperator
+
+
+class LocalFilesystemToAerospikeOperator(BaseOperator):
+    """
+    Load a local JSONL, CSV or Parquet file into Aerospike.
+
+    The file is streamed row by row into chunked, pipelined batch writes (see :meth:`AerospikeHook.put_many`),
+    so memory use does not depend on the size of the file.
+    Rows without a key or without any bin, invalid JSON lines and invalid ttl values are rejected and
+    counted instead of failing the load, as are the records the server refuses.
+
+    :param path: local file to load
+    :param namespace: namespace to use in aerospike db
+    :param set: set name in the namespace
+    :param key_column: column holding the record key
+    :param bin_columns: columns written as bins, defaults to all columns but ``key_column`` and ``ttl_column``.
+        Can be a dict to rename columns: `{"column": "bin"}`
+    :param ttl_column: column holding the ttl of each record
+    :param ttl: ttl of every record, when there is no ``ttl_column``. Defaults to the namespace default ttl
+    :param file_format: one of ``jsonl``, ``csv`` or ``parquet``, defaults to the file extension
+    :param policy: write policy applied to each record
+    :param batch_policy: policy of the batch calls
+    :param chunk_size: maximum number of records per batch write
+    :param max_concurrency: maximum number of batch writes in flight at once
+    :param aerospike_conn_id: aerospike connection to use, defaults to 'aerospike_default'
+    :param skip_unchanged: store a content hash of the bins in ``hash_bin`` and only write the records that changed,
+        so reloading a mostly unchanged file costs few writes. A skipped write does not reset the ttl
+    :param hash_bin: bin holding the content hash
+    """
+
+    template_fields: Sequence[str] = ("path", "namespace", "set",)
+    template_ext: Sequence[str] = ()
+    ui_color = "#66c3ff"
+
+    def __init__(
+        self,
+        path: str,
+        namespace: str,
+        set: str,
+        key_column: str = "key",
+        bin_columns: Optional[Union[List[str], Dict[str, str]]] = None,
+        ttl_column: Optional[str] = None,
+        ttl: Optional[int] = None,
+        file_format: Optional[str] = None,
+        policy: Optional[Dict[str, Any]] = None,
+        batch_policy: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 1000,
+        max_concurrency: int = 4,
+        aerospike_conn_id: str = "aerospike_default",
+        skip_unchanged: bool = False,
+        hash_bin: str = DEFAULT_HASH_BIN,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.path = path
+        self.namespace = namespace
+        self.set = set
+        self.key_column = key_column
+        self.bin_columns = bin_columns
+        self.ttl_column = ttl_column
+        self.ttl = ttl
+        self.file_format = file_format
+        self.policy = policy
+        self.batch_policy = batch_policy
+        self.chunk_size = chunk_size
+        self.max_concurrency = max_concurrency
+        self.aerospike_conn_id = aerospike_conn_id
+        self.skip_unchanged = skip_unchanged
+        self.hash_bin = hash_bin
+        self.rejected: Dict[str, int] = {}
+
+    def _reject(self, reason: str, row_number: int) -> None:
+        if not self.rejected.get(reason):
+            self.log.warning('Rejecting row %s: %s (only the first rejected row of each reason is logged)', row_number, reason)
+        self.rejected[reason] = self.rejected.get(reason, 0) + 1
+
+    def _bin_names(self, row: Dict[str, Any]) -> List[Tuple[str, str]]:
+        if isinstance(self.bin_columns, dict):
+            return list(self.bin_columns.items())
+        if self.bin_columns is not None:
+            return [(column, column) for column in self.bin_columns]
+        return [(column, column) for column in row if column not in (self.key_column, self.ttl_column)]
+
+    @staticmethod
+    def valid_key(key: Any) -> bool:
+        """Whether ``key`` can be an Aerospike user key: a string, bytes or a signed 64-bit integer."""
+        if isinstance(key, (str, bytes, bytearray)):
+            return True
+        return isinstance(key, int) and not isinstance(key, bool) and -2 ** 63 <= key < 2 ** 63
+
+    def iter_records(self, rows: Iterable[Dict[str, Any]]) -> Iterator[Tuple[Any, Dict[str, Any], Optional[Dict[str, Any]]]]:
+        """Map rows to ``(key, bins, metadata)`` records for :meth:`AerospikeHook.put_many`, rejecting invalid rows."""
+        metadata = {"ttl": int(self.ttl)} if self.ttl is not None else None
+        bin_names = None
+        for row_number, row in enumerate(rows, start=1):
+            key = row.get(self.key_column)
+            if key is None:
+                self._reject(f"missing '{self.key_column}' key column", row_number)
+                continue
+            if not self.valid_key(key):
+                # Rejected here, as the client would fail the whole batch with a ParamError.
+                self._reject(f"invalid '{self.key_column}' key column type", row_number)
+                continue
+            if bin_names is None or self.bin_columns is None:
+                bin_names = self._bin_names(row)
+            # A None bin would delete the bin, a missing value is not written instead.
+            bins = {name: row[column] for column, name in bin_names if row.get(column) is not None}
+            if not bins:
+                self._reject("no bins", row_number)
+                continue
+            record_metadata = metadata
+            if self.ttl_column is not None and row.get(self.ttl_column) is not None:
+                try:
+                    record_metadata = {"ttl": int(row[self.ttl_column])}
+                except (TypeError, ValueError):
+                    self._reject(f"invalid '{self.ttl_column}' ttl column", row_number)
+                    continue
+            yield key, bins, record_metadata
+
+    def execute(self, context: Context) -> Dict[str, Any]:
+        file_format = self.file_format or file_format_from_path(self.path)
+        self.rejected = {}
+        rows = iter_rows(self.path, file_format, on_error=lambda line, e: self._reject("invalid JSON line", line))
+        started = time.monotonic()
+        with AerospikeHook(self.aerospike_conn_id) as hook:
+            self.log.info('Loading %s into %s.%s', self.path, self.namespace, self.set)
+            result = hook.put_many(
+                records=self.iter_records(rows),
+                namespace=self.namespace,
+                set=self.set,
+                policy=self.policy,
+                batch_policy=self.batch_policy,
+                chunk_size=self.chunk_size,
+                max_concurrency=self.max_concurrency,
+                skip_unchanged=self.skip_unchanged,
+                hash_bin=self.hash_bin,
+            )
+        seconds = time.monotonic() - started
+        rejected = sum(self.rejected.values())
+        records_per_second = round(result["written"] / seconds, 1) if seconds else None
+        self.log.info(
+            'Loaded %s records in %.1fs (%s records/s), %s rows rejected, %s records failed',
+            result["written"], seconds, records_per_second, rejected, result["failed"],
+        )
+        if self.skip_unchanged:
+            self.log.info('Skipped %s unchanged records (%s)', result["skipped"], skip_ratio(result["written"], result["skipped"]))
+        if self.rejected:
+            self.log.warning('Rejected rows by reason: %s', self.rejected)
+        if result["errors"]:
+            self.log.warning('Failed records by result code: %s', result["errors"])
+        return {
+            "written": result["written"],
+            "rejected": rejected,
+            "rejected_reasons": dict(self.rejected),
+            "failed": result["failed"],
+            "errors": result["errors"],
+            "seconds": round(seconds, 3),
+            "records_per_second": records_per_second,
+            **({"skipped": result["skipped"]} if self.skip_unchanged else {}),
+        }
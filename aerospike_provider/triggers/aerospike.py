@@ -0,0 +1,121 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+
+from aerospike_provider.hooks.aerospike import AerospikeAsyncHook
+from airflow.triggers.base import BaseTrigger, TriggerEvent
+
+
+class AerospikeKeyTrigger(BaseTrigger):
+    """
+    Wait in the triggerer until a key or a set of keys exists in Aerospike.
+
+    The client calls go through :class:`AerospikeAsyncHook`, so the triggerer event loop is never blocked.
+    For a list of keys, only the keys still missing are checked again, and ``min_count`` can lower the
+    number of keys required.
+    Fires a ``success`` event once all keys exist, a ``timeout`` event once ``end_time`` has passed
+    and an ``error`` event if the check fails.
+
+    :param namespace: namespace to use in aerospike db
+    :param set: set name in the namespace
+    :param key: key to search. can be a single key or a list of keys
+    :param policy: policy passed to `exists`/`exists_many`
+    :param aerospike_conn_id: aerospike connection to use, defaults to 'aerospike_default'
+    :param poke_interval: seconds to wait between checks
+    :param end_time: unix timestamp after which the trigger gives up, or None to wait forever
+    :param min_count: number of keys that should exist, defaults to all of them
+    :param return_found_keys: add the list of keys that exist to the ``success`` event as ``found_keys``
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        set: str,
+        key: Union[List[str], str],
+        policy: Optional[Dict[str, Any]] = None,
+        aerospike_conn_id: str = "aerospike_default",
+        poke_interval: float = 60.0,
+        end_time: Optional[float] = None,
+        min_count: Optional[int] = None,
+        return_found_keys: bool = False,
+    ) -> None:
+        super().__init__()
+        self.namespace = namespace
+        self.set = set
+        self.key = key
+        self.policy = policy
+        self.aerospike_conn_id = aerospike_conn_id
+        self.poke_interval = poke_interval
+        self.end_time = end_time
+        self.min_count = min_count
+        self.return_found_keys = return_found_keys
+
+    def serialize(self) -> Tuple[str, Dict[str, Any]]:
+        return (
+            "aerospike_provider.triggers.aerospike.AerospikeKeyTrigger",
+            {
+                "namespace": self.namespace,
+                "set": self.set,
+                "key": self.key,
+                "policy": self.policy,
+                "aerospike_conn_id": self.aerospike_conn_id,
+                "poke_interval": self.poke_interval,
+                "end_time": self.end_time,
+                "min_count": self.min_count,
+                "return_found_keys": self.return_found_keys,
+            },
+        )
+
+    @staticmethod
+    def keys_exist(records: Union[List, tuple]) -> bool:
+        if isinstance(records, list):
+            return all(record[1] for record in records)
+        return bool(records[1])
+
+    async def run(self) -> AsyncIterator[TriggerEvent]:
+        try:
+            async with AerospikeAsyncHook(self.aerospike_conn_id, max_workers=1) as hook:
+                missing = list(self.key) if isinstance(self.key, list) else self.key
+                while True:
+                    records = await hook.exists(namespace=self.namespace, set=self.set, key=missing, policy=self.policy)
+                    if isinstance(missing, list):
+                        missing = [key for key, record in zip(missing, records) if not record[1]]
+                        found_count = len(self.key) - len(missing)
+                        self.log.info("Found %s/%s keys", found_count, len(self.key))
+                        done = found_count >= (len(self.key) if self.min_count is None else self.min_count)
+                    else:
+                        done = self.keys_exist(records)
+                    if done:
+                        event: Dict[str, Any] = {"status": "success", "message": "Required keys exist"}
+                        if self.return_found_keys:
+                            still_missing = set(missing) if isinstance(missing, list) else set()
+                            keys = self.key if isinstance(self.key, list) else [self.key]
+                            event["found_keys"] = [key for key in keys if key not in still_missing]
+                        break
+                    if self.end_time is not None and time.time() >= self.end_time:
+                        event = {"status": "timeout", "message": "Keys did not show up before the timeout"}
+                        break
+                    self.log.info("Keys are missing, sleeping for %s seconds", self.poke_interval)
+                    await asyncio.sleep(self.poke_interval)
+        except Exception as e:
+            event = {"status": "error", "message": str(e)}
+        yield TriggerEvent(event)
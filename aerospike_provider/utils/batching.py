@@ -0,0 +1,167 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Helpers to split batch calls into chunks and run them on a bounded thread pool."""
+
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, as_completed, wait
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, TypeVar
+
+from aerospike_provider.utils.retry import backoff_delay
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Lazily split ``items`` into lists of at most ``size`` elements."""
+    if size < 1:
+        raise ValueError(f"Chunk size should be a positive integer, got: {size}")
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_chunked(
+    func: Callable[[List[T]], List[R]],
+    items: Sequence[T],
+    chunk_size: int,
+    max_concurrency: int = 1,
+    chunk_retries: int = 0,
+    retry_if: Optional[Callable[[BaseException], bool]] = None,
+    backoff: float = 0.0,
+    max_backoff: Optional[float] = None,
+) -> List[R]:
+    """
+    Call ``func`` on chunks of ``items`` concurrently and merge the results in the original order.
+
+    ``func`` should return exactly one result per item of the chunk it was given (like ``get_many``).
+    Chunks that raise are retried up to ``chunk_retries`` times; chunks that succeeded are never re-sent.
+
+    :param func: batch call to run per chunk
+    :param items: items to split into chunks
+    :param chunk_size: maximum number of items per call
+    :param max_concurrency: maximum number of chunks in flight at once
+    :param chunk_retries: how many times a failed chunk is retried before the error is raised
+    :param retry_if: only retry the chunks whose error passes this check, defaults to all errors
+    :param backoff: base of the jittered exponential delay before each retry, see :func:`backoff_delay`
+    :param max_backoff: maximum delay before a retry
+    """
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size should be a positive integer, got: {chunk_size}")
+    results: List[Any] = [None] * len(items)
+    pending: List[Tuple[int, Sequence[T]]] = [
+        (start, items[start:start + chunk_size]) for start in range(0, len(items), chunk_size)
+    ]
+    if not pending:
+        return results
+
+    attempt = 0
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(pending)))) as executor:
+        while pending:
+            futures = {executor.submit(func, list(chunk)): (start, chunk) for start, chunk in pending}
+            failed: List[Tuple[int, Sequence[T]]] = []
+            last_error: Optional[BaseException] = None
+            fatal_error: Optional[BaseException] = None
+            for future in as_completed(futures):
+                start, chunk = futures[future]
+                try:
+                    results[start:start + len(chunk)] = future.result()
+                except Exception as e:
+                    failed.append((start, chunk))
+                    last_error = e
+                    if retry_if is not None and not retry_if(e):
+                        fatal_error = e
+            if fatal_error is not None:
+                raise fatal_error
+            if failed:
+                if attempt >= chunk_retries:
+                    raise last_error
+                delay = backoff_delay(attempt, backoff, max_backoff) if backoff else 0.0
+                attempt += 1
+                log.warning(
+                    "%s of %s chunks failed (%s), retry %s of %s in %.3fs",
+                    len(failed), len(futures), last_error, attempt, chunk_retries, delay,
+                )
+                if delay:
+                    time.sleep(delay)
+            pending = failed
+    return results
+
+
+def imap_bounded(func: Callable[[T], R], chunks: Iterable[T], max_concurrency: int = 1) -> Iterator[R]:
+    """
+    Lazily call ``func`` on every chunk with at most ``max_concurrency`` calls in flight.
+
+    ``chunks`` is only consumed as calls complete, so a generator of chunks is never fully materialised.
+    Results are yielded in completion order.
+    """
+    iterator = iter(chunks)
+    max_concurrency = max(1, max_concurrency)
+    with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+        in_flight: Set[Future] = set()
+        exhausted = False
+        while True:
+            while not exhausted and len(in_flight) < max_concurrency:
+                try:
+                    chunk = next(iterator)
+                except StopIteration:
+                    exhausted = True
+                    break
+                in_flight.add(executor.submit(func, chunk))
+            if not in_flight:
+                return
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def hedged(func: Callable[[T], R], hedge_func: Callable[[T], R], hedge_after: float, executor: Executor) -> Callable[[T], R]:
+    """
+    Wrap ``func`` so a call still running after ``hedge_after`` seconds is raced against ``hedge_func``.
+
+    The first of the two calls to succeed wins; the other one is left to finish in ``executor`` and its
+    result is dropped, so both calls should be idempotent reads. If both fail, the error of ``func`` is raised.
+    ``executor`` runs the calls and should have room for two calls per concurrent caller.
+    """
+
+    def call(item: T) -> R:
+        primary = executor.submit(func, item)
+        done, _ = wait([primary], timeout=hedge_after)
+        if done:
+            return primary.result()
+        log.info("Call still running after %ss, sending a hedged request", hedge_after)
+        hedge = executor.submit(hedge_func, item)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    return future.result()
+        return primary.result()
+
+    return call
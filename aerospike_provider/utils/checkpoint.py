@@ -0,0 +1,93 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""A local checkpoint file recording which partition ranges of a scan are complete."""
+
+import json
+import logging
+import os
+import threading
+from typing import Any, Dict, Optional
+
+log = logging.getLogger(__name__)
+
+
+class PartitionCheckpoint:
+    """
+    Persist the result of every completed partition range of a scan, so a retry only scans the missing ranges.
+
+    The file is rewritten atomically after each completed range. It is bound to a ``fingerprint`` describing the
+    scan (namespace, set, range layout...): a checkpoint written for a different fingerprint is ignored.
+
+    :param path: local path of the checkpoint file
+    :param fingerprint: JSON serializable description of the scan
+    """
+
+    def __init__(self, path: str, fingerprint: Dict[str, Any]) -> None:
+        self.path = path
+        self.fingerprint = fingerprint
+        self._lock = threading.Lock()
+        self._state: Dict[str, Any] = {"fingerprint": fingerprint, "ranges": {}, "extra": {}}
+        self._load()
+
+    @staticmethod
+    def _range_key(begin: int, count: int) -> str:
+        return f"{begin}-{count}"
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("fingerprint") != json.loads(json.dumps(self.fingerprint)):
+            log.warning("Ignoring checkpoint %s written for a different scan", self.path)
+            return
+        self._state = state
+        log.info("Resuming from checkpoint %s: %s partition ranges already done", self.path, len(state["ranges"]))
+
+    def _save(self) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._state, f)
+        os.replace(tmp_path, self.path)
+
+    def is_done(self, begin: int, count: int) -> bool:
+        return self._range_key(begin, count) in self._state["ranges"]
+
+    def get(self, begin: int, count: int) -> Any:
+        return self._state["ranges"].get(self._range_key(begin, count))
+
+    def mark_done(self, begin: int, count: int, result: Any) -> None:
+        with self._lock:
+            self._state["ranges"][self._range_key(begin, count)] = result
+            self._save()
+
+    def get_extra(self, name: str, default: Optional[Any] = None) -> Any:
+        return self._state["extra"].get(name, default)
+
+    def set_extra(self, name: str, value: Any) -> None:
+        """Store a scan-wide value that must stay the same across retries (e.g. the scan watermark)."""
+        with self._lock:
+            self._state["extra"][name] = value
+            self._save()
+
+    def clear(self) -> None:
+        """Remove the checkpoint file once the scan is complete."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,185 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""A process-wide registry of connected Aerospike clients shared across hook instances."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
+
+from airflow.configuration import conf
+
+if TYPE_CHECKING:
+    from aerospike import Client
+
+log = logging.getLogger(__name__)
+
+PoolKey = Tuple[str, str]
+
+
+class _PoolEntry:
+    __slots__ = ("client", "refcount", "last_released")
+
+    def __init__(self, client: Client) -> None:
+        self.client = client
+        self.refcount = 0
+        self.last_released = time.monotonic()
+
+
+class AerospikeClientPool:
+    """
+    Keeps one connected client per connection id and resolved client config.
+
+    Connecting an Aerospike client is expensive (cluster handshake, partition map fetch, tend thread startup),
+    so hooks acquire a client from this pool and release it when done instead of closing it.
+    Released clients stay warm until they have been unused for ``idle_timeout`` seconds.
+
+    The pool is fork safe: a child process never reuses the parent's clients (their tend threads do not survive
+    ``os.fork``), it simply starts with an empty pool.
+
+    :param idle_timeout: seconds an unreferenced client is kept before it is closed. ``0`` closes on release.
+    :param client_factory: callable building a connected client from a config, defaults to ``aerospike.client(config).connect()``
+    """
+
+    def __init__(
+        self,
+        idle_timeout: float = 300.0,
+        client_factory: Optional[Callable[[Dict[str, Any]], Client]] = None,
+    ) -> None:
+        self.idle_timeout = idle_timeout
+        self.client_factory = client_factory or self._connect
+        self._entries: Dict[PoolKey, _PoolEntry] = {}
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    @staticmethod
+    def _connect(config: Dict[str, Any]) -> Client:
+        # Imported here so the C extension is only loaded when a hook connects, not when DAGs are parsed.
+        import aerospike
+
+        return aerospike.client(config).connect()
+
+    @staticmethod
+    def make_key(conn_id: str, config: Dict[str, Any]) -> PoolKey:
+        return conn_id, json.dumps(config, sort_keys=True, default=str)
+
+    def acquire(self, conn_id: str, config: Dict[str, Any]) -> Client:
+        """Return a connected client for ``conn_id``/``config``, creating it if needed."""
+        key = self.make_key(conn_id, config)
+        with self._lock:
+            self._check_pid()
+            self._evict_idle()
+            entry = self._entries.get(key)
+            if entry is not None and not self._is_healthy(entry.client):
+                log.info("Discarding unhealthy Aerospike client for connection %s", conn_id)
+                self._close(entry.client)
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                log.info("Creating a new Aerospike client for connection %s", conn_id)
+                entry = _PoolEntry(self.client_factory(config))
+                self._entries[key] = entry
+            entry.refcount += 1
+            return entry.client
+
+    def release(self, conn_id: str, config: Dict[str, Any]) -> None:
+        """Give back a client obtained by :meth:`acquire`."""
+        key = self.make_key(conn_id, config)
+        with self._lock:
+            self._check_pid()
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry.refcount = max(entry.refcount - 1, 0)
+            entry.last_released = time.monotonic()
+            self._evict_idle()
+
+    def clear(self) -> None:
+        """Close every pooled client, regardless of its reference count."""
+        with self._lock:
+            self._check_pid()
+            entries, self._entries = self._entries, {}
+        for entry in entries.values():
+            self._close(entry.client)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _check_pid(self) -> None:
+        # Clients inherited through fork have no tend threads and share sockets with the parent.
+        if self._pid != os.getpid():
+            self._entries = {}
+            self._pid = os.getpid()
+
+    def _evict_idle(self) -> None:
+        now = time.monotonic()
+        for key, entry in list(self._entries.items()):
+            if entry.refcount == 0 and now - entry.last_released >= self.idle_timeout:
+                self._close(entry.client)
+                del self._entries[key]
+
+    @staticmethod
+    def _is_healthy(client: Client) -> bool:
+        try:
+            return bool(client.is_connected())
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close(client: Client) -> None:
+        try:
+            client.close()
+        except Exception as e:
+            log.warning("Failed closing Aerospike client: %s", e)
+
+
+_pool: Optional[AerospikeClientPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_client_pool() -> AerospikeClientPool:
+    """
+    Return the process-wide :class:`AerospikeClientPool`.
+
+    The idle timeout is read from the ``[aerospike] client_idle_timeout`` Airflow option (seconds, default 300).
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = AerospikeClientPool(
+                    idle_timeout=conf.getfloat("aerospike", "client_idle_timeout", fallback=300.0)
+                )
+    return _pool
+
+
+def _reset_after_fork() -> None:
+    global _pool_lock
+    _pool_lock = threading.Lock()
+    if _pool is not None:
+        _pool._lock = threading.Lock()
+        _pool._check_pid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
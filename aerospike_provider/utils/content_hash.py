@@ -0,0 +1,85 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Content hashes of bins, used to skip writes that would not change a record."""
+
+import hashlib
+from typing import Any, Dict
+
+# Name of the bin holding the content hash of a record, Aerospike bin names are limited to 15 characters.
+DEFAULT_HASH_BIN = "_content_hash"
+
+# Result code of a write whose filter expression did not match: AEROSPIKE_FILTERED_OUT.
+FILTERED_OUT_CODE = 27
+
+
+def _tagged(tag: str, body: bytes) -> bytes:
+    return b"%s:%d:%s" % (tag.encode("ascii"), len(body), body)
+
+
+def _encode(value: Any) -> bytes:
+    """Encode ``value`` canonically, tagging each value with its type so ``1``, ``"1"`` and ``b"1"`` never collide."""
+    if isinstance(value, dict):
+        # Sorted by key type then encoded key, so maps mixing int, str and bytes keys have a stable order too.
+        items = sorted(((type(key).__name__, _encode(key)), _encode(item)) for key, item in value.items())
+        return _tagged("map", b"".join(key + item for (_, key), item in items))
+    if isinstance(value, (list, tuple)):
+        return _tagged("list", b"".join(_encode(item) for item in value))
+    if isinstance(value, (bytes, bytearray)):
+        return _tagged("bytes", bytes(value))
+    if isinstance(value, str):
+        return _tagged("str", value.encode("utf-8"))
+    if value is None:
+        return _tagged("nil", b"")
+    if isinstance(value, bool):
+        return _tagged("bool", b"1" if value else b"0")
+    if isinstance(value, int):
+        return _tagged("int", str(value).encode("ascii"))
+    if isinstance(value, float):
+        return _tagged("float", repr(value).encode("ascii"))
+    return _tagged(type(value).__name__, repr(value).encode("utf-8"))
+
+
+def content_hash(bins: Dict[str, Any], hash_bin: str = DEFAULT_HASH_BIN) -> int:
+    """
+    Return an 8 bytes BLAKE2b hash of ``bins`` (the ``hash_bin`` bin excluded), as a signed 64-bit integer.
+
+    The hash does not depend on the order of the bins or of nested map keys, and keeps the type of map keys.
+    """
+    content = {name: value for name, value in bins.items() if name != hash_bin}
+    return int.from_bytes(hashlib.blake2b(_encode(content), digest_size=8).digest(), "big", signed=True)
+
+
+def changed_expression(hash_value: int, hash_bin: str = DEFAULT_HASH_BIN) -> Any:
+    """
+    Return the compiled filter expression matching records whose ``hash_bin`` is missing or differs from ``hash_value``.
+
+    Writes with this filter are only applied when the content changed, the others fail with `FilteredOut`.
+    """
+    from aerospike_helpers import expressions as exp
+
+    return exp.Or(
+        exp.Not(exp.BinExists(hash_bin)),
+        exp.NE(exp.IntBin(hash_bin), hash_value),
+    ).compile()
+
+
+def skip_ratio(written: int, skipped: int) -> str:
+    """Describe the share of skipped records, e.g. ``"92.5% skipped"``."""
+    total = written + skipped
+    return f"{100 * skipped / total:.1f}% skipped" if total else "nothing to write"
@@ -0,0 +1,59 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""A process-wide thread pool running the blocking client calls of asyncio code."""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from airflow.configuration import conf
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_async_executor() -> ThreadPoolExecutor:
+    """
+    Return the process-wide executor of :class:`~aerospike_provider.hooks.aerospike.AerospikeAsyncHook` calls.
+
+    All the async hooks of a process (e.g. every trigger waiting in a triggerer) share it, so the number of
+    threads is bounded by the ``[aerospike] async_max_workers`` Airflow option (default 16), not by the number of hooks.
+    Threads are only started when calls are submitted.
+    """
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=conf.getint("aerospike", "async_max_workers", fallback=16),
+                    thread_name_prefix="aerospike-async",
+                )
+    return _executor
+
+
+def _reset_after_fork() -> None:
+    global _executor, _executor_lock
+    _executor_lock = threading.Lock()
+    # The threads of the parent's executor do not exist in the child.
+    _executor = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
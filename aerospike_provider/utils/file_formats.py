@@ -0,0 +1,353 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Writers streaming Aerospike records into local JSONL, CSV or Parquet files, and readers streaming rows back."""
+
+import base64
+import csv
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from airflow.exceptions import AirflowOptionalProviderFeatureException
+
+FILE_FORMATS = ("jsonl", "csv", "parquet")
+
+# CSV/Parquet column holding, as a JSON object, the bins missing from the columns of the file (sets are schemaless).
+EXTRA_COLUMN = "_extra"
+
+# CSV/Parquet columns of the key and metadata: bins with these names are written to the `_extra` column instead.
+RESERVED_COLUMNS = ("key", "digest", "gen", "ttl", EXTRA_COLUMN)
+
+
+def json_default(value: Any) -> Any:
+    """``json.dumps`` fallback for values the Aerospike client returns that JSON cannot encode."""
+    if isinstance(value, (bytes, bytearray)):
+        return to_serializable(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def to_serializable(value: Any) -> Any:
+    """
+    Return ``value`` with bytes/bytearray replaced by their base64 string, also inside lists, tuples and maps
+    (map keys included). Other values are returned as is.
+    """
+    if isinstance(value, (bytes, bytearray)):
+        return base64.b64encode(value).decode("ascii")
+    if isinstance(value, dict):
+        return {to_serializable(key): to_serializable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_serializable(item) for item in value]
+    return value
+
+
+def record_to_dict(record: tuple) -> Dict[str, Any]:
+    """Nested representation of a ``(key, metadata, bins)`` record, as used by the JSONL format."""
+    key, metadata = record[0], record[1]
+    return {
+        "namespace": key[0],
+        "set": key[1],
+        "key": key[2],
+        "digest": key[3].hex() if len(key) > 3 and key[3] is not None else None,
+        "metadata": metadata,
+        "bins": record[2] if len(record) > 2 else None,
+    }
+
+
+def record_to_row(record: tuple) -> Dict[str, Any]:
+    """
+    Flat representation of a ``(key, metadata, bins)`` record, as used by the CSV and Parquet formats.
+
+    Bins named like a key or metadata column (:data:`RESERVED_COLUMNS`) are returned in a dict under
+    :data:`EXTRA_COLUMN`, so they never overwrite the key and metadata.
+    """
+    key, metadata = record[0], record[1] or {}
+    row = {
+        "key": key[2],
+        "digest": key[3].hex() if len(key) > 3 and key[3] is not None else None,
+        "gen": metadata.get("gen"),
+        "ttl": metadata.get("ttl"),
+    }
+    if len(record) > 2 and record[2]:
+        reserved = {name: value for name, value in record[2].items() if name in RESERVED_COLUMNS}
+        row.update((name, value) for name, value in record[2].items() if name not in RESERVED_COLUMNS)
+        if reserved:
+            row[EXTRA_COLUMN] = reserved
+    return row
+
+
+def _to_text(value: Any) -> Optional[str]:
+    """String form of a value in a column of mixed types: bytes are base64 encoded, lists and maps JSON encoded."""
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (bytes, bytearray)):
+        return to_serializable(value)
+    return json.dumps(value, default=json_default)
+
+
+def split_extra_bins(row: Dict[str, Any], columns: Any) -> Dict[str, Any]:
+    """Return ``row`` restricted to ``columns``, the other values being JSON encoded in :data:`EXTRA_COLUMN`."""
+    extra = dict(row.get(EXTRA_COLUMN) or {})
+    extra.update((name, value) for name, value in row.items() if name not in columns and name != EXTRA_COLUMN)
+    row = {name: value for name, value in row.items() if name in columns and name != EXTRA_COLUMN}
+    row[EXTRA_COLUMN] = json.dumps(extra, default=json_default) if extra else None
+    return row
+
+
+def _import_pyarrow() -> Any:
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise AirflowOptionalProviderFeatureException(
+            "The parquet format requires pyarrow: pip install 'airflow-provider-aerospike[parquet]'"
+        ) from e
+    return pa, pq
+
+
+class _JsonlWriter:
+    def __init__(self, path: str) -> None:
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write(self, record: tuple) -> None:
+        self._file.write(json.dumps(record_to_dict(record), default=json_default))
+        self._file.write("\n")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _CsvWriter:
+    """The columns are taken from the first record, the bins of later records missing from them go to ``_extra``."""
+
+    def __init__(self, path: str) -> None:
+        self._file = open(path, "w", encoding="utf-8", newline="")
+        self._writer: Optional[csv.DictWriter] = None
+        self._columns: Dict[str, None] = {}
+
+    def write(self, record: tuple) -> None:
+        row = record_to_row(record)
+        if self._writer is None:
+            self._columns = dict.fromkeys(name for name in row if name != EXTRA_COLUMN)
+            self._writer = csv.DictWriter(self._file, fieldnames=[*self._columns, EXTRA_COLUMN])
+            self._writer.writeheader()
+        self._writer.writerow({
+            name: json.dumps(value, default=json_default) if isinstance(value, (list, dict))
+            else to_serializable(value)
+            for name, value in split_extra_bins(row, self._columns).items()
+        })
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter:
+    """
+    Rows are buffered into row groups.
+
+    The schema is inferred from all the bins of the first row group, the bins of later row groups missing
+    from it are written as a JSON object to the ``_extra`` column. Sets are schemaless, so a bin can change type:
+    a column whose values have different types in the first row group is written as strings (JSON for lists
+    and maps), and the values of later row groups not matching the type of their column go to ``_extra``.
+    """
+
+    def __init__(self, path: str, row_group_size: int = 10000) -> None:
+        self._pa, self._pq = _import_pyarrow()
+        self._path = path
+        self._row_group_size = row_group_size
+        self._rows: List[Dict[str, Any]] = []
+        self._writer = None
+
+    def write(self, record: tuple) -> None:
+        self._rows.append(record_to_row(record))
+        if len(self._rows) >= self._row_group_size:
+            self._flush()
+
+    @property
+    def _conversion_errors(self) -> tuple:
+        return self._pa.ArrowException, ValueError, TypeError, OverflowError
+
+    def _column(self, values: List[Any]) -> Any:
+        try:
+            return self._pa.array(values)
+        except self._conversion_errors:
+            return self._pa.array([_to_text(value) for value in values], type=self._pa.string())
+
+    def _fits(self, value: Any, field: Any) -> bool:
+        try:
+            self._pa.array([value], type=field.type)
+        except self._conversion_errors:
+            return False
+        return True
+
+    def _flush(self) -> None:
+        if not self._rows:
+            return
+        if self._writer is None:
+            columns: Dict[str, None] = {}
+            for row in self._rows:
+                columns.update((name, None) for name in row if name != EXTRA_COLUMN)
+            rows = [split_extra_bins(row, columns) for row in self._rows]
+            arrays = [self._column([row.get(name) for row in rows]) for name in columns]
+            arrays.append(self._pa.array([row[EXTRA_COLUMN] for row in rows], type=self._pa.string()))
+            table = self._pa.Table.from_arrays(arrays, names=[*columns, EXTRA_COLUMN])
+            self._writer = self._pq.ParquetWriter(self._path, table.schema)
+        else:
+            schema = self._writer.schema
+            columns = dict.fromkeys(schema.names)
+            try:
+                table = self._pa.Table.from_pylist([split_extra_bins(row, columns) for row in self._rows], schema=schema)
+            except self._conversion_errors:
+                # Only the values that do not fit the type of their column are moved to `_extra`.
+                rows = []
+                for row in self._rows:
+                    fitting = {
+                        name for name, value in row.items()
+                        if name in columns and name != EXTRA_COLUMN
+                        and (value is None or self._fits(value, schema.field(name)))
+                    }
+                    rows.append(split_extra_bins(row, fitting))
+                table = self._pa.Table.from_pylist(rows, schema=schema)
+        self._writer.write_table(table)
+        self._rows = []
+
+    def close(self) -> None:
+        self._flush()
+        if self._writer is not None:
+            self._writer.close()
+
+
+class RotatingFileWriter:
+    """
+    Write records to ``<output_dir>/<prefix>-<n>.<format>`` files, starting a new file every ``max_records_per_file``.
+
+    ``write`` is thread safe, so it can be used directly as a scan/query ``foreach`` callback.
+
+    :param output_dir: directory the files are created in
+    :param prefix: file name prefix
+    :param file_format: one of ``jsonl``, ``csv`` or ``parquet``
+    :param max_records_per_file: number of records after which a new file is started
+    """
+
+    def __init__(self, output_dir: str, prefix: str, file_format: str = "jsonl", max_records_per_file: int = 1000000) -> None:
+        if file_format not in FILE_FORMATS:
+            raise ValueError(f"Expecting one of {FILE_FORMATS}, got: {file_format}")
+        if max_records_per_file < 1:
+            raise ValueError(f"max_records_per_file should be a positive integer, got: {max_records_per_file}")
+        self.output_dir = output_dir
+        self.prefix = prefix
+        self.file_format = file_format
+        self.max_records_per_file = max_records_per_file
+        self.files: List[Dict[str, Any]] = []
+        self._writer = None
+        self._lock = threading.Lock()
+        os.makedirs(output_dir, exist_ok=True)
+
+    @property
+    def row_count(self) -> int:
+        return sum(f["rows"] for f in self.files)
+
+    def _open(self) -> None:
+        path = os.path.join(self.output_dir, f"{self.prefix}-{len(self.files):05d}.{self.file_format}")
+        if self.file_format == "jsonl":
+            self._writer = _JsonlWriter(path)
+        elif self.file_format == "csv":
+            self._writer = _CsvWriter(path)
+        else:
+            self._writer = _ParquetWriter(path)
+        self.files.append({"path": path, "rows": 0})
+
+    def write(self, record: tuple) -> None:
+        with self._lock:
+            if self._writer is None or self.files[-1]["rows"] >= self.max_records_per_file:
+                self._close_current()
+                self._open()
+            self._writer.write(record)
+            self.files[-1]["rows"] += 1
+
+    def _close_current(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def close(self) -> List[Dict[str, Any]]:
+        """Close the current file and return ``[{"path": str, "rows": int}]`` for every file written."""
+        with self._lock:
+            self._close_current()
+        return self.files
+
+    def __enter__(self) -> "RotatingFileWriter":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def file_format_from_path(path: str) -> str:
+    """Infer the file format from the extension of ``path``."""
+    extension = os.path.splitext(path)[1].lstrip(".").lower()
+    file_format = {"json": "jsonl", "ndjson": "jsonl", "pq": "parquet"}.get(extension, extension)
+    if file_format not in FILE_FORMATS:
+        raise ValueError(f"Cannot infer the file format of {path}, expecting one of {FILE_FORMATS}")
+    return file_format
+
+
+def iter_rows(
+    path: str,
+    file_format: str = "jsonl",
+    batch_size: int = 10000,
+    on_error: Optional[Callable[[int, Exception], None]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream the rows of a local JSONL, CSV or Parquet file as dicts, without loading the whole file.
+
+    JSONL lines that are not JSON objects are skipped and reported to ``on_error`` with their 1-based line number
+    (raised if ``on_error`` is None). CSV values are strings, empty values being None.
+    Parquet files are read ``batch_size`` rows at a time.
+
+    :param path: local file path
+    :param file_format: one of ``jsonl``, ``csv`` or ``parquet``
+    :param batch_size: number of rows read at once from a Parquet file
+    :param on_error: called with ``(line_number, exception)`` for every invalid JSONL line
+    """
+    if file_format == "jsonl":
+        with open(path, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line)
+                    if not isinstance(row, dict):
+                        raise ValueError(f"Expecting a JSON object, got: {type(row).__name__}")
+                except ValueError as e:
+                    if on_error is None:
+                        raise
+                    on_error(line_number, e)
+                    continue
+                yield row
+    elif file_format == "csv":
+        with open(path, encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                yield {name: value if value != "" else None for name, value in row.items()}
+    elif file_format == "parquet":
+        _, pq = _import_pyarrow()
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size):
+            yield from batch.to_pylist()
+    else:
+        raise ValueError(f"Expecting one of {FILE_FORMATS}, got: {file_format}")
@@ -0,0 +1,170 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""StatsD metrics of :class:`~aerospike_provider.hooks.aerospike.AerospikeHook` calls."""
+
+import contextlib
+import logging
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional
+
+from airflow.configuration import conf
+from airflow.stats import Stats
+
+METRIC_PREFIX = "aerospike.hook"
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate number of bytes of a bin value (or of a dict of bins) as sent over the wire."""
+    if value is None:
+        return 0
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_size(v) for v in value)
+    return 8
+
+
+def stats_enabled() -> bool:
+    """Whether Airflow sends metrics anywhere, i.e. whether computing costly metrics is worth it."""
+    return any(
+        conf.getboolean("metrics", option, fallback=False)
+        for option in ("statsd_on", "statsd_datadog_enabled", "otel_on")
+    )
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class CallMetrics:
+    """What a single hook call reports besides its duration, see :meth:`HookMetrics.call`."""
+
+    __slots__ = ("measure_bytes", "batch_size", "records", "bytes", "errors")
+
+    def __init__(self, measure_bytes: bool) -> None:
+        self.measure_bytes = measure_bytes
+        self.batch_size: Optional[int] = None
+        self.records: Optional[int] = None
+        self.bytes = 0
+        self.errors: Dict[str, int] = {}
+
+    def add_bytes(self, bins: Any) -> None:
+        if self.measure_bytes:
+            self.bytes += estimate_size(bins)
+
+    def add_record(self, record: Any) -> None:
+        """Count a ``(key, metadata, bins)`` or ``(key, metadata)`` record returned by the client, if it was found."""
+        if isinstance(record, tuple) and len(record) > 1 and record[1] is not None:
+            self.records = (self.records or 0) + 1
+            if len(record) > 2:
+                self.add_bytes(record[2])
+
+    def add_error(self, result_code: Any, count: int = 1) -> None:
+        self.errors[str(result_code)] = self.errors.get(str(result_code), 0) + count
+
+
+class HookMetrics:
+    """
+    Emit the metrics of the calls of one hook through Airflow's ``Stats``.
+
+    Every call emits ``aerospike.hook.<method>.duration`` (ms) and, when known, ``.batch_size``, ``.records``,
+    ``.bytes`` and ``.errors`` (one increment per result code, tagged ``result_code``).
+    Metrics are tagged with the connection id, namespace and set.
+
+    With ``summary`` the durations are also kept in memory, so :meth:`log_summary` can log a per-method
+    latency histogram at the end of the task.
+
+    :param conn_id: connection id of the hook
+    :param summary: keep an in-process summary, defaults to the ``[aerospike] metrics_summary`` option
+    """
+
+    def __init__(self, conn_id: str, summary: Optional[bool] = None) -> None:
+        self.conn_id = conn_id
+        self.summary = conf.getboolean("aerospike", "metrics_summary", fallback=False) if summary is None else summary
+        # Estimating the size of every record is only worth it when the bytes are reported somewhere.
+        self.measure_bytes = self.summary or stats_enabled()
+        self._durations: Dict[str, List[float]] = {}
+        self._totals: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def call(self, method: str, namespace: Optional[str] = None, set: Optional[str] = None) -> Iterator[CallMetrics]:
+        """Time the block and emit the metrics it recorded on the yielded :class:`CallMetrics`."""
+        metrics = CallMetrics(self.measure_bytes)
+        tags = {"conn_id": self.conn_id}
+        if namespace is not None:
+            tags["namespace"] = namespace
+            tags["set"] = set or ""
+        started = time.monotonic()
+        try:
+            yield metrics
+        except Exception as e:
+            # Aerospike errors carry the server result code, anything else is reported by type.
+            code = getattr(e, "code", None)
+            metrics.add_error(type(e).__name__ if code is None else code)
+            raise
+        finally:
+            duration = (time.monotonic() - started) * 1000
+            self.emit(method, duration, metrics, tags)
+
+    def emit(self, method: str, duration: float, metrics: CallMetrics, tags: Dict[str, str]) -> None:
+        stat = f"{METRIC_PREFIX}.{method}"
+        Stats.timing(f"{stat}.duration", duration, tags=tags)
+        if metrics.batch_size is not None:
+            Stats.gauge(f"{stat}.batch_size", metrics.batch_size, tags=tags)
+        if metrics.records is not None:
+            Stats.incr(f"{stat}.records", metrics.records, tags=tags)
+        if metrics.bytes:
+            Stats.incr(f"{stat}.bytes", metrics.bytes, tags=tags)
+        for code, count in metrics.errors.items():
+            Stats.incr(f"{stat}.errors", count, tags={**tags, "result_code": code})
+
+        if self.summary:
+            with self._lock:
+                self._durations.setdefault(method, []).append(duration)
+                totals = self._totals.setdefault(method, {"records": 0, "bytes": 0, "errors": 0})
+                totals["records"] += metrics.records or 0
+                totals["bytes"] += metrics.bytes
+                totals["errors"] += sum(metrics.errors.values())
+
+    def log_summary(self, log: logging.Logger) -> None:
+        """Log the latency histogram of every method called since the last summary, then reset it."""
+        with self._lock:
+            durations, self._durations = self._durations, {}
+            totals, self._totals = self._totals, {}
+        for method, values in sorted(durations.items()):
+            values.sort()
+            log.info(
+                "Aerospike %s on %s: %s calls, p50 %.2fms, p90 %.2fms, p99 %.2fms, max %.2fms, "
+                "%s records, %s bytes, %s errors",
+                method,
+                self.conn_id,
+                len(values),
+                percentile(values, 0.5),
+                percentile(values, 0.9),
+                percentile(values, 0.99),
+                values[-1],
+                totals[method]["records"],
+                totals[method]["bytes"],
+                totals[method]["errors"],
+            )
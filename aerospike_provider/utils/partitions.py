@@ -0,0 +1,121 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Helpers around the 4096 partitions every Aerospike namespace is split into."""
+
+import base64
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+PARTITION_COUNT = 4096
+
+
+def partition_ranges(num_ranges: int, begin: int = 0, count: int = PARTITION_COUNT) -> List[Tuple[int, int]]:
+    """
+    Split ``count`` partitions starting at ``begin`` into ``num_ranges`` contiguous ``(begin, count)`` ranges.
+
+    Ranges differ in size by at most one partition. Never returns empty ranges.
+    """
+    if num_ranges < 1:
+        raise ValueError(f"num_ranges should be a positive integer, got: {num_ranges}")
+    if begin < 0 or count < 1 or begin + count > PARTITION_COUNT:
+        raise ValueError(f"Invalid partition range: begin={begin}, count={count}")
+    num_ranges = min(num_ranges, count)
+    size, remainder = divmod(count, num_ranges)
+    ranges = []
+    for i in range(num_ranges):
+        range_count = size + (1 if i < remainder else 0)
+        ranges.append((begin, range_count))
+        begin += range_count
+    return ranges
+
+
+def key_digest(namespace: str, set: Optional[str], key: Any) -> bytearray:
+    """The 20 bytes digest Aerospike identifies the record ``key`` of ``set`` with, computed locally."""
+    import aerospike
+
+    return aerospike.calc_digest(namespace, set or "", key)
+
+
+def digest_partition_id(digest: Union[bytes, bytearray]) -> int:
+    """The partition a digest belongs to: its first 12 bits, little endian."""
+    return (digest[0] | digest[1] << 8) % PARTITION_COUNT
+
+
+def key_partition_id(namespace: str, set: Optional[str], key: Any) -> int:
+    """The partition the record ``key`` of ``set`` is stored in, computed without a round trip."""
+    return digest_partition_id(key_digest(namespace, set, key))
+
+
+def parse_replicas(response: str, namespace: str) -> List[int]:
+    """
+    Return the partition ids a node is master of, from its ``replicas`` info response.
+
+    The response lists ``<namespace>:<regime>,<replica count>,<bitmap>,...`` entries separated by ``;``,
+    each bitmap being the base64 encoded, most significant bit first, set of partitions of one replica index.
+    Older servers answer ``<namespace>:<replica count>,<bitmap>,...`` without the regime.
+    """
+    for entry in response.strip().split(";"):
+        name, _, value = entry.partition(":")
+        if name != namespace:
+            continue
+        fields = value.split(",")
+        bitmaps = fields[2:] if fields[1].isdigit() else fields[1:]
+        bitmap = base64.b64decode(bitmaps[0])
+        return [p for p in range(PARTITION_COUNT) if bitmap[p >> 3] & (0x80 >> (p & 7))]
+    return []
+
+
+def shard_keys(
+    namespace: str,
+    set: Optional[str],
+    keys: List[Any],
+    num_shards: int,
+    partition_owners: Optional[Dict[int, str]] = None,
+) -> List[List[Any]]:
+    """
+    Split ``keys`` into at most ``num_shards`` lists of keys stored close together.
+
+    Without ``partition_owners`` the keys are sorted by partition and cut into shards of about the same size,
+    never splitting a partition. With ``partition_owners`` (partition id to node name, see
+    :meth:`AerospikeHook.get_partition_owners`) the keys of one node always go to the same shard and nodes are
+    spread across shards by number of keys, so each shard sends dense batches to few nodes.
+    Empty shards are not returned.
+    """
+    if num_shards < 1:
+        raise ValueError(f"num_shards should be a positive integer, got: {num_shards}")
+    by_partition: Dict[int, List[Any]] = {}
+    for key in keys:
+        by_partition.setdefault(key_partition_id(namespace, set, key), []).append(key)
+
+    if partition_owners is None:
+        shards: List[List[Any]] = [[]]
+        target = -(-len(keys) // num_shards)
+        for partition_id in sorted(by_partition):
+            if len(shards[-1]) >= target and len(shards) < num_shards:
+                shards.append([])
+            shards[-1].extend(by_partition[partition_id])
+        return [shard for shard in shards if shard]
+
+    by_node: Dict[str, List[Any]] = {}
+    for partition_id in sorted(by_partition):
+        by_node.setdefault(partition_owners.get(partition_id, ""), []).extend(by_partition[partition_id])
+    shards = [[] for _ in range(num_shards)]
+    # Largest nodes first, each into the shard with the fewest keys so far.
+    for node_keys in sorted(by_node.values(), key=len, reverse=True):
+        min(shards, key=len).extend(node_keys)
+    return [shard for shard in shards if shard]
@@ -0,0 +1,302 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Client-side write throttling: a token bucket with AIMD backpressure, shared by the hooks of a connection."""
+
+import contextlib
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterator, Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+# Result codes of writes the server rejected because it is overloaded: AEROSPIKE_ERR_RECORD_BUSY (too many
+# concurrent writes to the same record) and AEROSPIKE_ERR_DEVICE_OVERLOAD (the storage write queue is full).
+OVERLOAD_CODES = frozenset({14, 18})
+
+
+class TokenBucket:
+    """
+    Allow ``rate`` tokens per second on average, in bursts of up to ``burst`` tokens.
+
+    A request for more tokens than ``burst`` waits for a full bucket and leaves it in debt,
+    so large batches are paced like many small ones.
+
+    :param rate: tokens added per second, None for no limit
+    :param burst: capacity of the bucket, defaults to one second worth of tokens
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.clock = clock
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._updated = clock()
+        self.rate: Optional[float] = None
+        self.burst = 1.0
+        self.tokens = 0.0
+        self.set_rate(rate, burst)
+        self.tokens = self.burst
+
+    def set_rate(self, rate: Optional[float], burst: Optional[float] = None) -> None:
+        with self._lock:
+            self._refill()
+            self.rate = rate
+            self.burst = float(burst or max(rate or 1.0, 1.0))
+            self.tokens = min(self.tokens, self.burst)
+
+    def _refill(self) -> None:
+        now = self.clock()
+        if self.rate is not None:
+            self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Wait until ``tokens`` are available and take them, return the seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self.rate is None:
+                    return waited
+                needed = min(tokens, self.burst)
+                # The tolerance stops float rounding from leaving the bucket short of a token forever.
+                if self.tokens >= needed - 1e-9:
+                    self.tokens -= tokens
+                    return waited
+                delay = (needed - self.tokens) / self.rate
+            self.sleep(delay)
+            waited += delay
+
+
+class AdaptiveRateLimiter:
+    """
+    Throttle writes with a token bucket of records per second and a cap on the calls in flight.
+
+    Both limits are adjusted with AIMD (additive increase, multiplicative decrease): when the server signals
+    overload (:data:`OVERLOAD_CODES`) the rate and the concurrency are multiplied by ``decrease_factor``,
+    at most once per ``cooldown`` seconds since every call in flight reports the same overload.
+    Every successful call then adds back ``increase`` of the rate ceiling, and one call in flight per
+    ``concurrency`` successful calls. Without ``max_rate`` the ceiling is the throughput measured when the
+    overload started, and the limits are lifted once they recover to it.
+
+    :param max_rate: maximum records per second, None for no limit until the server is overloaded
+    :param min_rate: records per second the rate is never decreased below
+    :param decrease_factor: multiplier applied to the limits on overload
+    :param increase: fraction of the ceiling added back to the rate per successful call
+    :param max_retries: how many times records rejected by an overloaded server are sent again
+    :param backoff: seconds waited before the first retry, doubled on every retry
+    :param cooldown: minimum seconds between two decreases
+    """
+
+    def __init__(
+        self,
+        max_rate: Optional[float] = None,
+        min_rate: float = 10.0,
+        decrease_factor: float = 0.5,
+        increase: float = 0.05,
+        max_retries: int = 5,
+        backoff: float = 0.1,
+        cooldown: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.decrease_factor = decrease_factor
+        self.increase = increase
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.cooldown = cooldown
+        self.clock = clock
+        self.sleep = sleep
+        self.bucket = TokenBucket(max_rate, clock=clock, sleep=sleep)
+        self.concurrency: Optional[float] = None
+        self._rate_ceiling = max_rate
+        self._concurrency_ceiling: Optional[float] = None
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self._last_decrease: Optional[float] = None
+        self._recent: Deque[Tuple[float, int]] = deque()
+        self._started: Optional[float] = None
+        self.records = 0
+        self.overloads = 0
+        self.retries = 0
+        self.throttled_seconds = 0.0
+
+    @property
+    def rate(self) -> Optional[float]:
+        return self.bucket.rate
+
+    def configure(self, max_rate: Optional[float] = None, max_retries: Optional[int] = None) -> None:
+        """Apply the settings of the connection, keeping the current state if they did not change."""
+        with self._condition:
+            if max_retries is not None:
+                self.max_retries = max_retries
+            if max_rate == self.max_rate:
+                return
+            self.max_rate = max_rate
+            self._rate_ceiling = max_rate
+            self.bucket.set_rate(max_rate)
+
+    @contextlib.contextmanager
+    def throttle(self, records: int = 1) -> Iterator[None]:
+        """Wait for a free call slot and for ``records`` tokens, hold the slot while the call runs."""
+        started = self.clock()
+        with self._condition:
+            if self._started is None:
+                self._started = started
+            while self.concurrency is not None and self._in_flight >= max(1, int(self.concurrency)):
+                self._condition.wait()
+            self._in_flight += 1
+        try:
+            self.bucket.acquire(records)
+            waited = self.clock() - started
+            if waited > 0:
+                with self._condition:
+                    self.throttled_seconds += waited
+            yield
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify()
+
+    def on_success(self, records: int) -> None:
+        """Count ``records`` written and increase the limits."""
+        if not records:
+            return
+        with self._condition:
+            now = self.clock()
+            self.records += records
+            self._recent.append((now, records))
+            while self._recent and now - self._recent[0][0] > 5.0:
+                self._recent.popleft()
+            rate = self.bucket.rate
+            if rate is not None and self._rate_ceiling:
+                rate = rate + self.increase * self._rate_ceiling
+                if self.max_rate is None and rate >= self._rate_ceiling:
+                    log.info("Aerospike writes recovered, lifting the rate limit")
+                    rate = None
+                    self._rate_ceiling = None
+                self.bucket.set_rate(min(rate, self.max_rate) if rate and self.max_rate else rate)
+            if self.concurrency is not None:
+                self.concurrency += 1 / self.concurrency
+                if self._concurrency_ceiling is not None and self.concurrency >= self._concurrency_ceiling:
+                    self.concurrency = None
+                    self._concurrency_ceiling = None
+                self._condition.notify_all()
+
+    def on_overload(self) -> None:
+        """Decrease the limits after the server rejected writes because it is overloaded."""
+        with self._condition:
+            self.overloads += 1
+            now = self.clock()
+            if self._last_decrease is not None and now - self._last_decrease < self.cooldown:
+                return
+            self._last_decrease = now
+            rate = self.bucket.rate
+            if rate is None:
+                rate = max(self.min_rate, self._recent_throughput(now))
+                self._rate_ceiling = rate
+            self.bucket.set_rate(max(self.min_rate, rate * self.decrease_factor))
+            if self.concurrency is None:
+                self.concurrency = self._concurrency_ceiling = float(max(1, self._in_flight))
+            self.concurrency = max(1.0, self.concurrency * self.decrease_factor)
+            log.warning(
+                "Aerospike server overloaded, throttling writes to %.0f records/s and %d calls in flight",
+                self.bucket.rate, self.concurrency,
+            )
+
+    def wait_before_retry(self, attempt: int) -> None:
+        """Sleep before sending rejected records again, ``attempt`` starting at 0."""
+        with self._condition:
+            self.retries += 1
+        self.sleep(self.backoff * 2 ** attempt)
+
+    def _recent_throughput(self, now: float) -> float:
+        if not self._recent:
+            return 0.0
+        seconds = max(now - self._recent[0][0], 1.0)
+        return sum(records for _, records in self._recent) / seconds
+
+    def stats(self, since: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Return the records written and the throughput achieved, since ``since`` (a previous result) if given.
+
+        :return: ``{"records", "seconds", "records_per_second", "overloads", "retries", "throttled_seconds",
+            "rate", "concurrency"}``, ``rate`` and ``concurrency`` being the current limits (None when unlimited)
+        """
+        with self._condition:
+            now = self.clock()
+            stats: Dict[str, Any] = {
+                "records": self.records,
+                "overloads": self.overloads,
+                "retries": self.retries,
+                "throttled_seconds": self.throttled_seconds,
+                "time": now,
+            }
+            rate, concurrency = self.bucket.rate, self.concurrency
+            started = self._started if self._started is not None else now
+        if since:
+            stats = {name: value - since[name] for name, value in stats.items()}
+            stats["time"] = now
+            seconds = now - since["time"]
+        else:
+            seconds = now - started
+        stats["seconds"] = round(seconds, 3)
+        stats["records_per_second"] = round(stats["records"] / seconds, 1) if seconds > 0 else None
+        stats["throttled_seconds"] = round(stats["throttled_seconds"], 3)
+        stats["rate"] = round(rate, 1) if rate is not None else None
+        stats["concurrency"] = int(concurrency) if concurrency is not None else None
+        return stats
+
+
+_limiters: Dict[str, AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(conn_id: str) -> AdaptiveRateLimiter:
+    """
+    Return the process-wide :class:`AdaptiveRateLimiter` of a connection.
+
+    Every hook of the connection shares it, so concurrent tasks of a worker slow down together.
+    """
+    limiter = _limiters.get(conn_id)
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.setdefault(conn_id, AdaptiveRateLimiter())
+    return limiter
+
+
+def _reset_after_fork() -> None:
+    global _limiters_lock
+    _limiters_lock = threading.Lock()
+    # The locks of the parent's limiters may be held by threads that do not exist in the child.
+    _limiters.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
@@ -0,0 +1,56 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Result codes worth retrying, and the jittered backoff between retries."""
+
+import random
+from typing import Optional
+
+# Client and server result codes of failures that may not happen again on a retry: client-side timeouts and
+# connection problems, cluster changes, and servers that are temporarily overloaded.
+TRANSIENT_CODES = frozenset({
+    -15,  # AEROSPIKE_ERR_NO_RESPONSE
+    -14,  # AEROSPIKE_MAX_ERROR_RATE
+    -12,  # AEROSPIKE_ERR_MAX_RETRIES_EXCEEDED
+    -10,  # AEROSPIKE_ERR_CONNECTION
+    -8,  # AEROSPIKE_ERR_INVALID_NODE
+    -7,  # AEROSPIKE_ERR_NO_MORE_CONNECTIONS
+    7,  # AEROSPIKE_ERR_CLUSTER_CHANGE
+    9,  # AEROSPIKE_ERR_TIMEOUT
+    11,  # AEROSPIKE_ERR_CLUSTER
+    14,  # AEROSPIKE_ERR_RECORD_BUSY
+    18,  # AEROSPIKE_ERR_DEVICE_OVERLOAD
+    152,  # AEROSPIKE_ERR_BATCH_QUEUES_FULL
+})
+
+
+def is_transient(error: BaseException) -> bool:
+    """Tell whether ``error`` is an Aerospike error with a :data:`TRANSIENT_CODES` result code."""
+    return getattr(error, "code", None) in TRANSIENT_CODES
+
+
+def backoff_delay(attempt: int, base: float, cap: Optional[float] = None) -> float:
+    """
+    Return the seconds to wait before retry ``attempt`` (starting at 0): a random delay up to ``base * 2 ** attempt``.
+
+    The full jitter spreads the retries of the calls that failed together, instead of sending them all again at once.
+    """
+    ceiling = base * 2 ** attempt
+    if cap is not None:
+        ceiling = min(ceiling, cap)
+    return random.uniform(0, ceiling)
@@ -0,0 +1,35 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""Conversions to the nanosecond timestamps Aerospike uses for last-update times and truncate cutoffs."""
+
+from datetime import datetime
+from typing import Union
+
+from airflow.utils import timezone
+
+
+def to_nanoseconds(value: Union[datetime, str, int, float]) -> int:
+    """Convert a datetime, an ISO 8601 string or unix seconds to nanoseconds since the epoch (Aerospike's last-update time unit)."""
+    if isinstance(value, (int, float)):
+        return int(value * 1_000_000_000)
+    if isinstance(value, str):
+        value = timezone.parse(value)
+    if value.tzinfo is None:
+        value = timezone.make_aware(value, timezone.utc)
+    return int(value.timestamp() * 1_000_000) * 1000
@@ -0,0 +1,199 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""
+Throughput benchmarks of the hook, operators and sensor against :class:`FakeAerospikeClient`.
+
+Run with ``python -m tests.benchmarks`` (``--help`` for the options).
+"""
+
+import argparse
+import contextlib
+import json
+import logging
+import subprocess
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+from unittest.mock import patch
+
+from airflow.models.connection import Connection
+
+from aerospike_provider.hooks.aerospike import AerospikeHook
+from aerospike_provider.operators.aerospike import AerospikeGetKeyOperator
+from aerospike_provider.sensors.aerospike import AerospikeKeySensor
+from aerospike_provider.utils.client_pool import AerospikeClientPool
+from tests.benchmarks.fake_client import FakeAerospikeClient
+
+NAMESPACE = "bench"
+SET = "bench"
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    keys: int
+    calls: int
+    seconds: float
+    p50: float
+    p99: float
+    peak_memory: int
+
+    @property
+    def ops_per_second(self) -> float:
+        return self.keys * self.calls / self.seconds if self.seconds else float("inf")
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def measure(name: str, func: Callable[[], object], keys: int = 1, calls: int = 10) -> BenchmarkResult:
+    """Call ``func`` ``calls`` times after a warm-up call, ``keys`` being the number of keys each call handles."""
+    func()
+    latencies: List[float] = []
+    tracemalloc.start()
+    try:
+        started = time.perf_counter()
+        for _ in range(calls):
+            call_started = time.perf_counter()
+            func()
+            latencies.append(time.perf_counter() - call_started)
+        seconds = time.perf_counter() - started
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    latencies.sort()
+    return BenchmarkResult(name, keys, calls, seconds, percentile(latencies, 0.5), percentile(latencies, 0.99), peak_memory)
+
+
+@contextlib.contextmanager
+def fake_aerospike(client: FakeAerospikeClient) -> Iterator[FakeAerospikeClient]:
+    """Make every :class:`AerospikeHook` connect to ``client`` through a real client pool."""
+    pool = AerospikeClientPool(idle_timeout=300, client_factory=lambda config: client)
+    connection = Connection(conn_id="aerospike_default", conn_type="aerospike", host="fake", port=3000)
+    with patch("aerospike_provider.hooks.aerospike.get_client_pool", return_value=pool), patch.object(
+        AerospikeHook, "get_connection", return_value=connection
+    ):
+        yield client
+
+
+def run_suite(
+    sizes: Sequence[int] = (100, 1000, 10000),
+    calls: int = 10,
+    per_call_latency: float = 0.0005,
+    per_key_latency: float = 0.000001,
+) -> List[BenchmarkResult]:
+    client = FakeAerospikeClient(per_call_latency=per_call_latency, per_key_latency=per_key_latency)
+    results = []
+    with fake_aerospike(client):
+        keys = client.load(NAMESPACE, SET, max(sizes), bins=lambda i: {"value": i, "name": f"name{i}"})
+        with AerospikeHook() as hook:
+            results.append(measure("hook.put", lambda: hook.put("key0", {"value": 0}, {"ttl": 0}, NAMESPACE, SET, {}), calls=calls))
+            results.append(measure("hook.get_record[1]", lambda: hook.get_record(NAMESPACE, SET, "key0", {}), calls=calls))
+            results.append(measure("hook.exists[1]", lambda: hook.exists(NAMESPACE, SET, "key0", {}), calls=calls))
+            for size in sizes:
+                batch = keys[:size]
+                results.append(measure(f"hook.get_record[{size}]", lambda: hook.get_record(NAMESPACE, SET, batch, {}), size, calls))
+                results.append(measure(f"hook.exists[{size}]", lambda: hook.exists(NAMESPACE, SET, batch, {}), size, calls))
+
+        for size in sizes:
+            batch = keys[:size]
+            operator = AerospikeGetKeyOperator(namespace=NAMESPACE, set=SET, key=batch, policy={}, task_id=f"get_{size}")
+            results.append(measure(f"AerospikeGetKeyOperator.execute[{size}]", lambda: operator.execute({}), size, calls))
+            results.append(measure(
+                f"AerospikeKeySensor.poke[{size}]",
+                # A new sensor per poke, like reschedule mode, so every poke checks all the keys.
+                lambda: AerospikeKeySensor(namespace=NAMESPACE, set=SET, key=batch, policy={}, task_id=f"sensor_{size}").poke({}),
+                size,
+                calls,
+            ))
+    return results
+
+
+# Run in a fresh interpreter: the DAG processor work of a DAG file using the provider, Airflow being already imported.
+IMPORT_SCRIPT = """
+import json, sys, time
+import airflow.models.baseoperator
+started = time.perf_counter()
+from aerospike_provider.operators.aerospike import AerospikeBulkPutOperator, AerospikeGetKeyOperator, AerospikePutKeyOperator
+from aerospike_provider.sensors.aerospike import AerospikeKeySensor
+from aerospike_provider.transfers.aerospike_to_aerospike import AerospikeToAerospikeOperator
+from aerospike_provider.transfers.aerospike_to_local import AerospikeToLocalFilesystemOperator
+from aerospike_provider.transfers.local_to_aerospike import LocalFilesystemToAerospikeOperator
+AerospikePutKeyOperator(task_id="put", namespace="ns", set="set", key="key", bins={"bin": 1})
+AerospikeBulkPutOperator(task_id="bulk_put", namespace="ns", set="set", records=[("key", {"bin": 1})])
+AerospikeGetKeyOperator(task_id="get", namespace="ns", set="set", key=["key"])
+AerospikeKeySensor(task_id="sensor", namespace="ns", set="set", key="key")
+AerospikeToAerospikeOperator(task_id="copy", namespace="ns", set="set", destination_set="copy")
+AerospikeToLocalFilesystemOperator(task_id="export", namespace="ns", set="set", output_dir="/tmp/export")
+LocalFilesystemToAerospikeOperator(task_id="load", path="/tmp/rows.jsonl", namespace="ns", set="set")
+seconds = time.perf_counter() - started
+print(json.dumps({
+    "seconds": seconds,
+    "loaded": sorted(name for name in ("aerospike", "aerospike_helpers") if name in sys.modules),
+}))
+"""
+
+
+def measure_import() -> Dict[str, Any]:
+    """
+    Import the operators, sensor and transfers and instantiate them in a new interpreter, like a DAG file parse.
+
+    :return: ``{"seconds": float, "loaded": [...]}``, ``loaded`` listing the client packages that got imported
+    """
+    completed = subprocess.run([sys.executable, "-c", IMPORT_SCRIPT], capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def format_report(results: Sequence[BenchmarkResult]) -> str:
+    lines = [f"{'benchmark':<45} {'ops/sec':>12} {'p50 ms':>9} {'p99 ms':>9} {'peak MiB':>9}"]
+    for result in results:
+        lines.append(
+            f"{result.name:<45} {result.ops_per_second:>12.0f} {result.p50 * 1000:>9.2f} "
+            f"{result.p99 * 1000:>9.2f} {result.peak_memory / 2 ** 20:>9.2f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000], help="key list sizes")
+    parser.add_argument("--calls", type=int, default=10, help="calls per benchmark")
+    parser.add_argument("--per-call-latency", type=float, default=0.0005, help="seconds added to every client call")
+    parser.add_argument("--per-key-latency", type=float, default=0.000001, help="seconds added per key of a client call")
+    parser.add_argument("--output", help="also write the report to this file")
+    args = parser.parse_args(argv)
+    # The hook, operators and sensor log every call, and operators warn when executed outside a task instance.
+    logging.disable(logging.WARNING)
+
+    report = format_report(run_suite(args.sizes, args.calls, args.per_call_latency, args.per_key_latency))
+    imported = measure_import()
+    report += (
+        f"\n\nDAG parse: provider import and operators instantiation took {imported['seconds'] * 1000:.1f} ms, "
+        f"client packages loaded: {', '.join(imported['loaded']) or 'none'}"
+    )
+    print(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
@@ -0,0 +1,144 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+"""An in-memory stand-in for ``aerospike.Client`` with configurable latency."""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from aerospike import exception as aerospike_exception
+
+
+class FakeAerospikeClient:
+    """
+    Implements the subset of ``aerospike.Client`` used by the provider, backed by a dict.
+
+    Every call sleeps ``per_call_latency + per_key_latency * number_of_keys`` seconds. Like the C client,
+    sleeping releases the GIL, so concurrent calls overlap the way real network round trips do.
+
+    :param per_call_latency: seconds added to every call (the round trip)
+    :param per_key_latency: seconds added per key of a call (server and transfer time)
+    """
+
+    def __init__(self, per_call_latency: float = 0.0, per_key_latency: float = 0.0) -> None:
+        self.per_call_latency = per_call_latency
+        self.per_key_latency = per_key_latency
+        self.records: Dict[Tuple[str, str, Any], Tuple[Dict[str, int], Dict[str, Any]]] = {}
+        self.calls: Dict[str, int] = {}
+        # Highest number of calls that were running at the same time.
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def _call(self, name: str, keys: int = 1) -> None:
+        with self._lock:
+            self.calls[name] = self.calls.get(name, 0) + 1
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            latency = self.per_call_latency + self.per_key_latency * keys
+            if latency:
+                time.sleep(latency)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    @staticmethod
+    def _key(key: tuple) -> Tuple[str, str, Any]:
+        return key[0], key[1], key[2]
+
+    def _record(self, key: tuple, bins: Optional[List[str]] = None) -> tuple:
+        stored = self.records.get(self._key(key))
+        if stored is None:
+            return key, None, None
+        meta, record_bins = stored
+        if bins is not None:
+            record_bins = {name: value for name, value in record_bins.items() if name in bins}
+        return key, dict(meta), dict(record_bins)
+
+    def load(self, namespace: str, set: str, count: int, bins: Optional[Callable[[int], Dict[str, Any]]] = None) -> List[str]:
+        """Store ``count`` records named ``key0``... without latency, return their keys."""
+        keys = [f"key{i}" for i in range(count)]
+        for i, key in enumerate(keys):
+            self.records[(namespace, set, key)] = ({"gen": 1, "ttl": 0}, bins(i) if bins else {"value": i})
+        return keys
+
+    def is_connected(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        pass
+
+    def _store(self, key: tuple, bins: Dict[str, Any], meta: Optional[dict] = None) -> None:
+        with self._lock:
+            stored = self.records.get(self._key(key))
+            gen = stored[0]["gen"] + 1 if stored else 1
+            merged = {**(stored[1] if stored else {}), **bins}
+            self.records[self._key(key)] = ({"gen": gen, "ttl": (meta or {}).get("ttl", 0)}, merged)
+
+    def put(self, key: tuple, bins: Dict[str, Any], meta: Optional[dict] = None, policy: Optional[dict] = None) -> int:
+        self._call("put")
+        self._store(key, bins, meta)
+        return 0
+
+    def get(self, key: tuple, policy: Optional[dict] = None) -> tuple:
+        self._call("get")
+        record = self._record(key)
+        if record[1] is None:
+            raise aerospike_exception.RecordNotFound(2, "AEROSPIKE_ERR_RECORD_NOT_FOUND")
+        return record
+
+    def select(self, key: tuple, bins: List[str], policy: Optional[dict] = None) -> tuple:
+        self._call("select")
+        record = self._record(key, bins)
+        if record[1] is None:
+            raise aerospike_exception.RecordNotFound(2, "AEROSPIKE_ERR_RECORD_NOT_FOUND")
+        return record
+
+    def exists(self, key: tuple, policy: Optional[dict] = None) -> tuple:
+        self._call("exists")
+        return self._record(key)[:2]
+
+    def get_many(self, keys: List[tuple], policy: Optional[dict] = None) -> List[tuple]:
+        self._call("get_many", len(keys))
+        return [self._record(key) for key in keys]
+
+    def select_many(self, keys: List[tuple], bins: List[str], policy: Optional[dict] = None) -> List[tuple]:
+        self._call("select_many", len(keys))
+        return [self._record(key, bins) for key in keys]
+
+    def exists_many(self, keys: List[tuple], policy: Optional[dict] = None) -> List[tuple]:
+        self._call("exists_many", len(keys))
+        return [self._record(key)[:2] for key in keys]
+
+    def touch(self, key: tuple, val: int = 0, meta: Optional[dict] = None, policy: Optional[dict] = None) -> int:
+        self._call("touch")
+        stored = self.records.get(self._key(key))
+        if stored is None:
+            raise aerospike_exception.RecordNotFound(2, "AEROSPIKE_ERR_RECORD_NOT_FOUND")
+        stored[0]["ttl"] = val
+        return 0
+
+    def batch_write(self, batch_records: Any, policy: Optional[dict] = None) -> Any:
+        self._call("batch_write", len(batch_records.batch_records))
+        for record in batch_records.batch_records:
+            bins = {op["bin"]: op["val"] for op in record.ops if "bin" in op}
+            self._store(record.key, bins, record.meta)
+            record.result = 0
+        return batch_records
@@ -0,0 +1,82 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import time
+import unittest
+
+from aerospike_provider.hooks.aerospike import AerospikeHook
+from tests.benchmarks.bench_aerospike import NAMESPACE, SET, fake_aerospike, format_report, measure, measure_import, run_suite
+from tests.benchmarks.fake_client import FakeAerospikeClient
+
+
+class TestBenchmarkSuite(unittest.TestCase):
+
+    def test_run_suite(self):
+        results = run_suite(sizes=[10, 100], calls=2, per_call_latency=0, per_key_latency=0)
+
+        names = [result.name for result in results]
+        self.assertIn("hook.put", names)
+        self.assertIn("hook.get_record[100]", names)
+        self.assertIn("hook.exists[100]", names)
+        self.assertIn("AerospikeGetKeyOperator.execute[100]", names)
+        self.assertIn("AerospikeKeySensor.poke[100]", names)
+        for result in results:
+            self.assertGreater(result.ops_per_second, 0)
+            self.assertLessEqual(result.p50, result.p99)
+        self.assertEqual(len(format_report(results).splitlines()), len(results) + 1)
+
+    def test_measure(self):
+        result = measure("sleep", lambda: time.sleep(0.001), keys=10, calls=3)
+
+        self.assertEqual(result.calls, 3)
+        self.assertGreaterEqual(result.p50, 0.001)
+        self.assertLess(result.ops_per_second, 10 / 0.001)
+
+
+class TestHookThroughput(unittest.TestCase):
+    """Regression checks that only rely on the fake client latency, not on the machine speed."""
+
+    def setUp(self):
+        self.client = FakeAerospikeClient(per_call_latency=0.02)
+        self.keys = self.client.load(NAMESPACE, SET, 400)
+
+    def test_get_record_chunks_run_concurrently(self):
+        with fake_aerospike(self.client), AerospikeHook() as hook:
+            records = hook.get_record(NAMESPACE, SET, self.keys, {}, chunk_size=50, max_concurrency=8)
+
+        self.assertEqual(len(records), 400)
+        self.assertEqual(self.client.calls["get_many"], 8)
+        # Checked on the calls overlapping rather than on the wall clock, which loaded CI runners make unreliable.
+        self.assertGreater(self.client.max_in_flight, 1)
+        self.assertLessEqual(self.client.max_in_flight, 8)
+
+    def test_exists_is_a_single_batch_call(self):
+        with fake_aerospike(self.client), AerospikeHook() as hook:
+            hook.exists(NAMESPACE, SET, self.keys, {})
+
+        self.assertEqual(self.client.calls, {"exists_many": 1})
+
+
+class TestImportTime(unittest.TestCase):
+
+    def test_operators_do_not_load_the_client(self):
+        result = measure_import()
+
+        # DAG files using the provider are parsed without loading the client C extension.
+        self.assertEqual(result["loaded"], [])
+        self.assertGreater(result["seconds"], 0)
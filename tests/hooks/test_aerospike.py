@@ -16,11 +16,27 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import asyncio
+import base64
+import json
+import threading
+import time
 import unittest
 from unittest import mock
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock, patch
+
+import aerospike
+from aerospike_helpers import expressions as exp
+from aerospike_helpers.operations import operations
+from airflow.exceptions import AirflowException
+from aerospike_provider.hooks.aerospike import AerospikeAsyncHook, AerospikeHook
+from aerospike_provider.utils.content_hash import changed_expression, content_hash
+from aerospike_provider.utils.executor import get_async_executor
+from aerospike_provider.utils.rate_limit import AdaptiveRateLimiter
+
+def scan_range_worker(aerospike_conn_id, namespace, set, begin, count, suffix):
+    return (aerospike_conn_id, namespace, set, begin, count, suffix)
 
-from aerospike_provider.hooks.aerospike import AerospikeHook
 
 class TestAerospikeHookConn(unittest.TestCase):
     def setUp(self):
@@ -28,6 +44,7 @@ class TestAerospikeHookConn(unittest.TestCase):
         self.connection = mock.MagicMock()
         self.connection.host = "localhost"
         self.connection.port = 3000
+        self.connection.extra_dejson = {}
 
         class UnitTestAerospikeHook(AerospikeHook):
             conn_name_attr = "aerospike_conn_id"
@@ -41,23 +58,36 @@ class TestAerospikeHookConn(unittest.TestCase):
         # self.hook.client = mock.Mock()
         # self.hook.get_conn.return_value = self.connection
 
-    # fix this test
-    @patch('aerospike.client')
-    def test_get_conn_new_connection(self, mock_client):
-        # mock_get_connection.return_value = MagicMock(host='localhost', port=3000)
-
-        mock_client_instance = MagicMock(host='localhost', port=3000)
-    #     mock_client.connect.return_value = mock_client_instance # patch aerospike.client
-    #     mock_client_instance.connect.return_value = mock_client_instance # mock aerospike.client
-
-    #     # connection = self.hook.get_connection()
-    #     mock_client = mock_client.connect
-    #     mock_client_instance
-    #     # Verify that aerospike.client was called with the expected config
-    #     mock_client_instance.assert_called_with(mock_client_instance)
-
-    #     # Verify that a client instance was returned
-        self.assertIsNotNone(mock_client_instance)
+    @patch('aerospike_provider.hooks.aerospike.get_client_pool')
+    def test_get_conn_new_connection(self, mock_get_client_pool):
+        hook = AerospikeHook()
+        hook.get_connection = mock.Mock(return_value=self.connection)
+        mock_client = MagicMock()
+        mock_get_client_pool.return_value.acquire.return_value = mock_client
+
+        with hook as conn:
+            assert conn is hook
+            assert hook.client is mock_client
+
+        mock_get_client_pool.return_value.acquire.assert_called_once_with(
+            'aerospike_default', {'hosts': [('localhost', 3000)]}
+        )
+        mock_get_client_pool.return_value.release.assert_called_once_with(
+            'aerospike_default', {'hosts': [('localhost', 3000)]}
+        )
+        mock_client.close.assert_not_called()
+        assert hook.client is None
+
+    @patch('aerospike_provider.hooks.aerospike.get_client_pool')
+    def test_get_conn_invalid_extra_does_not_acquire(self, mock_get_client_pool):
+        hook = AerospikeHook()
+        self.connection.extra_dejson = {'max_write_rate': 'fast'}
+        hook.get_connection = mock.Mock(return_value=self.connection)
+
+        with self.assertRaises(ValueError):
+            hook.get_conn()
+        mock_get_client_pool.return_value.acquire.assert_not_called()
+        assert hook.client is None
 
     def test_get_connection(self):
         connection = self.hook.get_connection()
@@ -71,6 +101,7 @@ class TestAerospikeHook(unittest.TestCase):
         self.connection = mock.MagicMock()
         self.connection.host = "localhost"
         self.connection.port = 3000
+        self.connection.extra_dejson = {}
 
         class UnitTestAerospikeHook(AerospikeHook):
             conn_name_attr = "aerospike_conn_id"
@@ -90,11 +121,80 @@ class TestAerospikeHook(unittest.TestCase):
             },
             "placeholders": {
                 "port": "3000",
-                "host": "cluster node address (The client will learn about the other nodes in the cluster from the seed node)"
+                "host": "cluster node address (The client will learn about the other nodes in the cluster from the seed node)",
+                "extra": json.dumps(
+                    {
+                        "hosts": "node2:3000,node3:3000",
+                        "max_conns_per_node": 100,
+                        "min_conns_per_node": 10,
+                        "tend_interval": 1000,
+                        "connect_timeout": 1000,
+                        "rack_aware": True,
+                        "rack_id": 1,
+                        "replica": "prefer_rack",
+                        "total_timeout": 1000,
+                        "read_policy": {"socket_timeout": 200},
+                        "write_policy": {},
+                        "batch_policy": {},
+                    },
+                    indent=2,
+                ),
             },
         }
         assert self.hook.get_ui_field_behaviour() == expected
 
+    def test_build_client_config_defaults(self):
+        assert AerospikeHook.build_client_config('localhost', 3000, {}) == {'hosts': [('localhost', 3000)]}
+
+    def test_build_client_config_from_extras(self):
+        config = AerospikeHook.build_client_config('node1', 3100, {
+            'hosts': 'node2:3000, node3,node1:3100',
+            'max_conns_per_node': '300',
+            'tend_interval': 500,
+            'connect_timeout': '1500',
+            'rack_aware': 'true',
+            'rack_id': '2',
+            'cluster_name': 'prod',
+            'total_timeout': 1000,
+            'read_policy': {'total_timeout': 50},
+            'write_policy': '{"key": 1}',
+        })
+
+        assert config == {
+            'hosts': [('node1', 3100), ('node2', 3000), ('node3', 3100)],
+            'max_conns_per_node': 300,
+            'tend_interval': 500,
+            'connect_timeout': 1500,
+            'rack_aware': True,
+            'rack_id': 2,
+            'cluster_name': 'prod',
+            'policies': {
+                'read': {'total_timeout': 50, 'replica': 3},
+                'write': {'total_timeout': 1000, 'key': 1},
+                'batch': {'total_timeout': 1000, 'replica': 3},
+                'operate': {'total_timeout': 1000},
+                'remove': {'total_timeout': 1000},
+            },
+        }
+
+    def test_build_client_config_rack_ids(self):
+        rack_ids = lambda value: AerospikeHook.build_client_config('node1', 3000, {'rack_ids': value})['rack_ids']
+
+        assert rack_ids('12') == [12]
+        assert rack_ids('1, 2') == [1, 2]
+        assert rack_ids(3) == [3]
+        assert rack_ids([1, '2']) == [1, 2]
+
+    def test_build_client_config_replica(self):
+        config = AerospikeHook.build_client_config('node1', None, {'replica': 'sequence'})
+
+        assert config['hosts'] == [('node1', 3000)]
+        assert config['policies'] == {'read': {'replica': 2}, 'batch': {'replica': 2}}
+        with self.assertRaises(AirflowException):
+            AerospikeHook.build_client_config('node1', 3000, {'replica': 'nearest'})
+        with self.assertRaises(AirflowException):
+            AerospikeHook.build_client_config(None, None, {})
+
 
 class TestAerospikeHookExistsMethod(unittest.TestCase):
 
@@ -170,3 +270,553 @@ class TestAerospikeHookGetRecordMethod(unittest.TestCase):
         mock_exception = Exception
         with self.assertRaises(mock_exception):
             self.hook.get_record('namespace', 'set', 'key', {})
+
+    def test_get_record_with_bins(self):
+        self.hook.get_record('ns', 'set', 'key1', {}, bins=['bin1'])
+        self.hook.client.select.assert_called_with(('ns', 'set', 'key1'), ['bin1'], {})
+
+        self.hook.get_record('ns', 'set', ['key1', 'key2'], {}, bins=['bin1'])
+        self.hook.client.select_many.assert_called_with([('ns', 'set', 'key1'), ('ns', 'set', 'key2')], ['bin1'], {})
+
+    def test_get_record_with_expression(self):
+        expression = exp.GT(exp.IntBin('bin1'), 10)
+        self.hook.get_record('ns', 'set', 'key1', {'total_timeout': 100}, expression=expression)
+
+        self.hook.client.get.assert_called_with(
+            ('ns', 'set', 'key1'), {'total_timeout': 100, 'expressions': expression.compile()}
+        )
+
+    def test_get_record_single_key_filtered_out(self):
+        expression = exp.GT(exp.IntBin('bin1'), 10)
+        self.hook.client.get.side_effect = aerospike.exception.FilteredOut(27, 'filtered out')
+
+        assert self.hook.get_record('ns', 'set', 'key1', {}, expression=expression) == (('ns', 'set', 'key1'), None, None)
+
+        with self.assertRaises(aerospike.exception.FilteredOut):
+            self.hook.get_record('ns', 'set', 'key1', {})
+
+    def test_get_record_single_missing_key_with_expression(self):
+        expression = exp.GT(exp.IntBin('bin1'), 10)
+        self.hook.client.get.side_effect = aerospike.exception.RecordNotFound(2, 'not found')
+
+        assert self.hook.get_record('ns', 'set', 'key1', {}, expression=expression) == (('ns', 'set', 'key1'), None, None)
+
+        with self.assertRaises(aerospike.exception.RecordNotFound):
+            self.hook.get_record('ns', 'set', 'key1', {})
+
+    def test_get_record_multiple_keys_in_chunks(self):
+        test_keys = [f'key{i}' for i in range(10)]
+        self.hook.client.get_many.side_effect = lambda keys, policy: [(k, {'gen': 1}, {'bin': k[2]}) for k in keys]
+
+        result = self.hook.get_record('ns', 'set', test_keys, {}, chunk_size=3, max_concurrency=2)
+
+        assert self.hook.client.get_many.call_count == 4
+        assert [record[2]['bin'] for record in result] == test_keys
+
+
+class TestAerospikeHookBatchReadRetries(unittest.TestCase):
+
+    def setUp(self):
+        self.hook = AerospikeHook()
+        self.hook.client = MagicMock()
+        patcher = patch('aerospike_provider.utils.batching.time.sleep')
+        self.mock_sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_get_record_retries_transient_errors(self):
+        self.hook.client.get_many.side_effect = [
+            aerospike.exception.TimeoutError(9, 'timeout'),
+            [(('ns', 'set', 'key1'), {'gen': 1}, {'bin': 1})],
+        ]
+        records = self.hook.get_record('ns', 'set', ['key1'], {})
+
+        assert records == [(('ns', 'set', 'key1'), {'gen': 1}, {'bin': 1})]
+        assert self.hook.client.get_many.call_count == 2
+        self.mock_sleep.assert_called_once()
+
+    def test_get_record_raises_other_errors_at_once(self):
+        self.hook.client.get_many.side_effect = aerospike.exception.NamespaceNotFound(20, 'no namespace')
+
+        with self.assertRaises(aerospike.exception.NamespaceNotFound):
+            self.hook.get_record('ns', 'set', ['key1'], {})
+        assert self.hook.client.get_many.call_count == 1
+
+    def test_exists_retries_transient_errors(self):
+        self.hook.client.exists_many.side_effect = [
+            aerospike.exception.ClusterChangeError(7, 'cluster change'),
+            [(('ns', 'set', 'key1'), {'gen': 1}), (('ns', 'set', 'key2'), None)],
+        ]
+        records = self.hook.exists('ns', 'set', ['key1', 'key2'], {}, retry_backoff=0)
+
+        assert records[1] == (('ns', 'set', 'key2'), None)
+        assert self.hook.client.exists_many.call_count == 2
+        self.mock_sleep.assert_not_called()
+
+    def test_get_record_hedges_slow_batches_to_any_replica(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def get_many(keys, policy):
+            if policy.get('replica') != aerospike.POLICY_REPLICA_ANY:
+                release.wait(5)
+                return [(key, None, None) for key in keys]
+            return [(key, {'gen': 1}, {'from': 'replica'}) for key in keys]
+
+        self.hook.client.get_many.side_effect = get_many
+        records = self.hook.get_record('ns', 'set', ['key1', 'key2'], {'total_timeout': 1000}, hedge_after=0.01)
+
+        assert [record[2] for record in records] == [{'from': 'replica'}] * 2
+        hedge_policy = self.hook.client.get_many.call_args_list[1][0][1]
+        assert hedge_policy == {'total_timeout': 1000, 'replica': aerospike.POLICY_REPLICA_ANY}
+
+
+@patch('aerospike_provider.utils.metrics.Stats')
+class TestAerospikeHookMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.hook = AerospikeHook('aerospike_test')
+        self.hook.client = MagicMock()
+        self.tags = {'conn_id': 'aerospike_test', 'namespace': 'ns', 'set': 'set'}
+
+    def test_get_record_multiple_keys_metrics(self, mock_stats):
+        self.hook.client.get_many.return_value = [
+            (('ns', 'set', 'key1'), {'gen': 1}, {'bin': 1}),
+            (('ns', 'set', 'key2'), None, None),
+        ]
+
+        self.hook.get_record('ns', 'set', ['key1', 'key2'], {})
+
+        assert mock_stats.timing.call_args[0][0] == 'aerospike.hook.get_record.duration'
+        mock_stats.gauge.assert_called_once_with('aerospike.hook.get_record.batch_size', 2, tags=self.tags)
+        mock_stats.incr.assert_any_call('aerospike.hook.get_record.records', 1, tags=self.tags)
+
+    def test_failed_call_metrics(self, mock_stats):
+        self.hook.client.get.side_effect = aerospike.exception.RecordNotFound(2, 'not found')
+
+        with self.assertRaises(aerospike.exception.RecordNotFound):
+            self.hook.get_record('ns', 'set', 'key1', {})
+
+        mock_stats.incr.assert_called_once_with(
+            'aerospike.hook.get_record.errors', 1, tags={**self.tags, 'result_code': '2'}
+        )
+
+    def test_exit_logs_summary(self, mock_stats):
+        self.hook.metrics.summary = True
+        with patch.object(self.hook.metrics, 'log_summary') as mock_log_summary, \
+                patch('aerospike_provider.hooks.aerospike.get_client_pool'):
+            self.hook.__exit__(None, None, None)
+
+        mock_log_summary.assert_called_once_with(self.hook.log)
+
+
+class TestAerospikeHookPutManyMethod(unittest.TestCase):
+
+    def setUp(self):
+        self.hook = AerospikeHook()
+        self.hook.client = MagicMock()
+
+    def test_put_many(self):
+        def batch_write(batch, policy):
+            for record in batch.batch_records:
+                record.result = 13 if record.key[2] == 'key3' else 0
+
+        self.hook.client.batch_write.side_effect = batch_write
+        records = ((f'key{i}', {'bin': i}, {'ttl': 10}) for i in range(5))
+        result = self.hook.put_many(records, 'ns', 'set', chunk_size=2)
+
+        assert self.hook.client.batch_write.call_count == 3
+        assert result == {'written': 4, 'failed': 1, 'errors': {'13': 1}}
+
+    def test_put_many_builds_writes(self):
+        self.hook.put_many([('key1', {'bin1': 1, 'bin2': 'a'}, {'ttl': 10}), ('key2', {'bin1': 2})], 'ns', 'set', policy={'key': 1})
+
+        batch = self.hook.client.batch_write.call_args[0][0]
+        first, second = batch.batch_records
+        assert first.key == ('ns', 'set', 'key1')
+        assert [op['bin'] for op in first.ops] == ['bin1', 'bin2']
+        assert first.meta == {'ttl': 10}
+        assert first.policy == {'key': 1}
+        assert second.meta is None
+
+    def test_put_many_counts_failed_batches(self):
+        self.hook.client.batch_write.side_effect = aerospike.exception.TimeoutError(9, 'timeout')
+        result = self.hook.put_many([('key1', {'bin': 1}), ('key2', {'bin': 2})], 'ns', 'set')
+
+        assert result == {'written': 0, 'failed': 2, 'errors': {'9': 2}}
+
+    def test_put_many_retries_overloaded_records(self):
+        self.hook.rate_limiter = AdaptiveRateLimiter(max_retries=1, min_rate=1000, sleep=Mock())
+        calls = []
+
+        def batch_write(batch, policy):
+            calls.append([record.key[2] for record in batch.batch_records])
+            for record in batch.batch_records:
+                record.result = 18 if record.key[2] in ('key1', 'key2') else 0
+            if len(calls) > 1:
+                batch.batch_records[0].result = 0
+
+        self.hook.client.batch_write.side_effect = batch_write
+        result = self.hook.put_many([(f'key{i}', {'bin': i}) for i in range(4)], 'ns', 'set')
+
+        assert calls == [['key0', 'key1', 'key2', 'key3'], ['key1', 'key2']]
+        assert result == {'written': 3, 'failed': 1, 'errors': {'18': 1}}
+        assert self.hook.rate_limiter.overloads == 2
+        assert self.hook.rate_limiter.retries == 1
+
+    def test_put_retries_when_overloaded(self):
+        self.hook.rate_limiter = AdaptiveRateLimiter(max_retries=2, sleep=Mock())
+        self.hook.client.put.side_effect = [aerospike.exception.RecordBusy(14, 'busy'), 0]
+
+        assert self.hook.put('key', {'bin': 1}, {}, 'ns', 'set', {}) == 0
+        assert self.hook.client.put.call_count == 2
+        assert self.hook.rate_limiter.retries == 1
+
+    def test_put_raises_when_still_overloaded(self):
+        self.hook.rate_limiter = AdaptiveRateLimiter(max_retries=1, sleep=Mock())
+        self.hook.client.put.side_effect = aerospike.exception.DeviceOverload(18, 'overload')
+
+        with self.assertRaises(aerospike.exception.DeviceOverload):
+            self.hook.put('key', {'bin': 1}, {}, 'ns', 'set', {})
+        assert self.hook.client.put.call_count == 2
+
+    def test_put_many_skip_unchanged(self):
+        def batch_write(batch, policy):
+            for record in batch.batch_records:
+                record.result = 27 if record.key[2] == 'key1' else 0
+
+        self.hook.client.batch_write.side_effect = batch_write
+        result = self.hook.put_many([('key1', {'bin': 1}), ('key2', {'bin': 2})], 'ns', 'set', policy={'key': 1}, skip_unchanged=True)
+
+        assert result == {'written': 1, 'failed': 0, 'errors': {}, 'skipped': 1}
+        first = self.hook.client.batch_write.call_args[0][0].batch_records[0]
+        hash_value = content_hash({'bin': 1})
+        assert first.ops[-1]['bin'] == '_content_hash'
+        assert first.ops[-1]['val'] == hash_value
+        assert first.policy == {'key': 1, 'expressions': changed_expression(hash_value)}
+
+    def test_put_skip_unchanged(self):
+        self.hook.client.put.side_effect = aerospike.exception.FilteredOut(27, 'filtered out')
+
+        assert self.hook.put('key', {'bin': 1}, {}, 'ns', 'set', None, skip_unchanged=True, hash_bin='h') is False
+        key, bins, metadata, policy = self.hook.client.put.call_args[0]
+        assert bins == {'bin': 1, 'h': content_hash({'bin': 1}, 'h')}
+        assert policy == {'expressions': changed_expression(bins['h'], 'h')}
+
+        self.hook.client.put.side_effect = None
+        assert self.hook.put('key', {'bin': 2}, {}, 'ns', 'set', None, skip_unchanged=True) is True
+
+    def test_put_many_with_uninitialized_client(self):
+        self.hook.client = None
+        with self.assertRaises(Exception):
+            self.hook.put_many([('key1', {'bin': 1})], 'ns', 'set')
+
+
+class TestAerospikeHookOperateMethods(unittest.TestCase):
+
+    def setUp(self):
+        self.hook = AerospikeHook()
+        self.hook.client = MagicMock()
+        self.ops = [operations.increment('count', 1), operations.read('count')]
+
+    def test_operate(self):
+        self.hook.client.operate.return_value = (('ns', 'set', 'key1'), {'gen': 2}, {'count': 2})
+        result = self.hook.operate('ns', 'set', 'key1', self.ops, {'ttl': 10}, {'total_timeout': 100})
+
+        self.hook.client.operate.assert_called_once_with(('ns', 'set', 'key1'), self.ops, {'ttl': 10}, {'total_timeout': 100})
+        assert result == (('ns', 'set', 'key1'), {'gen': 2}, {'count': 2})
+
+    def test_operate_many(self):
+        def batch_write(batch, policy):
+            for record in batch.batch_records:
+                assert record.ops == self.ops
+                if record.key[2] == 'key2':
+                    record.result = 13
+                else:
+                    record.result = 0
+                    record.record = (record.key, {'gen': 1}, {'count': 1})
+
+        self.hook.client.batch_write.side_effect = batch_write
+        result = self.hook.operate_many('ns', 'set', ['key1', 'key2', 'key3'], self.ops, chunk_size=2)
+
+        assert self.hook.client.batch_write.call_count == 2
+        assert result == {
+            'records': [
+                (('ns', 'set', 'key1'), {'gen': 1}, {'count': 1}),
+                (('ns', 'set', 'key2'), None, None),
+                (('ns', 'set', 'key3'), {'gen': 1}, {'count': 1}),
+            ],
+            'failed': 1,
+            'errors': {'13': 1},
+        }
+
+    def test_operate_many_does_not_retry_by_default(self):
+        self.hook.client.batch_write.side_effect = aerospike.exception.TimeoutError(9, 'timeout')
+
+        with self.assertRaises(aerospike.exception.TimeoutError):
+            self.hook.operate_many('ns', 'set', ['key1'], self.ops)
+        self.hook.client.batch_write.assert_called_once()
+
+    def test_operate_overload_slows_down_without_retry(self):
+        self.hook.rate_limiter = AdaptiveRateLimiter(max_retries=2, sleep=Mock())
+        self.hook.client.operate.side_effect = aerospike.exception.DeviceOverload(18, 'overload')
+
+        with self.assertRaises(aerospike.exception.DeviceOverload):
+            self.hook.operate('ns', 'set', 'key1', self.ops)
+        self.hook.client.operate.assert_called_once()
+        assert self.hook.rate_limiter.overloads == 1
+        assert self.hook.rate_limiter.retries == 0
+
+    def test_operate_many_overload_slows_down_without_retry(self):
+        self.hook.rate_limiter = AdaptiveRateLimiter(max_retries=2, sleep=Mock())
+
+        def batch_write(batch, policy):
+            for record in batch.batch_records:
+                record.result = 18 if record.key[2] == 'key2' else 0
+                record.record = (record.key, {'gen': 1}, {'count': 1}) if record.result == 0 else None
+
+        self.hook.client.batch_write.side_effect = batch_write
+        result = self.hook.operate_many('ns', 'set', ['key1', 'key2'], self.ops)
+
+        self.hook.client.batch_write.assert_called_once()
+        assert result['errors'] == {'18': 1}
+        assert self.hook.rate_limiter.overloads == 1
+        assert self.hook.rate_limiter.records == 1
+
+
+class TestAerospikeHookTouchManyMethod(unittest.TestCase):
+
+    def setUp(self):
+        self.hook = AerospikeHook()
+        self.hook.client = MagicMock()
+
+    def test_touch_many(self):
+        def batch_write(batch, policy):
+            for record in batch.batch_records:
+                assert record.meta == {'ttl': 100}
+                record.result = {'key1': 2, 'key3': 13}.get(record.key[2], 0)
+
+        self.hook.client.batch_write.side_effect = batch_write
+        result = self.hook.touch_many('ns', 'set', (f'key{i}' for i in range(5)), ttl=100, chunk_size=2)
+
+        assert self.hook.client.batch_write.call_count == 3
+        assert result == {'touched': 3, 'missing': 1, 'failed': 1, 'errors': {'13': 1}}
+
+    def test_touch_many_counts_failed_batches(self):
+        self.hook.client.batch_write.side_effect = aerospike.exception.TimeoutError(9, 'timeout')
+        result = self.hook.touch_many('ns', 'set', ['key1', 'key2'], ttl=100)
+
+        assert result == {'touched': 0, 'missing': 0, 'failed': 2, 'errors': {'9': 2}}
+
+
+class TestAerospikeHookRemoveMethods(unittest.TestCase):
+
+    def setUp(self):
+        self.hook = AerospikeHook()
+        self.hook.client = MagicMock()
+
+    def test_remove_many(self):
+        def batch_remove(keys, batch_policy, policy):
+            batch = MagicMock()
+            batch.batch_records = [MagicMock(result={'key1': 2, 'key3': 13}.get(key[2], 0)) for key in keys]
+            return batch
+
+        self.hook.client.batch_remove.side_effect = batch_remove
+        result = self.hook.remove_many('ns', 'set', (f'key{i}' for i in range(5)), chunk_size=2, batch_policy={'total_timeout': 100})
+
+        assert self.hook.client.batch_remove.call_count == 3
+        self.hook.client.batch_remove.assert_any_call([('ns', 'set', 'key0'), ('ns', 'set', 'key1')], {'total_timeout': 100}, None)
+        assert result == {'removed': 3, 'missing': 1, 'failed': 1, 'errors': {'13': 1}}
+
+    def test_remove_many_counts_failed_batches(self):
+        self.hook.client.batch_remove.side_effect = aerospike.exception.TimeoutError(9, 'timeout')
+        result = self.hook.remove_many('ns', 'set', ['key1', 'key2'])
+
+        assert result == {'removed': 0, 'missing': 0, 'failed': 2, 'errors': {'9': 2}}
+
+    def test_truncate(self):
+        self.hook.truncate('ns', 'set')
+        self.hook.client.truncate.assert_called_with('ns', 'set', 0, None)
+
+        self.hook.truncate('ns', None, before='2024-01-01T00:00:00+00:00', policy={'timeout': 100})
+        self.hook.client.truncate.assert_called_with('ns', None, 1704067200 * 10**9, {'timeout': 100})
+
+
+class TestAerospikeHookPartitionMethods(unittest.TestCase):
+
+    def setUp(self):
+        self.hook = AerospikeHook()
+        self.hook.client = MagicMock()
+
+    def test_get_partition_owners(self):
+        bitmap = bytearray(512)
+        bitmap[0] = 0xC0
+        self.hook.client.info_all.return_value = {
+            'node1': (None, f"replicas\tns:0,1,{base64.b64encode(bytes(bitmap)).decode()}\n"),
+            'node2': (None, f"replicas\tns:0,1,{base64.b64encode(bytes(512)).decode()}\n"),
+            'node3': ('timeout', None),
+        }
+
+        assert self.hook.get_partition_owners('ns') == {0: 'node1', 1: 'node1'}
+        self.hook.client.info_all.assert_called_once_with('replicas', None)
+
+    def test_shard_keys_by_node(self):
+        with patch.object(self.hook, 'get_partition_owners', return_value={}) as mock_owners:
+            shards = self.hook.shard_keys('ns', 'set', ['key1', 'key2'], 2, by='node')
+
+        mock_owners.assert_called_once_with('ns')
+        assert len(shards) == 1
+        assert sorted(shards[0]) == ['key1', 'key2']
+
+    def test_shard_keys_invalid_by(self):
+        with self.assertRaises(ValueError):
+            self.hook.shard_keys('ns', 'set', ['key1'], 2, by='rack')
+
+
+class TestAerospikeHookForeachMethod(unittest.TestCase):
+
+    def setUp(self):
+        self.hook = AerospikeHook()
+        self.hook.client = MagicMock()
+        self.records = [(('ns', 'set', f'key{i}', bytearray(b'd')), {'gen': 1}, {'bin': i}) for i in range(3)]
+        self.query = self.hook.client.query.return_value
+        self.query.foreach.side_effect = lambda callback, policy: [callback(record) for record in self.records]
+
+    def test_foreach_partition_filter(self):
+        self.hook.foreach('ns', 'set', lambda record: None, policy={'total_timeout': 10}, partition_filter={'begin': 10, 'count': 5})
+
+        self.query.foreach.assert_called_once()
+        assert self.query.foreach.call_args[0][1] == {'total_timeout': 10, 'partition_filter': {'begin': 10, 'count': 5}}
+
+    def test_foreach(self):
+        seen = []
+        self.hook.foreach('ns', 'set', seen.append, bins=['bin'])
+
+        self.hook.client.query.assert_called_once_with('ns', 'set')
+        self.query.select.assert_called_once_with('bin')
+        assert seen == self.records
+
+    def test_foreach_reraises_callback_errors(self):
+        def callback(record):
+            raise OSError('disk full')
+
+        with self.assertRaises(OSError):
+            self.hook.foreach('ns', 'set', callback)
+
+
+class TestAerospikeHookParallelPartitionScan(unittest.TestCase):
+
+    def test_parallel_partition_scan(self):
+        hook = AerospikeHook('test_conn')
+        results = hook.parallel_partition_scan(
+            worker=scan_range_worker,
+            namespace='ns',
+            set='set',
+            num_workers=2,
+            worker_kwargs={'suffix': 'x'},
+            mp_context='fork',
+        )
+
+        assert len(results) == 8
+        assert results[0] == ('test_conn', 'ns', 'set', 0, 512, 'x')
+        assert sum(result[4] for result in results) == 4096
+
+
+@patch('aerospike_provider.hooks.aerospike.AerospikeHook')
+class TestAerospikeAsyncHook(unittest.IsolatedAsyncioTestCase):
+
+    async def test_calls_run_in_executor(self, mock_hook):
+        loop_thread = threading.get_ident()
+        mock_hook.return_value.exists.side_effect = lambda **kwargs: threading.get_ident()
+
+        async with AerospikeAsyncHook('aerospike_test', timeout=2) as hook:
+            call_thread = await hook.exists('ns', 'set', 'key1', {})
+
+        assert call_thread != loop_thread
+        mock_hook.assert_called_once_with('aerospike_test')
+        mock_hook.return_value.get_conn.assert_called_once()
+        mock_hook.return_value.exists.assert_called_once_with(
+            namespace='ns', set='set', key='key1', policy={'total_timeout': 2000}
+        )
+        mock_hook.return_value.__exit__.assert_called_once()
+
+    async def test_policy_timeout_is_kept(self, mock_hook):
+        async with AerospikeAsyncHook(timeout=2) as hook:
+            await hook.get_record('ns', 'set', ['key1'], {'total_timeout': 100}, bins=['bin1'])
+            await hook.put_many([('key1', {'bin': 1})], 'ns', 'set', timeout=1)
+
+        mock_hook.return_value.get_record.assert_called_once_with(
+            namespace='ns', set='set', key=['key1'], policy={'total_timeout': 100}, bins=['bin1']
+        )
+        mock_hook.return_value.put_many.assert_called_once_with(
+            records=[('key1', {'bin': 1})], namespace='ns', set='set', policy=None, batch_policy={'total_timeout': 1000}
+        )
+
+    async def test_call_timeout(self, mock_hook):
+        mock_hook.return_value.touch_record.side_effect = lambda **kwargs: time.sleep(0.5)
+
+        async with AerospikeAsyncHook() as hook:
+            with self.assertRaises(asyncio.TimeoutError):
+                await hook.touch_record('ns', 'set', 'key1', 10, timeout=0.01)
+
+    async def test_concurrency_is_bounded(self, mock_hook):
+        running, peak = [0], [0]
+        lock = threading.Lock()
+
+        def put(**kwargs):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+
+        mock_hook.return_value.put.side_effect = put
+        async with AerospikeAsyncHook(max_workers=2) as hook:
+            await asyncio.gather(*(hook.put(f'key{i}', {'bin': i}, None, 'ns', 'set') for i in range(6)))
+
+        assert mock_hook.return_value.put.call_count == 6
+        assert peak[0] == 2
+
+    async def test_connect_timeout_releases_the_client(self, mock_hook):
+        connected = threading.Event()
+
+        def get_conn():
+            time.sleep(0.1)
+            connected.set()
+
+        mock_hook.return_value.get_conn.side_effect = get_conn
+        hook = AerospikeAsyncHook(timeout=0.01)
+        with self.assertRaises(asyncio.TimeoutError):
+            await hook.get_conn()
+
+        assert hook._executor is None
+        mock_hook.return_value.close.assert_not_called()
+        assert connected.wait(1)
+        for _ in range(100):
+            if mock_hook.return_value.close.called:
+                break
+            time.sleep(0.01)
+        mock_hook.return_value.close.assert_called_once()
+
+    async def test_connect_error_releases_the_client(self, mock_hook):
+        mock_hook.return_value.get_conn.side_effect = OSError('unreachable')
+
+        hook = AerospikeAsyncHook()
+        with self.assertRaises(OSError):
+            async with hook:
+                pass
+        assert hook._executor is None
+        mock_hook.return_value.close.assert_called_once()
+
+    async def test_hooks_share_the_executor(self, mock_hook):
+        mock_hook.return_value.exists.side_effect = lambda **kwargs: threading.current_thread().name
+
+        async with AerospikeAsyncHook(max_workers=1) as first, AerospikeAsyncHook(max_workers=1) as second:
+            assert first._executor is second._executor is get_async_executor()
+            names = await asyncio.gather(first.exists('ns', 'set', 'key1'), second.exists('ns', 'set', 'key2'))
+
+        assert all(name.startswith('aerospike-async') for name in names)
+
+    async def test_not_connected(self, mock_hook):
+        with self.assertRaises(AirflowException):
+            await AerospikeAsyncHook().exists('ns', 'set', 'key1')
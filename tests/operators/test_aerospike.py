@@ -16,10 +16,22 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import json
 import unittest
 from unittest.mock import patch, Mock
-from aerospike_provider.operators.aerospike import AerospikeGetKeyOperator, AerospikePutKeyOperator
+from aerospike_provider.operators.aerospike import (
+    AerospikeBulkPutOperator,
+    AerospikeDeleteOperator,
+    AerospikeGetKeyOperator,
+    AerospikeKeyShardOperator,
+    AerospikeOperateOperator,
+    AerospikePutKeyOperator,
+    AerospikeTouchOperator,
+)
 import aerospike
+from aerospike_helpers import expressions as exp
+from aerospike_helpers.operations import operations
+from airflow.exceptions import AirflowException
 
 class TestAerospikeGetKeyOperator(unittest.TestCase):
     def setUp(self):
@@ -50,9 +62,82 @@ class TestAerospikeGetKeyOperator(unittest.TestCase):
             namespace='test_namespace',
             set='test_set',
             key='test_key',
-            policy={ aerospike.POLICY_KEY_SEND }
+            policy={ aerospike.POLICY_KEY_SEND },
+            chunk_size=5000,
+            max_concurrency=4,
+            chunk_retries=2,
+            bins=None,
+            expression=None,
+            hedge_after=None,
         )
 
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.get_conn')
+    def test_execute_with_expression_drops_filtered_records(self, mock_hock_conn):
+        mock_hock_conn.return_value = Mock()
+        mock_hock_conn.return_value.get_record.return_value = [
+            ((self.namespace, self.set, 'key1'), self.metadata, {'name': 'a'}),
+            ((self.namespace, self.set, 'key2'), None, None),
+        ]
+        self.operator.key = ['key1', 'key2']
+        self.operator.bins = ['name']
+        self.operator.expression = exp.Eq(exp.StrBin('name'), 'a')
+        result = self.operator.execute({})
+
+        assert [record['key'] for record in result] == ['key1']
+        assert mock_hock_conn.return_value.get_record.call_args.kwargs['bins'] == ['name']
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.get_conn')
+    def test_execute_with_expression_single_key_filtered_out(self, mock_hock_conn):
+        mock_hock_conn.return_value = Mock()
+        mock_hock_conn.return_value.get_record.return_value = ((self.namespace, self.set, self.key), None, None)
+        self.operator.expression = exp.Eq(exp.StrBin('name'), 'a')
+
+        assert self.operator.execute({}) == []
+
+        self.operator.output_format = 'columnar'
+        assert self.operator.execute({})['keys'] == []
+
+    def test_create_columns_from_records(self):
+        self.operator.output_format = 'columnar'
+        records = [
+            ((self.namespace, self.set, 'key1', bytearray(b'd1')), {'ttl': 10, 'gen': 1}, {'name': 'a', 'raw': bytearray(b'ab')}),
+            ((self.namespace, self.set, 'key2', bytearray(b'd2')), None),
+            ((self.namespace, self.set, 'key3', bytearray(b'd3')), {'ttl': 20, 'gen': 2}, {'name': 'c', 'extra': 3}),
+        ]
+        result = self.operator.create_columns_from_records(records)
+
+        assert result == {
+            'namespace': self.namespace,
+            'set': self.set,
+            'keys': ['key1', 'key2', 'key3'],
+            'metadata': {'gen': [1, None, 2], 'ttl': [10, None, 20]},
+            'bins': {'name': ['a', None, 'c'], 'raw': ['YWI=', None, None], 'extra': [None, None, 3]},
+        }
+
+    def test_create_columns_from_records_nested_bytes(self):
+        records = [
+            ((self.namespace, self.set, b'k1'), {'ttl': 10, 'gen': 1}, {'list': [bytearray(b'ab'), 1], 'map': {b'k': (b'ab', 'x')}}),
+        ]
+        result = self.operator.create_columns_from_records(records)
+
+        assert result['keys'] == ['azE=']
+        assert result['bins'] == {'list': [['YWI=', 1]], 'map': [{'aw==': ['YWI=', 'x']}]}
+        json.dumps(result)
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.get_conn')
+    def test_execute_columnar_single_key(self, mock_hock_conn):
+        mock_hock_conn.return_value = Mock()
+        mock_hock_conn.return_value.get_record.return_value = ((self.namespace, self.set, self.key), self.metadata, self.bins)
+        self.operator.output_format = 'columnar'
+        result = self.operator.execute({})
+
+        assert result['keys'] == [self.key]
+        assert result['bins'] == {'name': ['Aerospike Test'], 'version': ['1.0.0']}
+
+    def test_invalid_output_format(self):
+        with self.assertRaises(ValueError):
+            AerospikeGetKeyOperator(namespace=self.namespace, set=self.set, key=self.key, output_format='xml', task_id='invalid')
+
     def test_parse_records_as_tuple(self):
         mock = ( (self.namespace, self.set, self.key), self.metadata, self.bins)
         mock_parsed = self.operator.parse_records(records=mock)
@@ -117,3 +202,206 @@ class TestAerospikePutKeyOperator(unittest.TestCase):
             metadata={'ttl': 1000},
             policy={'key': aerospike.POLICY_EXISTS_IGNORE}
         )
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.get_conn')
+    def test_execute_skip_unchanged(self, mock_hock_conn):
+        mock_hock_conn.return_value = Mock()
+        mock_hock_conn.return_value.put.return_value = False
+        self.operator.skip_unchanged = True
+        result = self.operator.execute({})
+
+        assert mock_hock_conn.return_value.put.call_args.kwargs['skip_unchanged'] is True
+        assert mock_hock_conn.return_value.put.call_args.kwargs['hash_bin'] == '_content_hash'
+        assert result == {'written': 0, 'skipped': 1}
+
+
+class TestAerospikeBulkPutOperator(unittest.TestCase):
+    def setUp(self):
+        self.records = [('key1', {'bin1': 'value1'}, {'ttl': 1000}), ('key2', {'bin1': 'value2'})]
+        self.operator = AerospikeBulkPutOperator(
+            namespace='test_namespace',
+            set='test_set',
+            records=self.records,
+            chunk_size=100,
+            max_concurrency=2,
+            task_id='test_task'
+        )
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.get_conn')
+    def test_execute(self, mock_hock_conn):
+        mock_hock_conn.return_value = Mock()
+        mock_hock_conn.return_value.put_many.return_value = {'written': 2, 'failed': 0, 'errors': {}}
+        result = self.operator.execute({})
+
+        mock_hock_conn.return_value.put_many.assert_called_once_with(
+            records=self.records,
+            namespace='test_namespace',
+            set='test_set',
+            policy={'key': aerospike.POLICY_EXISTS_IGNORE},
+            batch_policy=None,
+            chunk_size=100,
+            max_concurrency=2,
+            skip_unchanged=False,
+            hash_bin='_content_hash',
+        )
+        assert result == {'written': 2, 'failed': 0, 'errors': {}}
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.get_conn')
+    def test_execute_skip_unchanged(self, mock_hock_conn):
+        mock_hock_conn.return_value = Mock()
+        mock_hock_conn.return_value.put_many.return_value = {'written': 1, 'failed': 0, 'errors': {}, 'skipped': 1}
+        self.operator.skip_unchanged = True
+        self.operator.hash_bin = 'h'
+        result = self.operator.execute({})
+
+        assert mock_hock_conn.return_value.put_many.call_args.kwargs['skip_unchanged'] is True
+        assert mock_hock_conn.return_value.put_many.call_args.kwargs['hash_bin'] == 'h'
+        assert result['skipped'] == 1
+
+
+class TestAerospikeOperateOperator(unittest.TestCase):
+    def setUp(self):
+        self.ops = [operations.increment('count', 1), operations.read('count')]
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.get_conn')
+    def test_execute_single_key(self, mock_hock_conn):
+        mock_hock_conn.return_value = Mock()
+        mock_hock_conn.return_value.operate.return_value = (('ns', 'set', 'key1'), {'gen': 2}, {'count': 2, 'raw': b'ab'})
+        operator = AerospikeOperateOperator(namespace='ns', set='set', key='key1', operations=self.ops, task_id='test_task')
+        result = operator.execute({})
+
+        mock_hock_conn.return_value.operate.assert_called_once_with(
+            namespace='ns', set='set', key='key1', ops=self.ops, metadata=None, policy=None
+        )
+        assert result == [{'namespace': 'ns', 'set': 'set', 'key': 'key1', 'metadata': {'gen': 2}, 'bins': {'count': 2, 'raw': 'YWI='}}]
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.get_conn')
+    def test_execute_many_keys(self, mock_hock_conn):
+        mock_hock_conn.return_value = Mock()
+        mock_hock_conn.return_value.operate_many.return_value = {
+            'records': [(('ns', 'set', 'key1'), {'gen': 1}, {'count': 1}), (('ns', 'set', 'key2'), None, None)],
+            'failed': 1,
+            'errors': {'13': 1},
+        }
+        operator = AerospikeOperateOperator(
+            namespace='ns', set='set', key=['key1', 'key2'], operations=self.ops, chunk_size=10, task_id='test_task'
+        )
+        with self.assertRaises(AirflowException):
+            operator.execute({})
+
+        mock_hock_conn.return_value.operate_many.assert_called_once_with(
+            namespace='ns',
+            set='set',
+            keys=['key1', 'key2'],
+            ops=self.ops,
+            metadata=None,
+            policy=None,
+            batch_policy=None,
+            chunk_size=10,
+            max_concurrency=4,
+        )
+
+        operator.fail_on_error = False
+        result = operator.execute({})
+        assert result[1] == {'namespace': 'ns', 'set': 'set', 'key': 'key2', 'metadata': None, 'bins': None}
+
+
+class TestAerospikeTouchOperator(unittest.TestCase):
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.get_conn')
+    def test_execute_with_keys(self, mock_hock_conn):
+        mock_hock_conn.return_value = Mock()
+        mock_hock_conn.return_value.touch_many.return_value = {'touched': 1, 'missing': 1, 'failed': 0, 'errors': {}}
+        operator = AerospikeTouchOperator(namespace='ns', set='set', ttl=100, keys=['key1', 'key2'], task_id='test_task')
+        result = operator.execute({})
+
+        mock_hock_conn.return_value.touch_many.assert_called_once_with(
+            namespace='ns',
+            set='set',
+            keys=['key1', 'key2'],
+            ttl=100,
+            policy=None,
+            batch_policy=None,
+            chunk_size=1000,
+            max_concurrency=4,
+        )
+        assert result == {'touched': 1, 'missing': 1, 'failed': 0, 'errors': {}}
+
+    def test_iter_keys_from_range(self):
+        operator = AerospikeTouchOperator(namespace='ns', set='set', ttl=100, key_range=[0, 6, 2], task_id='test_task')
+        assert list(operator.iter_keys()) == [0, 2, 4]
+
+        operator.key_template = 'user:{}'
+        assert list(operator.iter_keys()) == ['user:0', 'user:2', 'user:4']
+
+    def test_keys_or_key_range_required(self):
+        with self.assertRaises(ValueError):
+            AerospikeTouchOperator(namespace='ns', set='set', ttl=100, task_id='test_task')
+        with self.assertRaises(ValueError):
+            AerospikeTouchOperator(namespace='ns', set='set', ttl=100, keys=['key1'], key_range=[0, 1], task_id='test_task')
+
+
+class TestAerospikeDeleteOperator(unittest.TestCase):
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.get_conn')
+    def test_execute_with_keys(self, mock_hock_conn):
+        mock_hock_conn.return_value = Mock()
+        mock_hock_conn.return_value.remove_many.return_value = {'removed': 2, 'missing': 0, 'failed': 0, 'errors': {}}
+        operator = AerospikeDeleteOperator(namespace='ns', set='set', keys=['key1', 'key2'], chunk_size=10, task_id='test_task')
+        result = operator.execute({})
+
+        mock_hock_conn.return_value.remove_many.assert_called_once_with(
+            namespace='ns',
+            set='set',
+            keys=['key1', 'key2'],
+            policy=None,
+            batch_policy=None,
+            chunk_size=10,
+            max_concurrency=4,
+        )
+        assert result == {'removed': 2, 'missing': 0, 'failed': 0, 'errors': {}}
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.get_conn')
+    def test_execute_truncate(self, mock_hock_conn):
+        mock_hock_conn.return_value = Mock()
+        operator = AerospikeDeleteOperator(
+            namespace='ns', set='set', truncate=True, truncate_before='2024-01-01T00:00:00+00:00', task_id='test_task'
+        )
+        operator.execute({})
+
+        mock_hock_conn.return_value.truncate.assert_called_once_with(
+            namespace='ns', set='set', before='2024-01-01T00:00:00+00:00', policy=None
+        )
+        mock_hock_conn.return_value.remove_many.assert_not_called()
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            AerospikeDeleteOperator(namespace='ns', set='set', task_id='test_task')
+        with self.assertRaises(ValueError):
+            AerospikeDeleteOperator(namespace='ns', set='set', keys=['key1'], truncate=True, task_id='test_task')
+        with self.assertRaises(ValueError):
+            AerospikeDeleteOperator(namespace='ns', set='set', keys=['key1'], truncate_before=0, task_id='test_task')
+
+
+class TestAerospikeKeyShardOperator(unittest.TestCase):
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.get_conn')
+    def test_execute_by_partition(self, mock_hock_conn):
+        keys = [f'key{i}' for i in range(100)]
+        operator = AerospikeKeyShardOperator(namespace='ns', set='set', keys=keys, num_shards=4, task_id='test_task')
+        shards = operator.execute({})
+
+        mock_hock_conn.assert_not_called()
+        assert len(shards) == 4
+        assert sorted(key for shard in shards for key in shard) == sorted(keys)
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.shard_keys')
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.get_conn')
+    def test_execute_by_node(self, mock_hock_conn, mock_shard_keys):
+        mock_shard_keys.return_value = [['key1'], ['key2']]
+        operator = AerospikeKeyShardOperator(namespace='ns', set='set', keys=['key1', 'key2'], num_shards=2, by='node', task_id='test_task')
+
+        assert operator.execute({}) == [['key1'], ['key2']]
+        mock_hock_conn.assert_called_once()
+        mock_shard_keys.assert_called_once_with('ns', 'set', ['key1', 'key2'], 2, by='node')
+
+    def test_invalid_by(self):
+        with self.assertRaises(ValueError):
+            AerospikeKeyShardOperator(namespace='ns', set='set', keys=['key1'], num_shards=2, by='rack', task_id='test_task')
@@ -18,7 +18,10 @@
 
 import unittest
 from unittest.mock import patch, Mock
-from aerospike_provider.sensors.aerospike import AerospikeKeySensor
+from aerospike_provider.sensors.aerospike import AerospikeKeySensor, decode_indices, encode_indices
+from aerospike_provider.triggers.aerospike import AerospikeKeyTrigger
+from airflow.exceptions import AirflowException, AirflowSensorTimeout, AirflowSkipException, TaskDeferred
+from airflow.sensors.base import PokeReturnValue
 import aerospike
 
 class TestAerospikeKeySensor(unittest.TestCase):
@@ -86,3 +89,204 @@ class TestAerospikeKeySensor(unittest.TestCase):
         mock = {}
         with self.assertRaises(ValueError):
             self.sensor.parse_records(records=mock)
+
+
+class TestAerospikeKeySensorDeferrable(unittest.TestCase):
+    def setUp(self):
+        self.sensor = AerospikeKeySensor(
+            namespace='test_namespace',
+            set='test_set',
+            key=['key1', 'key2'],
+            policy={},
+            deferrable=True,
+            timeout=60,
+            task_id='test_task'
+        )
+
+    def test_execute_defers_when_keys_missing(self):
+        self.sensor.poke = Mock(return_value=False)
+        with self.assertRaises(TaskDeferred) as cm:
+            self.sensor.execute({})
+
+        assert isinstance(cm.exception.trigger, AerospikeKeyTrigger)
+        assert cm.exception.method_name == 'execute_complete'
+        assert cm.exception.trigger.key == ['key1', 'key2']
+
+    def test_execute_does_not_defer_when_keys_exist(self):
+        self.sensor.poke = Mock(return_value=True)
+        self.sensor.execute({})
+
+    def test_execute_complete(self):
+        self.sensor.execute_complete({}, {'status': 'success', 'message': 'All keys exist'})
+        with self.assertRaises(AirflowSensorTimeout):
+            self.sensor.execute_complete({}, {'status': 'timeout', 'message': 'timeout'})
+        with self.assertRaises(AirflowException):
+            self.sensor.execute_complete({}, {'status': 'error', 'message': 'boom'})
+        self.sensor.soft_fail = True
+        with self.assertRaises(AirflowSkipException):
+            self.sensor.execute_complete({}, {'status': 'timeout', 'message': 'timeout'})
+
+
+class TestAerospikeKeySensorIncremental(unittest.TestCase):
+    def setUp(self):
+        self.keys = ['key0', 'key1', 'key2']
+        self.sensor = AerospikeKeySensor(
+            namespace='test_namespace',
+            set='test_set',
+            key=self.keys,
+            policy={},
+            task_id='test_task'
+        )
+        self.context = {'ti': Mock(dag_id='dag', task_id='test_task', run_id='run', map_index=-1)}
+
+    @staticmethod
+    def exists(found):
+        return lambda namespace, set, key, policy: [((namespace, set, k), {'gen': 1} if k in found else None) for k in key]
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.get_conn')
+    def test_poke_only_checks_missing_keys(self, mock_hock_conn):
+        mock_hock_conn.return_value = Mock()
+        mock_hock_conn.return_value.exists.side_effect = self.exists({'key0', 'key2'})
+        assert self.sensor.poke(self.context) is False
+
+        mock_hock_conn.return_value.exists.side_effect = self.exists({'key1'})
+        assert self.sensor.poke(self.context) is True
+        assert mock_hock_conn.return_value.exists.call_args.kwargs['key'] == ['key1']
+
+    @patch('aerospike_provider.sensors.aerospike.Variable')
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.get_conn')
+    def test_poke_persists_state(self, mock_hock_conn, mock_variable):
+        self.sensor.persist_state = True
+        mock_variable.get.return_value = None
+        mock_hock_conn.return_value = Mock()
+        mock_hock_conn.return_value.exists.side_effect = self.exists({'key0', 'key2'})
+        assert self.sensor.poke(self.context) is False
+
+        name, state = mock_variable.set.call_args[0]
+        assert name == 'aerospike_key_sensor__dag__test_task__run__-1'
+        assert decode_indices(state['found']) == {0, 2}
+
+        # A rescheduled poke runs on a new sensor instance.
+        self.sensor._found_keys = None
+        mock_variable.get.return_value = state
+        mock_hock_conn.return_value.exists.side_effect = self.exists({'key1'})
+        assert self.sensor.poke(self.context) is True
+        assert mock_hock_conn.return_value.exists.call_args.kwargs['key'] == ['key1']
+        mock_variable.delete.assert_called_once_with(name)
+
+    @patch('aerospike_provider.sensors.aerospike.Variable')
+    def test_state_deleted_when_the_sensor_fails(self, mock_variable):
+        self.sensor.persist_state = True
+        self.sensor.poke = Mock(side_effect=OSError('node down'))
+        with self.assertRaises(OSError):
+            self.sensor.execute(self.context)
+
+        mock_variable.delete.assert_called_once_with('aerospike_key_sensor__dag__test_task__run__-1')
+
+    @patch('aerospike_provider.sensors.aerospike.Variable')
+    def test_state_kept_when_deferred_and_deleted_on_timeout(self, mock_variable):
+        self.sensor.persist_state = True
+        self.sensor.deferrable = True
+        self.sensor.poke = Mock(return_value=False)
+        with self.assertRaises(TaskDeferred):
+            self.sensor.execute(self.context)
+        mock_variable.delete.assert_not_called()
+
+        with self.assertRaises(AirflowSensorTimeout):
+            self.sensor.execute_complete(self.context, {'status': 'timeout', 'message': 'timeout'})
+        mock_variable.delete.assert_called_once_with('aerospike_key_sensor__dag__test_task__run__-1')
+
+    def test_encode_indices(self):
+        indices = {0, 7, 8, 4999}
+        assert decode_indices(encode_indices(indices, 5000)) == indices
+        assert decode_indices(encode_indices(set(), 5000)) == set()
+
+
+class TestAerospikeKeySensorThreshold(unittest.TestCase):
+    def setUp(self):
+        self.keys = [f'key{i}' for i in range(10)]
+        self.sensor = AerospikeKeySensor(
+            namespace='test_namespace',
+            set='test_set',
+            key=self.keys,
+            policy={},
+            min_fraction=0.5,
+            chunk_size=2,
+            task_id='test_task'
+        )
+
+    @staticmethod
+    def exists(found):
+        return lambda namespace, set, key, policy: [((namespace, set, k), {'gen': 1} if k in found else None) for k in key]
+
+    def test_required_count(self):
+        assert self.sensor.required_count == 5
+        self.sensor.min_count = 7
+        assert self.sensor.required_count == 7
+        self.sensor.min_count, self.sensor.min_fraction = 20, None
+        assert self.sensor.required_count == 10
+        self.sensor.min_count = None
+        assert self.sensor.required_count == 10
+
+    def test_invalid_min_fraction(self):
+        with self.assertRaises(ValueError):
+            AerospikeKeySensor(namespace='ns', set='set', key=self.keys, min_fraction=1.5, task_id='invalid')
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.get_conn')
+    def test_poke_stops_once_threshold_met(self, mock_hock_conn):
+        mock_hock_conn.return_value = Mock()
+        mock_hock_conn.return_value.exists.side_effect = self.exists(set(self.keys))
+        assert self.sensor.poke({}) is True
+
+        assert mock_hock_conn.return_value.exists.call_count == 3
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.get_conn')
+    def test_poke_pushes_every_found_key(self, mock_hock_conn):
+        mock_hock_conn.return_value = Mock()
+        mock_hock_conn.return_value.exists.side_effect = self.exists(set(self.keys))
+        self.sensor.push_found_keys = True
+        result = self.sensor.poke({})
+
+        assert isinstance(result, PokeReturnValue)
+        assert result.is_done
+        assert result.xcom_value == self.keys
+        assert mock_hock_conn.return_value.exists.call_count == 5
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.get_conn')
+    def test_poke_stops_once_threshold_unreachable(self, mock_hock_conn):
+        mock_hock_conn.return_value = Mock()
+        mock_hock_conn.return_value.exists.side_effect = self.exists({'key0'})
+        assert self.sensor.poke({}) is False
+
+        # 1 found after 4 chunks: the 2 keys left cannot reach 5.
+        assert mock_hock_conn.return_value.exists.call_count == 4
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.get_conn')
+    def test_execute_deferrable_passes_threshold(self, mock_hock_conn):
+        mock_hock_conn.return_value = Mock()
+        mock_hock_conn.return_value.exists.side_effect = self.exists(set())
+        self.sensor.deferrable = True
+        self.sensor.push_found_keys = True
+        with self.assertRaises(TaskDeferred) as cm:
+            self.sensor.execute({})
+
+        assert cm.exception.trigger.min_count == 5
+        assert cm.exception.trigger.return_found_keys is True
+        assert self.sensor.execute_complete({}, {'status': 'success', 'message': '', 'found_keys': ['key1']}) == ['key1']
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.get_conn')
+    def test_execute_deferrable_waits_for_the_missing_keys_only(self, mock_hock_conn):
+        mock_hock_conn.return_value = Mock()
+        mock_hock_conn.return_value.exists.side_effect = self.exists({'key1', 'key3', 'key4'})
+        self.sensor.deferrable = True
+        self.sensor.push_found_keys = True
+        with self.assertRaises(TaskDeferred) as cm:
+            self.sensor.execute({})
+
+        trigger = cm.exception.trigger
+        assert trigger.key == ['key0', 'key2', 'key5', 'key6', 'key7', 'key8', 'key9']
+        assert trigger.min_count == 2
+        assert cm.exception.kwargs == {'found_keys': ['key1', 'key3', 'key4']}
+
+        event = {'status': 'success', 'message': '', 'found_keys': ['key5', 'key0']}
+        assert self.sensor.execute_complete({}, event, **cm.exception.kwargs) == ['key0', 'key1', 'key3', 'key4', 'key5']
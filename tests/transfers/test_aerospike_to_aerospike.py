@@ -0,0 +1,173 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch, Mock
+
+from aerospike_provider.transfers.aerospike_to_aerospike import (
+    AerospikeToAerospikeOperator,
+    copy_partition_range,
+    iter_partition_range,
+)
+from airflow.exceptions import AirflowException
+
+
+def make_records(count, set='set'):
+    return [
+        (('ns', set, f'key{i}' if i % 2 == 0 else None, bytearray(b'digest%d' % i)), {'gen': 1, 'ttl': 0xFFFFFFFF if i == 0 else 100}, {'old': i, 'drop': 'x'})
+        for i in range(count)
+    ]
+
+
+class TestIterPartitionRange(unittest.TestCase):
+    def setUp(self):
+        self.hook = Mock()
+        self.records = make_records(10)
+        self.hook.foreach.side_effect = lambda callback, **kwargs: all(callback(record) for record in self.records)
+
+    def test_iter_partition_range(self):
+        assert list(iter_partition_range(self.hook, 'ns', 'set', 0, 128, buffer_size=3)) == self.records
+        assert self.hook.foreach.call_args.kwargs['partition_filter'] == {'begin': 0, 'count': 128}
+
+    def test_early_close_stops_the_scan(self):
+        records = iter_partition_range(self.hook, 'ns', 'set', 0, 128, buffer_size=1)
+        assert next(records) == self.records[0]
+        records.close()
+
+    def test_scan_error_is_raised(self):
+        self.hook.foreach.side_effect = OSError('node down')
+        with self.assertRaises(OSError):
+            list(iter_partition_range(self.hook, 'ns', 'set', 0, 128))
+
+
+class TestCopyPartitionRange(unittest.TestCase):
+    def setUp(self):
+        self.written = []
+        self.records = make_records(4)
+
+        def put_many(records, **kwargs):
+            self.written.extend(records)
+            return {'written': len(self.written), 'failed': 0, 'errors': {}}
+
+        self.hook = Mock()
+        self.hook.foreach.side_effect = lambda callback, **kwargs: [callback(record) for record in self.records]
+        self.hook.put_many.side_effect = put_many
+
+    def copy(self, **kwargs):
+        with patch('aerospike_provider.hooks.aerospike.AerospikeHook.get_conn', return_value=self.hook):
+            return copy_partition_range(
+                aerospike_conn_id='source',
+                namespace='ns',
+                set='set',
+                begin=0,
+                count=4096,
+                destination_conn_id='destination',
+                **kwargs,
+            )
+
+    def test_copy_to_other_cluster(self):
+        result = self.copy(destination_namespace='ns', destination_set='set', bin_mapping={'old': 'new', 'drop': None})
+
+        assert result == {'read': 4, 'skipped': 0, 'written': 4, 'failed': 0, 'errors': {}}
+        assert self.written == [
+            ('key0', {'new': 0}, {'ttl': -1}),
+            (('ns', 'set', None, bytearray(b'digest1')), {'new': 1}, {'ttl': 100}),
+            ('key2', {'new': 2}, {'ttl': 100}),
+            (('ns', 'set', None, bytearray(b'digest3')), {'new': 3}, {'ttl': 100}),
+        ]
+        assert self.hook.put_many.call_args.kwargs['set'] == 'set'
+
+    def test_copy_to_other_set_skips_records_without_user_key(self):
+        result = self.copy(destination_namespace='ns', destination_set='other', ttl=60)
+
+        assert result['read'] == 4
+        assert result['skipped'] == 2
+        assert self.written == [('key0', {'old': 0, 'drop': 'x'}, {'ttl': 60}), ('key2', {'old': 2, 'drop': 'x'}, {'ttl': 60})]
+        assert self.hook.put_many.call_args.kwargs['set'] == 'other'
+
+    def test_records_per_second(self):
+        started = time.monotonic()
+        self.copy(destination_namespace='ns', destination_set='set', records_per_second=100)
+
+        assert time.monotonic() - started >= 0.03
+
+
+class TestAerospikeToAerospikeOperator(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.operator = AerospikeToAerospikeOperator(
+            namespace='ns',
+            set='set',
+            destination_set='copy',
+            bin_mapping={'old': 'new'},
+            records_per_second=1000,
+            num_workers=2,
+            num_ranges=4,
+            task_id='test_task',
+        )
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.parallel_partition_scan')
+    def test_execute(self, mock_scan):
+        mock_scan.return_value = [
+            {'read': 2, 'skipped': 0, 'written': 2, 'failed': 0, 'errors': {}},
+            {'read': 3, 'skipped': 1, 'written': 1, 'failed': 1, 'errors': {'13': 1}},
+            {'read': 0, 'skipped': 0, 'written': 0, 'failed': 0, 'errors': {}},
+            {'read': 1, 'skipped': 0, 'written': 1, 'failed': 0, 'errors': {}},
+        ]
+        result = self.operator.execute({})
+
+        kwargs = mock_scan.call_args.kwargs
+        assert kwargs['worker'] is copy_partition_range
+        assert kwargs['num_workers'] == 2
+        assert kwargs['worker_kwargs']['destination_conn_id'] == 'aerospike_default'
+        assert kwargs['worker_kwargs']['destination_namespace'] == 'ns'
+        assert kwargs['worker_kwargs']['destination_set'] == 'copy'
+        assert kwargs['worker_kwargs']['records_per_second'] == 500
+        assert {name: result[name] for name in ('read', 'written', 'skipped', 'failed', 'errors')} == {
+            'read': 6, 'written': 4, 'skipped': 1, 'failed': 1, 'errors': {'13': 1}
+        }
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.parallel_partition_scan')
+    def test_execute_resumes_from_checkpoint(self, mock_scan):
+        self.operator.checkpoint_path = os.path.join(self.tmp_dir.name, 'checkpoint.json')
+        done = {'read': 1, 'skipped': 0, 'written': 1, 'failed': 0, 'errors': {}}
+
+        def first_try(ranges, on_result, **kwargs):
+            on_result(*ranges[0], done)
+            raise OSError('worker evicted')
+
+        mock_scan.side_effect = first_try
+        with self.assertRaises(OSError):
+            self.operator.execute({})
+
+        mock_scan.side_effect = None
+        mock_scan.return_value = [done, done, done]
+        result = self.operator.execute({})
+
+        assert mock_scan.call_args.kwargs['ranges'] == [(1024, 1024), (2048, 1024), (3072, 1024)]
+        assert result['written'] == 4
+        assert not os.path.exists(self.operator.checkpoint_path)
+
+    def test_same_source_and_destination(self):
+        operator = AerospikeToAerospikeOperator(namespace='ns', set='set', task_id='test_task')
+        with self.assertRaises(AirflowException):
+            operator.execute({})
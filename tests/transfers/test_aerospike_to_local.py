@@ -0,0 +1,127 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch, Mock
+
+from datetime import datetime
+
+from aerospike_helpers import expressions as exp
+from aerospike_provider.transfers.aerospike_to_local import AerospikeToLocalFilesystemOperator, export_partition_range, to_nanoseconds
+
+
+class TestAerospikeToLocalFilesystemOperator(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.operator = AerospikeToLocalFilesystemOperator(
+            namespace='test_namespace',
+            set='test_set',
+            output_dir=self.tmp_dir.name,
+            max_records_per_file=2,
+            bins=['bin'],
+            task_id='test_task'
+        )
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.get_conn')
+    def test_execute(self, mock_hock_conn):
+        mock_hock_conn.return_value = Mock()
+
+        def foreach(namespace, set, callback, bins, policy):
+            for i in range(3):
+                callback((('test_namespace', 'test_set', f'key{i}', bytearray(b'd')), {'gen': 1, 'ttl': 0}, {'bin': i}))
+
+        mock_hock_conn.return_value.foreach.side_effect = foreach
+        result = self.operator.execute({})
+
+        assert result['files'] == [
+            os.path.join(self.tmp_dir.name, 'test_set-00000.jsonl'),
+            os.path.join(self.tmp_dir.name, 'test_set-00001.jsonl'),
+        ]
+        assert result['row_count'] == 3
+        assert 'watermark' in result
+        assert mock_hock_conn.return_value.foreach.call_args.kwargs['bins'] == ['bin']
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.parallel_partition_scan')
+    def test_execute_parallel(self, mock_scan):
+        self.operator.num_workers = 4
+        self.operator.num_ranges = 3
+        mock_scan.return_value = [[{'path': 'a.jsonl', 'rows': 2}], [], [{'path': 'b.jsonl', 'rows': 1}]]
+        result = self.operator.execute({})
+
+        assert result['files'] == ['a.jsonl', 'b.jsonl']
+        assert result['row_count'] == 3
+        assert mock_scan.call_args.kwargs['worker'] is export_partition_range
+        assert mock_scan.call_args.kwargs['num_workers'] == 4
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.get_conn')
+    def test_export_partition_range(self, mock_hock_conn):
+        mock_hock_conn.return_value = Mock()
+        mock_hock_conn.return_value.foreach.side_effect = (
+            lambda callback, partition_filter, **kwargs: callback((('ns', 'set', 'key', bytearray(b'd')), {'gen': 1}, {'bin': 1}))
+        )
+        files = export_partition_range(
+            aerospike_conn_id='aerospike_default',
+            namespace='ns',
+            set='set',
+            begin=512,
+            count=512,
+            output_dir=self.tmp_dir.name,
+            file_prefix='set',
+            file_format='jsonl',
+            max_records_per_file=10,
+        )
+
+        assert files == [{'path': os.path.join(self.tmp_dir.name, 'set-p0512-00000.jsonl'), 'rows': 1}]
+        assert mock_hock_conn.return_value.foreach.call_args.kwargs['partition_filter'] == {'begin': 512, 'count': 512}
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.parallel_partition_scan')
+    def test_execute_resumes_from_checkpoint(self, mock_scan):
+        self.operator.num_ranges = 4
+        self.operator.checkpoint_path = os.path.join(self.tmp_dir.name, 'checkpoint.json')
+
+        def first_try(ranges, on_result, **kwargs):
+            on_result(*ranges[0], [{'path': 'a.jsonl', 'rows': 2}])
+            on_result(*ranges[1], [{'path': 'b.jsonl', 'rows': 3}])
+            raise OSError('worker evicted')
+
+        mock_scan.side_effect = first_try
+        with self.assertRaises(OSError):
+            self.operator.execute({})
+        with open(self.operator.checkpoint_path) as f:
+            first_watermark = json.load(f)['extra']['watermark']
+
+        mock_scan.side_effect = None
+        mock_scan.return_value = [[{'path': 'c.jsonl', 'rows': 1}], []]
+        result = self.operator.execute({})
+
+        assert mock_scan.call_args.kwargs['ranges'] == [(2048, 1024), (3072, 1024)]
+        assert result['files'] == ['a.jsonl', 'b.jsonl', 'c.jsonl']
+        assert result['row_count'] == 6
+        assert result['watermark'] == first_watermark
+        assert not os.path.exists(self.operator.checkpoint_path)
+
+    def test_modified_after_filter(self):
+        self.operator.modified_after = '2024-01-01T00:00:00+00:00'
+        policy = self.operator._scan_policy()
+
+        assert policy['expressions'] == exp.GT(exp.LastUpdateTime(), 1704067200 * 10**9).compile()
+        assert to_nanoseconds(1704067200) == to_nanoseconds(datetime(2024, 1, 1)) == 1704067200 * 10**9
@@ -0,0 +1,105 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch, Mock
+
+from aerospike_provider.transfers.local_to_aerospike import LocalFilesystemToAerospikeOperator
+
+
+class TestLocalFilesystemToAerospikeOperator(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = os.path.join(self.tmp_dir.name, 'rows.jsonl')
+        with open(self.path, 'w') as f:
+            f.write('{"id": "a", "name": "x", "ttl": 100}\n')
+            f.write('{"name": "no key"}\n')
+            f.write('not json\n')
+            f.write('{"id": "b", "ttl": "never"}\n')
+            f.write('{"id": "c", "name": "z", "extra": [1, 2]}\n')
+
+    def operator(self, **kwargs):
+        return LocalFilesystemToAerospikeOperator(
+            path=self.path, namespace='ns', set='set', key_column='id', ttl_column='ttl', task_id='test_task', **kwargs
+        )
+
+    def test_iter_records(self):
+        operator = self.operator(ttl=10)
+        records = list(operator.iter_records([
+            {'id': 'a', 'name': 'x', 'ttl': 100},
+            {'name': 'no key'},
+            {'id': 'b', 'name': 'y', 'ttl': 'never'},
+            {'id': 'c', 'name': 'z', 'empty': None},
+            {'id': 'd', 'name': None},
+        ]))
+
+        assert records == [('a', {'name': 'x'}, {'ttl': 100}), ('c', {'name': 'z'}, {'ttl': 10})]
+        assert operator.rejected == {"missing 'id' key column": 1, "invalid 'ttl' ttl column": 1, 'no bins': 1}
+
+    def test_iter_records_rejects_invalid_key_types(self):
+        operator = self.operator()
+        records = list(operator.iter_records([
+            {'id': 1.5, 'name': 'float'},
+            {'id': [1], 'name': 'list'},
+            {'id': {'a': 1}, 'name': 'map'},
+            {'id': True, 'name': 'bool'},
+            {'id': 2 ** 64, 'name': 'too large'},
+            {'id': 7, 'name': 'int'},
+            {'id': b'k', 'name': 'bytes'},
+        ]))
+
+        assert records == [(7, {'name': 'int'}, None), (b'k', {'name': 'bytes'}, None)]
+        assert operator.rejected == {"invalid 'id' key column type": 5}
+
+    def test_iter_records_renames_bins(self):
+        operator = self.operator(bin_columns={'name': 'n'})
+        assert list(operator.iter_records([{'id': 'a', 'name': 'x', 'other': 1}])) == [('a', {'n': 'x'}, None)]
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.get_conn')
+    def test_execute(self, mock_hock_conn):
+        mock_hock_conn.return_value = Mock()
+        written = []
+
+        def put_many(records, **kwargs):
+            written.extend(records)
+            return {'written': len(written) - 1, 'failed': 1, 'errors': {'21': 1}}
+
+        mock_hock_conn.return_value.put_many.side_effect = put_many
+        result = self.operator(chunk_size=10).execute({})
+
+        assert written == [('a', {'name': 'x'}, {'ttl': 100}), ('c', {'name': 'z', 'extra': [1, 2]}, None)]
+        assert mock_hock_conn.return_value.put_many.call_args.kwargs['chunk_size'] == 10
+        assert result['written'] == 1
+        assert result['failed'] == 1
+        assert result['rejected'] == 3
+        assert result['rejected_reasons'] == {"missing 'id' key column": 1, 'invalid JSON line': 1, 'no bins': 1}
+        assert result['errors'] == {'21': 1}
+        assert 'records_per_second' in result
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook.get_conn')
+    def test_execute_skip_unchanged(self, mock_hock_conn):
+        mock_hock_conn.return_value = Mock()
+        mock_hock_conn.return_value.put_many.return_value = {'written': 1, 'failed': 0, 'errors': {}, 'skipped': 1}
+        result = self.operator(skip_unchanged=True).execute({})
+
+        assert mock_hock_conn.return_value.put_many.call_args.kwargs['skip_unchanged'] is True
+        assert result['written'] == 1
+        assert result['skipped'] == 1
@@ -0,0 +1,103 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import asyncio
+import threading
+import unittest
+from unittest.mock import patch
+
+from aerospike_provider.triggers.aerospike import AerospikeKeyTrigger
+from aerospike_provider.utils.executor import get_async_executor
+
+
+class TestAerospikeKeyTrigger(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.trigger = AerospikeKeyTrigger(
+            namespace='test_namespace',
+            set='test_set',
+            key=['key1', 'key2'],
+            policy={},
+            poke_interval=0,
+            end_time=None,
+        )
+
+    def test_serialize(self):
+        classpath, kwargs = self.trigger.serialize()
+        assert classpath == 'aerospike_provider.triggers.aerospike.AerospikeKeyTrigger'
+        assert AerospikeKeyTrigger(**kwargs).serialize() == (classpath, kwargs)
+
+    async def _first_event(self):
+        events = [event async for event in self.trigger.run()]
+        assert len(events) == 1
+        return events[0]
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook')
+    async def test_run_success_after_missing_keys(self, mock_hook):
+        mock_hook.return_value.exists.side_effect = [
+            [(('ns', 'set', 'key1'), {'gen': 1}), (('ns', 'set', 'key2'), None)],
+            [(('ns', 'set', 'key2'), {'gen': 1})],
+        ]
+        event = await self._first_event()
+
+        assert event.payload['status'] == 'success'
+        assert mock_hook.return_value.exists.call_count == 2
+        assert mock_hook.return_value.exists.call_args.kwargs['key'] == ['key2']
+        mock_hook.return_value.__exit__.assert_called_once()
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook')
+    async def test_run_timeout(self, mock_hook):
+        self.trigger.end_time = 0
+        mock_hook.return_value.exists.return_value = [(('ns', 'set', 'key1'), None)]
+        event = await self._first_event()
+
+        assert event.payload['status'] == 'timeout'
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook')
+    async def test_run_error(self, mock_hook):
+        mock_hook.return_value.exists.side_effect = Exception('boom')
+        event = await self._first_event()
+
+        assert event.payload == {'status': 'error', 'message': 'boom'}
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook')
+    async def test_run_success_with_min_count(self, mock_hook):
+        self.trigger.min_count = 1
+        self.trigger.return_found_keys = True
+        mock_hook.return_value.exists.return_value = [(('ns', 'set', 'key1'), None), (('ns', 'set', 'key2'), {'gen': 1})]
+        event = await self._first_event()
+
+        assert event.payload['status'] == 'success'
+        assert event.payload['found_keys'] == ['key2']
+
+    @patch('aerospike_provider.hooks.aerospike.AerospikeHook')
+    async def test_waiting_triggers_share_the_executor_threads(self, mock_hook):
+        mock_hook.return_value.exists.side_effect = lambda key, **kwargs: [(('ns', 'set', k), None) for k in key]
+        threads_before = threading.active_count()
+        triggers = [
+            AerospikeKeyTrigger(namespace='ns', set='set', key=[f'key{i}'], policy={}, poke_interval=0.05, end_time=None)
+            for i in range(300)
+        ]
+        tasks = [asyncio.ensure_future(trigger.run().__anext__()) for trigger in triggers]
+        await asyncio.sleep(0.3)
+
+        # 300 waiting triggers use the shared executor threads, not one thread each.
+        assert mock_hook.return_value.exists.call_count >= 300
+        assert threading.active_count() <= threads_before + get_async_executor()._max_workers
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
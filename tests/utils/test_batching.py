@@ -0,0 +1,163 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, call, patch
+
+from aerospike_provider.utils.batching import chunked, hedged, imap_bounded, run_chunked
+
+
+class TestChunked(unittest.TestCase):
+    def test_chunked(self):
+        assert list(chunked(range(7), 3)) == [[0, 1, 2], [3, 4, 5], [6]]
+        assert list(chunked([], 3)) == []
+
+    def test_chunked_invalid_size(self):
+        with self.assertRaises(ValueError):
+            list(chunked([1], 0))
+
+
+class TestRunChunked(unittest.TestCase):
+    def test_results_keep_original_order(self):
+        result = run_chunked(lambda chunk: [i * 2 for i in chunk], list(range(100)), chunk_size=7, max_concurrency=4)
+        assert result == [i * 2 for i in range(100)]
+
+    def test_empty_items(self):
+        assert run_chunked(lambda chunk: chunk, [], chunk_size=7) == []
+
+    def test_only_failed_chunks_are_retried(self):
+        calls = []
+        lock = threading.Lock()
+        failed_once = set()
+
+        def func(chunk):
+            with lock:
+                calls.append(chunk[0])
+                if chunk[0] == 3 and 3 not in failed_once:
+                    failed_once.add(3)
+                    raise TimeoutError('timeout')
+            return chunk
+
+        result = run_chunked(func, list(range(9)), chunk_size=3, max_concurrency=3, chunk_retries=1)
+
+        assert result == list(range(9))
+        assert sorted(calls) == [0, 3, 3, 6]
+
+    def test_raises_when_retries_exhausted(self):
+        def func(chunk):
+            raise TimeoutError('timeout')
+
+        with self.assertRaises(TimeoutError):
+            run_chunked(func, list(range(9)), chunk_size=3, chunk_retries=2)
+
+
+    def test_retry_if_raises_other_errors_at_once(self):
+        calls = []
+
+        def func(chunk):
+            calls.append(chunk)
+            raise ValueError('bad')
+
+        with self.assertRaises(ValueError):
+            run_chunked(func, list(range(3)), chunk_size=3, chunk_retries=2, retry_if=lambda e: isinstance(e, TimeoutError))
+        assert len(calls) == 1
+
+    @patch('aerospike_provider.utils.batching.time.sleep')
+    def test_backoff_between_retries(self, mock_sleep):
+        attempts = []
+
+        def func(chunk):
+            attempts.append(chunk)
+            if len(attempts) < 3:
+                raise TimeoutError('timeout')
+            return chunk
+
+        with patch('aerospike_provider.utils.batching.backoff_delay', side_effect=[0.1, 0.2]) as mock_delay:
+            assert run_chunked(func, [1, 2], chunk_size=2, chunk_retries=2, backoff=0.1, max_backoff=1) == [1, 2]
+
+        assert mock_delay.call_args_list == [call(0, 0.1, 1), call(1, 0.1, 1)]
+        assert mock_sleep.call_args_list == [call(0.1), call(0.2)]
+
+
+class TestHedged(unittest.TestCase):
+    def setUp(self):
+        self.executor = ThreadPoolExecutor(max_workers=4)
+        self.addCleanup(self.executor.shutdown)
+        self.release = threading.Event()
+        self.addCleanup(self.release.set)
+
+    def slow(self, item):
+        self.release.wait(5)
+        return 'slow'
+
+    def test_fast_call_is_not_hedged(self):
+        hedge = Mock()
+        assert hedged(lambda item: 'primary', hedge, 1.0, self.executor)(1) == 'primary'
+        hedge.assert_not_called()
+
+    def test_slow_call_is_hedged(self):
+        started = time.monotonic()
+        assert hedged(self.slow, lambda item: 'hedge', 0.01, self.executor)(1) == 'hedge'
+        assert time.monotonic() - started < 1
+
+    def test_failed_hedge_waits_for_primary(self):
+        def hedge(item):
+            self.release.set()
+            raise TimeoutError('timeout')
+
+        assert hedged(self.slow, hedge, 0.01, self.executor)(1) == 'slow'
+
+    def test_both_failing_raises_primary_error(self):
+        def primary(item):
+            time.sleep(0.05)
+            raise TimeoutError('primary')
+
+        def hedge(item):
+            raise TimeoutError('hedge')
+
+        with self.assertRaisesRegex(TimeoutError, 'primary'):
+            hedged(primary, hedge, 0.01, self.executor)(1)
+
+
+class TestImapBounded(unittest.TestCase):
+    def test_consumes_chunks_lazily(self):
+        consumed = []
+        in_flight = []
+        max_seen = []
+        lock = threading.Lock()
+
+        def chunks():
+            for i in range(10):
+                consumed.append(i)
+                yield i
+
+        def func(chunk):
+            with lock:
+                in_flight.append(chunk)
+                max_seen.append(len(in_flight))
+            with lock:
+                in_flight.remove(chunk)
+            return chunk * 2
+
+        result = imap_bounded(func, chunks(), max_concurrency=3)
+        assert consumed == []
+        assert sorted(result) == [i * 2 for i in range(10)]
+        assert max(max_seen) <= 3
@@ -0,0 +1,55 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import os
+import tempfile
+import unittest
+
+from aerospike_provider.utils.checkpoint import PartitionCheckpoint
+
+
+class TestPartitionCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = os.path.join(self.tmp_dir.name, 'checkpoint.json')
+        self.fingerprint = {'namespace': 'ns', 'set': 'set', 'num_ranges': 4}
+
+    def test_persists_completed_ranges(self):
+        checkpoint = PartitionCheckpoint(self.path, self.fingerprint)
+        checkpoint.mark_done(0, 1024, ['a.jsonl'])
+        checkpoint.set_extra('watermark', '2024-01-01T00:00:00')
+
+        resumed = PartitionCheckpoint(self.path, self.fingerprint)
+        assert resumed.is_done(0, 1024)
+        assert not resumed.is_done(1024, 1024)
+        assert resumed.get(0, 1024) == ['a.jsonl']
+        assert resumed.get_extra('watermark') == '2024-01-01T00:00:00'
+
+    def test_ignores_checkpoint_of_another_scan(self):
+        PartitionCheckpoint(self.path, self.fingerprint).mark_done(0, 1024, [])
+
+        other = PartitionCheckpoint(self.path, {**self.fingerprint, 'num_ranges': 8})
+        assert not other.is_done(0, 1024)
+
+    def test_clear(self):
+        checkpoint = PartitionCheckpoint(self.path, self.fingerprint)
+        checkpoint.mark_done(0, 1024, [])
+        checkpoint.clear()
+
+        assert not os.path.exists(self.path)
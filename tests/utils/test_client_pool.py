@@ -0,0 +1,89 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from aerospike_provider.utils.client_pool import AerospikeClientPool, get_client_pool
+
+
+class TestAerospikeClientPool(unittest.TestCase):
+    def setUp(self):
+        self.config = {'hosts': [('localhost', 3000)]}
+        self.factory = MagicMock(side_effect=lambda config: MagicMock())
+        self.pool = AerospikeClientPool(idle_timeout=60, client_factory=self.factory)
+
+    def test_acquire_reuses_client(self):
+        first = self.pool.acquire('conn', self.config)
+        self.pool.release('conn', self.config)
+        second = self.pool.acquire('conn', self.config)
+
+        assert first is second
+        self.factory.assert_called_once_with(self.config)
+
+    def test_acquire_keyed_by_conn_id_and_config(self):
+        first = self.pool.acquire('conn', self.config)
+        second = self.pool.acquire('other_conn', self.config)
+        third = self.pool.acquire('conn', {'hosts': [('otherhost', 3000)]})
+
+        assert len({id(first), id(second), id(third)}) == 3
+        assert len(self.pool) == 3
+
+    def test_release_evicts_idle_clients(self):
+        pool = AerospikeClientPool(idle_timeout=0, client_factory=self.factory)
+        client = pool.acquire('conn', self.config)
+        pool.release('conn', self.config)
+
+        client.close.assert_called_once()
+        assert len(pool) == 0
+
+    def test_referenced_clients_are_not_evicted(self):
+        pool = AerospikeClientPool(idle_timeout=0, client_factory=self.factory)
+        client = pool.acquire('conn', self.config)
+        pool.acquire('conn', self.config)
+        pool.release('conn', self.config)
+
+        client.close.assert_not_called()
+        assert len(pool) == 1
+
+    def test_unhealthy_client_is_recreated(self):
+        first = self.pool.acquire('conn', self.config)
+        self.pool.release('conn', self.config)
+        first.is_connected.return_value = False
+        second = self.pool.acquire('conn', self.config)
+
+        assert first is not second
+        first.close.assert_called_once()
+
+    def test_clients_are_not_reused_after_fork(self):
+        first = self.pool.acquire('conn', self.config)
+        with patch('aerospike_provider.utils.client_pool.os.getpid', return_value=-1):
+            second = self.pool.acquire('conn', self.config)
+
+        assert first is not second
+        first.close.assert_not_called()
+
+    def test_clear(self):
+        client = self.pool.acquire('conn', self.config)
+        self.pool.clear()
+
+        client.close.assert_called_once()
+        assert len(self.pool) == 0
+
+    def test_get_client_pool_is_a_singleton(self):
+        assert get_client_pool() is get_client_pool()
@@ -0,0 +1,62 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import unittest
+
+from aerospike_helpers import expressions as exp
+
+from aerospike_provider.utils.content_hash import changed_expression, content_hash, skip_ratio
+
+
+class TestContentHash(unittest.TestCase):
+    def test_stable_and_order_independent(self):
+        bins = {'name': 'a', 'tags': {'x': 1, 'y': [1, 2.5]}, 'raw': bytearray(b'ab')}
+        reordered = {'raw': bytearray(b'ab'), 'tags': {'y': [1, 2.5], 'x': 1}, 'name': 'a'}
+
+        assert content_hash(bins) == content_hash(reordered)
+        assert -2 ** 63 <= content_hash(bins) < 2 ** 63
+
+    def test_ignores_the_hash_bin(self):
+        assert content_hash({'a': 1, '_content_hash': 5}) == content_hash({'a': 1})
+        assert content_hash({'a': 1, 'h': 5}, hash_bin='h') == content_hash({'a': 1}, hash_bin='h')
+
+    def test_changes_with_content(self):
+        assert content_hash({'a': 1}) != content_hash({'a': 2})
+        assert content_hash({'a': b'ab'}) != content_hash({'a': 'ab'})
+        assert content_hash({'a': '1'}) != content_hash({'a': 1})
+        assert content_hash({'a': True}) != content_hash({'a': 1})
+        assert content_hash({'a': [1, 2]}) != content_hash({'a': [[1], 2]})
+
+    def test_keeps_map_key_types(self):
+        assert content_hash({'m': {1: 'a'}}) != content_hash({'m': {'1': 'a'}})
+        assert content_hash({'m': {b'1': 'a'}}) != content_hash({'m': {'1': 'a'}})
+
+    def test_mixed_type_map_keys(self):
+        mixed = {'m': {1: 'a', 'b': 2, b'c': [3], 2.5: None}}
+        reordered = {'m': {2.5: None, b'c': [3], 'b': 2, 1: 'a'}}
+
+        assert content_hash(mixed) == content_hash(reordered)
+        assert content_hash(mixed) != content_hash({'m': {1: 'a', 'b': 2, b'c': [4], 2.5: None}})
+
+    def test_changed_expression(self):
+        expected = exp.Or(exp.Not(exp.BinExists('h')), exp.NE(exp.IntBin('h'), 42)).compile()
+        assert changed_expression(42, 'h') == expected
+
+    def test_skip_ratio(self):
+        assert skip_ratio(1, 3) == '75.0% skipped'
+        assert skip_ratio(0, 0) == 'nothing to write'
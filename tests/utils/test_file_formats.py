@@ -0,0 +1,244 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import csv
+import importlib.util
+import json
+import os
+import tempfile
+import unittest
+
+from aerospike_provider.utils.file_formats import (
+    RotatingFileWriter,
+    _ParquetWriter,
+    file_format_from_path,
+    iter_rows,
+    record_to_dict,
+    record_to_row,
+)
+
+
+def make_record(i):
+    return ('ns', 'set', f'key{i}', bytearray(b'\x01\x02')), {'gen': 1, 'ttl': 100}, {'name': f'name{i}', 'raw': bytearray(b'ab')}
+
+
+def make_heterogeneous_record(key, bins):
+    return ('ns', 'set', key, None), {'gen': 1, 'ttl': 100}, bins
+
+
+class TestRecordConversion(unittest.TestCase):
+    def test_record_to_dict(self):
+        assert record_to_dict(make_record(1)) == {
+            'namespace': 'ns',
+            'set': 'set',
+            'key': 'key1',
+            'digest': '0102',
+            'metadata': {'gen': 1, 'ttl': 100},
+            'bins': {'name': 'name1', 'raw': bytearray(b'ab')},
+        }
+
+    def test_record_to_row(self):
+        assert record_to_row(make_record(1)) == {
+            'key': 'key1', 'digest': '0102', 'gen': 1, 'ttl': 100, 'name': 'name1', 'raw': bytearray(b'ab')
+        }
+
+    def test_record_to_row_keeps_metadata_over_bins(self):
+        record = ('ns', 'set', 'key1', None), {'gen': 1, 'ttl': 100}, {'key': 'bin', 'ttl': 5, 'name': 'a'}
+
+        assert record_to_row(record) == {
+            'key': 'key1', 'digest': None, 'gen': 1, 'ttl': 100, 'name': 'a', '_extra': {'key': 'bin', 'ttl': 5}
+        }
+
+
+class TestRotatingFileWriter(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def write(self, file_format, count=5, max_records_per_file=2):
+        with RotatingFileWriter(self.tmp_dir.name, 'export', file_format, max_records_per_file) as writer:
+            for i in range(count):
+                writer.write(make_record(i))
+        return writer
+
+    def test_jsonl_rotation(self):
+        writer = self.write('jsonl')
+
+        assert [f['rows'] for f in writer.files] == [2, 2, 1]
+        assert writer.row_count == 5
+        assert writer.files[0]['path'].endswith('export-00000.jsonl')
+        with open(writer.files[2]['path']) as f:
+            row = json.loads(f.readline())
+        assert row['key'] == 'key4'
+        assert row['bins']['raw'] == 'YWI='
+
+    def test_csv(self):
+        writer = self.write('csv', max_records_per_file=10)
+
+        with open(writer.files[0]['path']) as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 5
+        assert rows[0] == {'key': 'key0', 'digest': '0102', 'gen': '1', 'ttl': '100', 'name': 'name0', 'raw': 'YWI=', '_extra': ''}
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'pyarrow is not installed')
+    def test_parquet(self):
+        import pyarrow.parquet as pq
+
+        writer = self.write('parquet', max_records_per_file=10)
+
+        table = pq.read_table(writer.files[0]['path'])
+        assert table.num_rows == 5
+        assert table.column('name').to_pylist() == [f'name{i}' for i in range(5)]
+
+    def test_csv_keeps_bins_missing_from_the_header(self):
+        with RotatingFileWriter(self.tmp_dir.name, 'export', 'csv') as writer:
+            writer.write(make_heterogeneous_record('key0', {'a': 1}))
+            writer.write(make_heterogeneous_record('key1', {'a': 2, 'b': [1], 'c': bytearray(b'ab')}))
+
+        with open(writer.files[0]['path']) as f:
+            rows = list(csv.DictReader(f))
+        assert [row['a'] for row in rows] == ['1', '2']
+        assert rows[0]['_extra'] == ''
+        assert json.loads(rows[1]['_extra']) == {'b': [1], 'c': 'YWI='}
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'pyarrow is not installed')
+    def test_parquet_keeps_heterogeneous_bins(self):
+        import pyarrow.parquet as pq
+
+        path = os.path.join(self.tmp_dir.name, 'export.parquet')
+        writer = _ParquetWriter(path, row_group_size=2)
+        writer.write(make_heterogeneous_record('key0', {'a': 1}))
+        writer.write(make_heterogeneous_record('key1', {'b': 'x'}))
+        writer.write(make_heterogeneous_record('key2', {'a': 3, 'c': 4.5}))
+        writer.close()
+
+        rows = pq.read_table(path).to_pylist()
+        assert [(row['a'], row['b']) for row in rows] == [(1, None), (None, 'x'), (3, None)]
+        assert [row['_extra'] for row in rows[:2]] == [None, None]
+        assert json.loads(rows[2]['_extra']) == {'c': 4.5}
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'pyarrow is not installed')
+    def test_parquet_type_drift_in_the_first_row_group(self):
+        import pyarrow.parquet as pq
+
+        path = os.path.join(self.tmp_dir.name, 'export.parquet')
+        writer = _ParquetWriter(path)
+        writer.write(make_heterogeneous_record('key0', {'a': 1, 'b': [1]}))
+        writer.write(make_heterogeneous_record('key1', {'a': 'x', 'b': bytearray(b'ab')}))
+        writer.close()
+
+        rows = pq.read_table(path).to_pylist()
+        assert [row['a'] for row in rows] == ['1', 'x']
+        assert [row['b'] for row in rows] == ['[1]', 'YWI=']
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'pyarrow is not installed')
+    def test_parquet_type_drift_across_row_groups(self):
+        import pyarrow.parquet as pq
+
+        path = os.path.join(self.tmp_dir.name, 'export.parquet')
+        writer = _ParquetWriter(path, row_group_size=2)
+        writer.write(make_heterogeneous_record('key0', {'a': 1, 'b': 'x'}))
+        writer.write(make_heterogeneous_record('key1', {'a': 2, 'b': 'y'}))
+        writer.write(make_heterogeneous_record('key2', {'a': 'three', 'b': 'z', 'c': 1}))
+        writer.write(make_heterogeneous_record('key3', {'a': 4, 'b': 'w'}))
+        writer.close()
+
+        rows = pq.read_table(path).to_pylist()
+        assert [row['a'] for row in rows] == [1, 2, None, 4]
+        assert [row['b'] for row in rows] == ['x', 'y', 'z', 'w']
+        assert json.loads(rows[2]['_extra']) == {'a': 'three', 'c': 1}
+        assert rows[3]['_extra'] is None
+
+    def test_bins_named_like_metadata_go_to_extra(self):
+        with RotatingFileWriter(self.tmp_dir.name, 'export', 'csv') as writer:
+            writer.write(make_heterogeneous_record('key0', {'a': 1, 'gen': 'bin', '_extra': 2}))
+
+        with open(writer.files[0]['path']) as f:
+            row = next(csv.DictReader(f))
+        assert (row['key'], row['gen'], row['a']) == ('key0', '1', '1')
+        assert json.loads(row['_extra']) == {'gen': 'bin', '_extra': 2}
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'pyarrow is not installed')
+    def test_parquet_bins_named_like_metadata_go_to_extra(self):
+        import pyarrow.parquet as pq
+
+        path = os.path.join(self.tmp_dir.name, 'export.parquet')
+        writer = _ParquetWriter(path, row_group_size=1)
+        writer.write(make_heterogeneous_record('key0', {'a': 1, 'ttl': 'bin'}))
+        writer.write(make_heterogeneous_record('key1', {'a': 2, 'digest': 'bin'}))
+        writer.close()
+
+        rows = pq.read_table(path).to_pylist()
+        assert [(row['ttl'], row['digest']) for row in rows] == [(100, None), (100, None)]
+        assert json.loads(rows[0]['_extra']) == {'ttl': 'bin'}
+        assert json.loads(rows[1]['_extra']) == {'digest': 'bin'}
+
+    def test_no_records_no_files(self):
+        assert self.write('jsonl', count=0).files == []
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError):
+            RotatingFileWriter(self.tmp_dir.name, 'export', 'xml')
+
+
+class TestIterRows(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def write_file(self, name, content):
+        path = os.path.join(self.tmp_dir.name, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def test_jsonl(self):
+        path = self.write_file('rows.jsonl', '{"key": "a", "n": 1}\n\nnot json\n[1]\n{"key": "b"}\n')
+        errors = []
+
+        rows = list(iter_rows(path, 'jsonl', on_error=lambda line, e: errors.append(line)))
+
+        assert rows == [{'key': 'a', 'n': 1}, {'key': 'b'}]
+        assert errors == [3, 4]
+
+    def test_jsonl_raises_without_on_error(self):
+        path = self.write_file('rows.jsonl', 'not json\n')
+        with self.assertRaises(ValueError):
+            list(iter_rows(path, 'jsonl'))
+
+    def test_csv(self):
+        path = self.write_file('rows.csv', 'key,name,n\na,x,1\nb,,2\n')
+        assert list(iter_rows(path, 'csv')) == [{'key': 'a', 'name': 'x', 'n': '1'}, {'key': 'b', 'name': None, 'n': '2'}]
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), 'pyarrow is not installed')
+    def test_parquet(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        path = os.path.join(self.tmp_dir.name, 'rows.parquet')
+        pq.write_table(pa.Table.from_pylist([{'key': f'k{i}', 'n': i} for i in range(5)]), path)
+
+        assert list(iter_rows(path, 'parquet', batch_size=2)) == [{'key': f'k{i}', 'n': i} for i in range(5)]
+
+    def test_file_format_from_path(self):
+        assert file_format_from_path('/data/rows.jsonl') == 'jsonl'
+        assert file_format_from_path('/data/rows.JSON') == 'jsonl'
+        assert file_format_from_path('rows.csv') == 'csv'
+        assert file_format_from_path('rows.parquet') == 'parquet'
+        with self.assertRaises(ValueError):
+            file_format_from_path('rows.xml')
@@ -0,0 +1,96 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import unittest
+from unittest.mock import MagicMock, call, patch
+
+from aerospike import exception as aerospike_exception
+
+from aerospike_provider.utils.metrics import HookMetrics, estimate_size
+
+
+class TestEstimateSize(unittest.TestCase):
+    def test_estimate_size(self):
+        assert estimate_size(None) == 0
+        assert estimate_size(b"abc") == 3
+        assert estimate_size({"bin": "value", "n": 1}) == 3 + 5 + 1 + 8
+        assert estimate_size({"list": [1, "ab"]}) == 4 + 8 + 2
+
+
+@patch('aerospike_provider.utils.metrics.Stats')
+class TestHookMetrics(unittest.TestCase):
+    tags = {'conn_id': 'conn', 'namespace': 'ns', 'set': 'set'}
+
+    def test_call_emits_metrics(self, mock_stats):
+        metrics = HookMetrics('conn', summary=True)
+
+        with metrics.call('get_record', 'ns', 'set') as call_metrics:
+            call_metrics.batch_size = 3
+            call_metrics.records = 0
+            call_metrics.add_record((('ns', 'set', 'k1'), {'gen': 1}, {'bin': 'abc'}))
+            call_metrics.add_record((('ns', 'set', 'k2'), None, None))
+            call_metrics.add_error(2)
+
+        mock_stats.timing.assert_called_once()
+        assert mock_stats.timing.call_args[0][0] == 'aerospike.hook.get_record.duration'
+        assert mock_stats.timing.call_args[1] == {'tags': self.tags}
+        mock_stats.gauge.assert_called_once_with('aerospike.hook.get_record.batch_size', 3, tags=self.tags)
+        mock_stats.incr.assert_has_calls([
+            call('aerospike.hook.get_record.records', 1, tags=self.tags),
+            call('aerospike.hook.get_record.bytes', 6, tags=self.tags),
+            call('aerospike.hook.get_record.errors', 1, tags={**self.tags, 'result_code': '2'}),
+        ])
+
+    def test_call_counts_raised_errors(self, mock_stats):
+        metrics = HookMetrics('conn', summary=False)
+
+        with self.assertRaises(aerospike_exception.TimeoutError):
+            with metrics.call('put', 'ns', 'set'):
+                raise aerospike_exception.TimeoutError(9, 'timeout')
+
+        mock_stats.incr.assert_called_once_with('aerospike.hook.put.errors', 1, tags={**self.tags, 'result_code': '9'})
+
+    def test_call_without_namespace(self, mock_stats):
+        with HookMetrics('conn', summary=False).call('get_conn'):
+            pass
+
+        assert mock_stats.timing.call_args[1] == {'tags': {'conn_id': 'conn'}}
+
+    def test_log_summary(self, mock_stats):
+        metrics = HookMetrics('conn', summary=True)
+        for _ in range(3):
+            with metrics.call('exists', 'ns', 'set') as call_metrics:
+                call_metrics.records = 2
+        log = MagicMock()
+
+        metrics.log_summary(log)
+        metrics.log_summary(log)
+
+        log.info.assert_called_once()
+        args = log.info.call_args[0]
+        assert args[1:4] == ('exists', 'conn', 3)
+        assert args[-3:] == (6, 0, 0)
+
+    def test_bytes_not_measured_without_stats_or_summary(self, mock_stats):
+        with patch('aerospike_provider.utils.metrics.stats_enabled', return_value=False):
+            metrics = HookMetrics('conn', summary=False)
+
+        with metrics.call('put', 'ns', 'set') as call_metrics:
+            call_metrics.add_bytes({'bin': 'value'})
+
+        assert call_metrics.bytes == 0
@@ -0,0 +1,107 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import base64
+import unittest
+
+import aerospike
+
+from aerospike_provider.utils.partitions import (
+    PARTITION_COUNT,
+    digest_partition_id,
+    key_partition_id,
+    parse_replicas,
+    partition_ranges,
+    shard_keys,
+)
+
+
+def make_bitmap(partition_ids):
+    bitmap = bytearray(PARTITION_COUNT // 8)
+    for p in partition_ids:
+        bitmap[p >> 3] |= 0x80 >> (p & 7)
+    return base64.b64encode(bytes(bitmap)).decode()
+
+
+class TestPartitionRanges(unittest.TestCase):
+    def test_cover_all_partitions(self):
+        ranges = partition_ranges(7)
+
+        assert len(ranges) == 7
+        assert ranges[0][0] == 0
+        assert sum(count for _, count in ranges) == PARTITION_COUNT
+        for (begin, count), (next_begin, _) in zip(ranges, ranges[1:]):
+            assert begin + count == next_begin
+        assert max(count for _, count in ranges) - min(count for _, count in ranges) <= 1
+
+    def test_sub_range(self):
+        assert partition_ranges(2, begin=100, count=5) == [(100, 3), (103, 2)]
+
+    def test_more_ranges_than_partitions(self):
+        assert partition_ranges(10, begin=0, count=3) == [(0, 1), (1, 1), (2, 1)]
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            partition_ranges(0)
+        with self.assertRaises(ValueError):
+            partition_ranges(1, begin=4000, count=100)
+
+
+class TestKeyPartitions(unittest.TestCase):
+    def test_key_partition_id(self):
+        digest = aerospike.calc_digest('test', 'demo', 'key1')
+        assert key_partition_id('test', 'demo', 'key1') == digest_partition_id(digest)
+        assert digest_partition_id(bytearray(b'\xff\xff' + bytes(18))) == 4095
+        assert digest_partition_id(bytearray(b'\x01\x02' + bytes(18))) == 0x201
+
+    def test_parse_replicas(self):
+        response = f"other:0,2,{make_bitmap([5])},{make_bitmap([])};test:0,2,{make_bitmap([0, 1, 9, 4095])},{make_bitmap([2])}"
+        assert parse_replicas(response, 'test') == [0, 1, 9, 4095]
+        assert parse_replicas(f"test:1,{make_bitmap([7])}", 'test') == [7]
+        assert parse_replicas(response, 'missing') == []
+
+
+class TestShardKeys(unittest.TestCase):
+    def setUp(self):
+        self.keys = [f'key{i}' for i in range(1000)]
+
+    def test_shard_by_partition(self):
+        shards = shard_keys('test', 'demo', self.keys, 4)
+
+        assert len(shards) == 4
+        assert sorted(key for shard in shards for key in shard) == sorted(self.keys)
+        assert all(200 <= len(shard) <= 300 for shard in shards)
+        # Shards cover disjoint, increasing partition ranges.
+        bounds = [(min(p), max(p)) for p in ([key_partition_id('test', 'demo', k) for k in shard] for shard in shards)]
+        for (_, high), (low, _) in zip(bounds, bounds[1:]):
+            assert high < low
+
+    def test_shard_by_node(self):
+        owners = {p: f'node{p % 3}' for p in range(PARTITION_COUNT)}
+        shards = shard_keys('test', 'demo', self.keys, 2, partition_owners=owners)
+
+        assert len(shards) == 2
+        assert sorted(key for shard in shards for key in shard) == sorted(self.keys)
+        for shard in shards:
+            nodes = {owners[key_partition_id('test', 'demo', k)] for k in shard}
+            assert len(nodes) <= 2
+        assert len(shard_keys('test', 'demo', self.keys, 5, partition_owners=owners)) == 3
+
+    def test_invalid_num_shards(self):
+        with self.assertRaises(ValueError):
+            shard_keys('test', 'demo', self.keys, 0)
@@ -0,0 +1,186 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import threading
+import unittest
+
+from aerospike_provider.utils.rate_limit import AdaptiveRateLimiter, TokenBucket, get_rate_limiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def test_unlimited(self):
+        bucket = TokenBucket(None, clock=self.clock, sleep=self.clock.sleep)
+        assert bucket.acquire(1000) == 0
+        assert self.clock.sleeps == []
+
+    def test_rate(self):
+        bucket = TokenBucket(10, burst=1, clock=self.clock, sleep=self.clock.sleep)
+        waited = sum(bucket.acquire() for _ in range(5))
+
+        assert round(waited, 6) == 0.4
+        assert round(self.clock.now, 6) == 0.4
+
+    def test_acquire_more_than_burst(self):
+        bucket = TokenBucket(100, burst=10, clock=self.clock, sleep=self.clock.sleep)
+        bucket.acquire(50)
+        bucket.acquire(10)
+
+        # The first call takes the full bucket and leaves 40 tokens of debt, the second waits for them.
+        assert round(self.clock.now, 6) == 0.5
+
+
+class TestAdaptiveRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+
+    def limiter(self, **kwargs):
+        return AdaptiveRateLimiter(clock=self.clock, sleep=self.clock.sleep, **kwargs)
+
+    def test_unlimited_until_overloaded(self):
+        limiter = self.limiter()
+        for _ in range(4):
+            with limiter.throttle(100):
+                self.clock.now += 0.1
+            limiter.on_success(100)
+
+        assert limiter.rate is None
+        assert limiter.concurrency is None
+        with limiter.throttle(100):
+            limiter.on_overload()
+
+        # 400 records in the last 0.4s, measured over at least a second.
+        assert limiter.rate == 200
+        assert limiter.concurrency == 1
+
+    def test_overloads_in_cooldown_decrease_once(self):
+        limiter = self.limiter(max_rate=1000, cooldown=1.0)
+        limiter.on_overload()
+        limiter.on_overload()
+        assert limiter.rate == 500
+        assert limiter.overloads == 2
+
+        self.clock.now += 1.0
+        limiter.on_overload()
+        assert limiter.rate == 250
+
+    def test_min_rate(self):
+        limiter = self.limiter(max_rate=15, min_rate=10)
+        limiter.on_overload()
+        assert limiter.rate == 10
+
+    def test_additive_increase_up_to_max_rate(self):
+        limiter = self.limiter(max_rate=1000, increase=0.1)
+        limiter.on_overload()
+        limiter.on_success(10)
+        assert limiter.rate == 600
+
+        for _ in range(10):
+            limiter.on_success(10)
+        assert limiter.rate == 1000
+
+    def test_recovery_lifts_the_limits(self):
+        limiter = self.limiter(increase=0.25, min_rate=1)
+        limiter.on_success(100)
+        with limiter.throttle(), limiter.throttle():
+            limiter.on_overload()
+        assert limiter.rate == 50
+        assert limiter.concurrency == 1
+
+        limiter.on_success(10)
+        assert limiter.rate == 75
+        # Back to the 2 calls in flight when the overload started.
+        assert limiter.concurrency is None
+
+        limiter.on_success(10)
+        assert limiter.rate is None
+
+    def test_concurrency_limit_blocks_calls(self):
+        limiter = self.limiter(max_rate=1000)
+        limiter.on_overload()
+        limiter.concurrency = 1
+        entered = threading.Event()
+
+        def second_call():
+            with limiter.throttle():
+                entered.set()
+
+        with limiter.throttle():
+            thread = threading.Thread(target=second_call)
+            thread.start()
+            assert not entered.wait(0.05)
+        assert entered.wait(1)
+        thread.join()
+
+    def test_wait_before_retry(self):
+        limiter = self.limiter(backoff=0.1)
+        limiter.wait_before_retry(0)
+        limiter.wait_before_retry(2)
+
+        assert self.clock.sleeps == [0.1, 0.4]
+        assert limiter.retries == 2
+
+    def test_stats(self):
+        limiter = self.limiter()
+        with limiter.throttle(100):
+            self.clock.now += 1
+        limiter.on_success(100)
+        before = limiter.stats()
+        assert before['records'] == 100
+        assert before['records_per_second'] == 100
+
+        with limiter.throttle(50):
+            self.clock.now += 1
+        limiter.on_success(50)
+        limiter.on_overload()
+        stats = limiter.stats(before)
+
+        assert stats['records'] == 50
+        assert stats['seconds'] == 1
+        assert stats['records_per_second'] == 50
+        assert stats['overloads'] == 1
+        assert stats['rate'] == 75
+        assert stats['concurrency'] == 1
+
+    def test_configure(self):
+        limiter = self.limiter()
+        limiter.configure(max_rate=100, max_retries=2)
+
+        assert limiter.rate == 100
+        assert limiter.max_retries == 2
+
+
+class TestGetRateLimiter(unittest.TestCase):
+    def test_one_limiter_per_connection(self):
+        assert get_rate_limiter('conn_a') is get_rate_limiter('conn_a')
+        assert get_rate_limiter('conn_a') is not get_rate_limiter('conn_b')
@@ -0,0 +1,44 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+
+import unittest
+from unittest.mock import patch
+
+from aerospike import exception as aerospike_exception
+
+from aerospike_provider.utils.retry import backoff_delay, is_transient
+
+
+class TestIsTransient(unittest.TestCase):
+    def test_is_transient(self):
+        assert is_transient(aerospike_exception.TimeoutError(9, 'timeout'))
+        assert is_transient(aerospike_exception.DeviceOverload(18, 'overload'))
+        assert is_transient(aerospike_exception.ConnectionError(-10, 'connection'))
+        assert not is_transient(aerospike_exception.RecordNotFound(2, 'not found'))
+        assert not is_transient(ValueError('bad'))
+
+
+class TestBackoffDelay(unittest.TestCase):
+    @patch('aerospike_provider.utils.retry.random.uniform', side_effect=lambda low, high: high)
+    def test_exponential_with_cap(self, mock_uniform):
+        assert [backoff_delay(attempt, 0.1, cap=0.5) for attempt in range(4)] == [0.1, 0.2, 0.4, 0.5]
+
+    def test_jitter(self):
+        delays = {backoff_delay(2, 1.0) for _ in range(20)}
+        assert all(0 <= delay <= 4 for delay in delays)
+        assert len(delays) > 1